@@ -87,6 +87,8 @@ setup(
         # Análisis geoespacial
         'geo': [
             'geopandas>=0.14.0',
+            'dask-geopandas>=0.4.0',
+            'pyogrio>=0.7.0',
         ],
         
         # ALL
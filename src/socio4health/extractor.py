@@ -5,7 +5,10 @@ It includes methods for downloading files, extracting data, and cleaning up afte
 """
 
 import json
+import copy
 import shutil
+import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from itertools import islice
 
 from pathlib import Path
@@ -16,16 +19,52 @@ import os
 import pandas as pd
 from socio4health.utils.deps import import_optional
 import pyreadstat
+import dask
 import dask.dataframe as dd
+from dask.dataframe.utils import clear_known_categories
 from tqdm import tqdm
-import glob
-from socio4health.utils.extractor_utils import compressed2files, download_request
+from socio4health.utils.extractor_utils import (
+    download_request, download_files, DEFAULT_CHUNK_SIZE,
+    ArchiveMember, list_archive_members, read_archive_member, member_blocks, read_member_block, LARGE_MEMBER_SIZE,
+    extract_archives, process_pool_context, read_sav_chunk,
+    list_excel_sheets, read_excel_chunk, count_geo_features, geo_feature_ids, read_geo_chunk,
+    read_geo_features, line_blocks, filter_rows,
+    TextDialect, read_head, sniff_text, normalize_filters, resolve_filters
+)
+import zipfile
+from socio4health.utils.download_cache import DownloadCache, DEFAULT_CACHE_SIZE
+from socio4health.utils.manifest import ExtractionManifest
+from socio4health.utils.json_reader import (
+    json_layout, read_json_block, is_ascii_compatible, DEFAULT_JSON_BLOCKSIZE
+)
+from socio4health.utils.fwf_reader import read_fwf_block, DEFAULT_FWF_BLOCKSIZE
+from socio4health.utils.csv_reader import (
+    csv_layout, csv_meta, read_csv_block, to_arrow_strings, DEFAULT_CSV_BLOCKSIZE
+)
+from socio4health.utils.parquet_cache import load_parquet_cache, write_parquet_cache, CACHE_SUFFIX
+from socio4health.utils.row_counts import has_rows, parquet_row_count
+from socio4health.utils.column_profile import compute_profiles, DEFAULT_TOP_K
+from socio4health.utils.schema_inference import infer_dtypes, apply_dtypes, DEFAULT_SAMPLE_ROWS
+import hashlib
 from importlib import import_module
 import logging
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+def _read_detached(reader, source):
+    """Read a source in a process worker and send back what the reader recorded besides the frames"""
+    frames, error = reader._read_source(source)
+    return frames, error, reader.value_labels, reader.manifest
+
+def _extraction_options_token(job):
+    """Fingerprint of what an archive extraction job extracts; files listed for other options are not reused"""
+    options = [os.path.realpath(job['target_directory']), sorted(ext.lower() for ext in job['down_ext']),
+               sorted(job['skip'])]
+    return hashlib.md5(json.dumps(options).encode()).hexdigest()
+
+
 def s4h_get_default_data_dir():
     """
     Returns the default data directory for storing downloaded files.
@@ -62,29 +101,169 @@ class Extractor:
     key_words : list
         A list of keywords to filter downloadable files during web scraping.
     encoding : str
-        The character encoding to use when reading files. Defaults to ``'latin1'``.
+        The character encoding to use when reading files. Defaults to ``'latin1'``. Delimited text files (``CSV``,
+        ``.txt``) starting with a UTF-8 byte order mark are read as ``'utf-8-sig'``, and those whose non-``ASCII``
+        bytes are valid UTF-8 as ``'utf-8'``. Only the first 64 KiB are examined, so UTF-8 files whose first
+        non-``ASCII`` character comes later must be given ``encoding='utf-8'``.
     is_fwf : bool
         Whether the files to be processed are fixed-width files (FWF). Defaults to ``False``.
     colnames : list
         Column names to use when reading fixed-width files. Required if is_fwf is ``True``.
     colspecs : list
         Column specifications for fixed-width files, defining the widths of each column. Required if ``is_fwf`` is ``True``.
+    fwf_engine : str
+        Engine used to read fixed-width files from disk: ``'dask'`` (``dask.dataframe.read_fwf``, every column typed as
+        ``ddtype``) or ``'numpy'``, which memory-maps the file and slices each column from all the lines of a block at
+        once, one Dask partition per ``fwf_blocksize`` bytes. Defaults to ``'dask'``.
+    fwf_dtypes : dict
+        With the ``'numpy'`` engine, data types of some fixed-width columns (e.g. ``{'V2009': 'Int64'}``), usually
+        built from the dictionary with ``s4h_fwf_dtypes``. Integer and float columns are parsed directly as numbers;
+        the other columns are read as text. Optional.
+    fwf_blocksize : int
+        With the ``'numpy'`` engine, approximate size in bytes of the block of lines read by each partition.
+        Defaults to 64 MiB.
     sep : str
-        The separator to use when reading ``CSV`` files. Defaults to ``,``.
+        The separator to use when reading ``CSV`` and ``.txt`` files. The delimiter, quote character, number of
+        lines before the header and encoding of each file are sniffed once from its first 64 KiB; ``sep`` is kept
+        when it appears there, otherwise the delimiter is detected among ``,``, ``;``, tab and ``|``. With
+        ``incremental``, the result is kept in the manifest. Defaults to ``None`` (detected, ``,`` for ``CSV`` and
+        tab for ``.txt`` files when nothing is found).
     ddtype : Union[str, Dict]
         The data type to use when reading files. Can be a single type or a dictionary mapping column names to types. Defaults to ``object``.
     dtype : Union[str, Dict]
         Data types to use when reading files with ``pandas``. Can be a string (e.g., ``'object'``) or a dictionary mapping column names to data types.
     engine : str
         The engine to use for reading Excel files (e.g., ``'openpyxl'`` or ``'xlrd'``). Leave as ``None`` to use the default engine based on file extension.
+    text_engine : str
+        Parser of the text readers (``CSV``, ``.txt`` and fixed-width files, also inside archives): ``'c'`` for the
+        ``pandas`` C parser through Dask, or ``'pyarrow'`` for the multithreaded ``pyarrow`` CSV parser, one Dask
+        partition per block of lines. With ``'pyarrow'``, text columns are ``string[pyarrow]`` instead of Python
+        objects (fixed-width columns are converted after parsing) and codes keep their leading zeros; the
+        ``Harmonizer`` keeps them as ``string[pyarrow]``. Defaults to ``'c'``.
     sheet_name : Union[str, int, list, None]
-        The name or index of the Excel sheet to read. Can also be a list to read multiple sheets or ``None`` to read all sheets. Defaults to the first sheet (``0``).
+        The name or index of the Excel sheet to read. Can also be a list to read multiple sheets or ``None`` to read all sheets. Defaults to ``None``.
+        Each sheet becomes its own Dask DataFrame, tagged with a ``sheet`` column.
     geodriver : str
-        The driver to use for reading geospatial files with ``geopandas.read_file()`` (e.g., ``'ESRI Shapefile'``, ``'KML'``, etc.). Optional.
+        Deprecated and ignored: geospatial files are read with ``pyogrio``, which detects the driver (``'ESRI Shapefile'``,
+        ``'KML'``...) from the file. Setting it emits a ``DeprecationWarning``.
     delete_zip_after : bool
         If True, delete zip/compressed files after extraction. Defaults to False.
     on_bad_lines : str
         How to handle bad lines when reading ``CSV`` files. Options are 'error', 'warn', or 'skip'. Defaults to 'warn'.
+    download_workers : int
+        Maximum number of files downloaded concurrently in online mode. Defaults to ``4``.
+    max_per_host : int
+        Maximum number of simultaneous connections to the same host in online mode. Defaults to ``2``.
+    chunk_size : int
+        Size in bytes of the chunks streamed to disk while downloading. Defaults to 1 MiB.
+    checksums : dict
+        Mapping of file names to the expected checksum of the downloaded file, given as ``'algorithm:hexdigest'``
+        (e.g. ``'sha256:...'``). Files that do not match are discarded. Optional.
+    use_cache : bool
+        If True, downloads are kept in a persistent cache under the default data directory and revalidated with
+        ``If-None-Match``/``If-Modified-Since`` on later runs, so unchanged files are not transferred again. Defaults to False.
+    cache_max_size : int
+        Maximum size in bytes of the download cache; least recently used files are evicted beyond it. Defaults to 20 GiB.
+    read_from_archive : bool
+        If True, ``.csv``/``.txt`` members of zip archives (and every matching member when ``is_fwf`` is ``True``) are
+        read in place: each Dask partition opens the member stream inside the archive, so nothing is extracted to
+        disk. Members stored without compression are split into blocks of whole lines; compressed members can only be
+        streamed from their start, so each one is a single partition (a warning is logged above 1 GiB). Other members
+        are still extracted. Archives read this way are never deleted by ``delete_zip_after``. Defaults to False.
+    extract_workers : int
+        Number of processes used to decompress archives in parallel. ``None`` uses one process per CPU core.
+        Defaults to ``1`` (archives are extracted one after another in the current process).
+    read_workers : int
+        Number of files set up in parallel (readers opened, schemas, row counts and sampled types computed), which
+        matters for formats whose metadata is read eagerly (``.sav``, Excel, JSON, geospatial) and for row counts.
+        ``None`` uses one worker per CPU core. The extracted DataFrames keep the order of the input files. Defaults
+        to ``1`` (files are read one after another).
+    read_executor : str
+        Pool used when ``read_workers`` is above one: ``'thread'``, or ``'process'`` for readers that hold the GIL.
+        Process workers return their DataFrames, ``.sav`` value labels and manifest entries to the main process.
+        Defaults to ``'thread'``.
+    incremental : bool
+        If True, a manifest (``.s4h_manifest.json``) is kept in ``output_path`` with the size, modification time and
+        hash of every processed file, the files extracted from each archive and the schema and row count of each file
+        read. On later runs unchanged archives are not extracted again and unchanged files are not counted again.
+        Defaults to False.
+    parquet_cache : bool
+        If True, every file read from disk (except Parquet files and Excel workbooks, whose sheets are read as
+        separate frames) is written once as partitioned Parquet (GeoParquet for geospatial files) in a
+        ``<file>.s4h.parquet`` folder next to it, and later extractions read that copy instead of parsing the source
+        again. The copy is discarded when the source size or modification time changes or when the reading options
+        (``colspecs``, ``encoding``, ``dtype``...) differ. Defaults to False.
+    sav_chunksize : int
+        Number of rows per partition when reading SPSS ``.sav`` files. Defaults to ``100000``.
+    excel_chunksize : int
+        Number of rows per partition when reading Excel sheets. ``.xlsx``/``.xlsm`` workbooks are streamed with
+        ``openpyxl`` in read-only mode, so each partition only holds its own rows. ``.xls`` workbooks and other engines
+        load whole sheets, so each of their sheets is read once, as a single partition. Defaults to ``50000``.
+    json_record_path : Union[str, list]
+        Keys leading to the array of records inside ``.json`` documents, as a list or joined with dots (e.g.
+        ``'result.records'``). Defaults to ``None`` (the document itself is the array of records).
+    json_blocksize : int
+        Approximate size in bytes of the blocks parsed by each Dask partition of a ``.json``, ``.jsonl`` or ``.ndjson``
+        file. Line-delimited files are cut at line breaks; record arrays are scanned once, with bounded memory, to
+        find the record boundaries. Defaults to 64 MiB.
+    geo_chunksize : int
+        Number of features per partition when reading geospatial files (``.shp``, ``.geojson``, ``.kml``), which are
+        returned as ``dask_geopandas.GeoDataFrame``. Defaults to ``100000``.
+    geo_bbox : tuple
+        ``(xmin, ymin, xmax, ymax)`` bounding box, in the coordinates of each file, that geospatial features must
+        intersect. Applied by the reader, so other features are never loaded. Optional.
+    geo_where : str
+        ``SQL`` ``WHERE`` clause on the attributes of geospatial features (e.g. ``"SIGLA_UF = 'SP'"``), applied by the
+        reader. Optional.
+    usecols : list
+        Columns to read from every file, compared case-insensitively; the others are never parsed. It is passed to
+        the readers as ``usecols`` for ``CSV``/text and ``.sav`` files, ``columns`` for Parquet, JSON and geospatial
+        files, and as the subset of ``colspecs`` for fixed-width files. Files without any of these columns are
+        skipped. ``harmonizer_utils.s4h_select_columns`` builds it from a dictionary and categories, matching
+        ``Harmonizer.s4h_data_selector``. Defaults to ``None`` (all columns).
+    filters : list
+        Row filters applied to every partition while it is read, as ``(column, op, value)`` tuples that must all
+        hold, or a list of such lists of which one must hold (e.g. ``[('DPTO', 'in', ['05', '11'])]``, the
+        read-time equivalent of the ``key_col``/``key_val`` selection of the ``Harmonizer``). Operators are ``==``,
+        ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and ``not in``; columns are compared case-insensitively and
+        values must match the type the column is read with (``ddtype``). Parquet files also skip the row groups
+        whose statistics exclude every match. Files lacking a filter column are kept whole, with a warning.
+        Defaults to ``None`` (all rows).
+    optimize_dtypes : bool
+        If True, compact data types are inferred from a sample of every file and applied to all its partitions:
+        numeric text becomes ``Int64`` or ``float64``, repetitive text becomes ``category`` and other text
+        ``string[pyarrow]``. Codes written with leading zeros (e.g. ``'05'``) stay text. Values outside the sample
+        that are not numbers of the inferred type become missing, with a warning, when the frame is computed. With
+        ``incremental``, the inferred types are kept in the manifest and reused. Defaults to ``False``.
+    dtype_sample_rows : int
+        Number of rows, taken from up to four evenly spaced partitions, used to infer the data types when
+        ``optimize_dtypes`` is True. Defaults to ``10000``.
+    profile_columns : bool
+        If True, the columns of every extracted DataFrame are profiled after reading, all files in one ``compute``:
+        missing values, approximate distinct values, most frequent values and numeric ranges (see
+        ``column_profile.compute_profiles``). The profiles are kept in ``profiles`` for the ``Harmonizer`` and, with
+        ``incremental``, in the manifest, so unchanged files are not profiled again. Defaults to ``False``.
+    profiles : dict
+        Set while reading with ``profile_columns``. Maps the name of each extracted Dask DataFrame (its ``_name``) to
+        its column profile; pass it to ``Harmonizer(profiles=...)``.
+    value_labels : dict
+        Set while reading ``.sav`` files. Maps each file name to its ``pyreadstat`` variable value labels
+        (``{column: {value: label}}``), for use during harmonization.
+    count_rows : str
+        How files are checked for rows before being kept: ``'probe'`` reads partitions in order until one has rows
+        (only empty files are read completely) and takes the row count of Parquet files from their metadata;
+        ``'exact'`` counts every row, which parses each file once more; ``'deferred'`` checks nothing, keeping empty
+        files. Defaults to ``'probe'``.
+    row_counts : list
+        Set while reading. Row count of each extracted DataFrame, in the same order: an integer when it is known
+        (metadata, ``'exact'`` counting or the manifest) and a lazy Dask scalar otherwise, which
+        ``row_counts.compute_with_row_counts`` resolves in the same ``compute`` as the frames.
+    errors : dict
+        Set while reading. Maps every input file (or ``<archive>::<member>``) that could not be read to its error
+        message; these files are skipped.
+    inventory : dict
+        Set by local mode extraction. Holds the ``'archives'`` and ``'files'`` found in ``input_path`` and, under
+        ``'extracted'``, the files obtained from each archive.
 
     Important
     ------
@@ -115,10 +294,39 @@ class Extractor:
             ddtype: Union[str, Dict] = 'object',
             dtype: str = None,
             engine: str = None,
+            text_engine: str = 'c',
             sheet_name: str = None,
             geodriver: str = None,
             delete_zip_after: bool = False,
-            on_bad_lines: str = 'warn'
+            on_bad_lines: str = 'warn',
+            download_workers: int = 4,
+            max_per_host: int = 2,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            checksums: Dict[str, str] = None,
+            use_cache: bool = False,
+            cache_max_size: int = DEFAULT_CACHE_SIZE,
+            read_from_archive: bool = False,
+            extract_workers: Optional[int] = 1,
+            read_workers: Optional[int] = 1,
+            read_executor: str = 'thread',
+            count_rows: str = 'probe',
+            incremental: bool = False,
+            parquet_cache: bool = False,
+            sav_chunksize: int = 100_000,
+            excel_chunksize: int = 50_000,
+            json_record_path: Union[str, list] = None,
+            json_blocksize: int = DEFAULT_JSON_BLOCKSIZE,
+            geo_chunksize: int = 100_000,
+            geo_bbox: tuple = None,
+            geo_where: str = None,
+            fwf_engine: str = 'dask',
+            fwf_dtypes: Dict[str, str] = None,
+            fwf_blocksize: int = DEFAULT_FWF_BLOCKSIZE,
+            usecols: list = None,
+            filters: list = None,
+            optimize_dtypes: bool = False,
+            dtype_sample_rows: int = DEFAULT_SAMPLE_ROWS,
+            profile_columns: bool = False
         ):
         self.compressed_ext = ['.zip', '.7z', '.tar', '.gz', '.tgz']
         self.depth = depth
@@ -127,6 +335,7 @@ class Extractor:
         self.input_path = input_path
         self.mode = -1
         self.dataframes = []
+        self.inventory = {}
         self.encoding = encoding
         self.is_fwf = is_fwf
         self.colnames = colnames
@@ -141,6 +350,8 @@ class Extractor:
             '.xlsx': self._read_excel,
             '.xlsm': self._read_excel,
             '.json': self._read_json,
+            '.jsonl': self._read_json,
+            '.ndjson': self._read_json,
             '.geojson': self._read_geospatial,
             '.shp': self._read_geospatial,
             '.kml': self._read_geospatial,
@@ -150,14 +361,76 @@ class Extractor:
         self.ddtype = ddtype
         self.dtype = dtype
         self.engine = engine
+        self.text_engine = text_engine
         self.sheet_name = sheet_name
+        if geodriver is not None:
+            warnings.warn("geodriver is deprecated and ignored: pyogrio detects the driver from each file",
+                          DeprecationWarning, stacklevel=2)
         self.geodriver = geodriver
         self.delete_zip_after = delete_zip_after
         self.on_bad_lines = on_bad_lines
+        self.download_workers = download_workers
+        self.max_per_host = max_per_host
+        self.chunk_size = chunk_size
+        self.checksums = checksums or {}
+        self.download_cache = DownloadCache(
+            os.path.join(s4h_get_default_data_dir(), 'download_cache'),
+            max_size=cache_max_size
+        ) if use_cache else None
+        self.read_from_archive = read_from_archive
+        self.extract_workers = extract_workers if extract_workers is not None else os.cpu_count()
+        self.read_workers = read_workers if read_workers is not None else os.cpu_count()
+        self.read_executor = read_executor
+        self.manifest = ExtractionManifest(self.output_path) if incremental else None
+        self.parquet_cache = parquet_cache
+        self.sav_chunksize = sav_chunksize
+        self.excel_chunksize = excel_chunksize
+        self.json_record_path = json_record_path
+        self.json_blocksize = json_blocksize
+        self.geo_chunksize = geo_chunksize
+        self.geo_bbox = tuple(geo_bbox) if geo_bbox is not None else None
+        self.geo_where = geo_where
+        self.fwf_engine = fwf_engine
+        self.fwf_dtypes = fwf_dtypes or {}
+        self.fwf_blocksize = fwf_blocksize
+        self.usecols = list(usecols) if usecols is not None else None
+        self.filters = normalize_filters(filters)
+        self.optimize_dtypes = optimize_dtypes
+        self.dtype_sample_rows = dtype_sample_rows
+        self.profile_columns = profile_columns
+        self.profiles = {}
+        self.value_labels = {}
+        self.errors = {}
+        self.row_counts = []
+        self.count_rows = count_rows
         if not input_path:
             raise ValueError("input_path must be provided")
         if is_fwf and (not colnames or not colspecs):
             raise ValueError("colnames and colspecs required for fixed-width files")
+        if download_workers < 1 or max_per_host < 1:
+            raise ValueError("download_workers and max_per_host must be positive integers")
+        if sav_chunksize < 1 or excel_chunksize < 1:
+            raise ValueError("sav_chunksize and excel_chunksize must be positive integers")
+        if json_blocksize < 1:
+            raise ValueError("json_blocksize must be a positive number of bytes")
+        if geo_chunksize < 1:
+            raise ValueError("geo_chunksize must be a positive integer")
+        if text_engine not in ('c', 'pyarrow'):
+            raise ValueError("text_engine must be 'c' or 'pyarrow'")
+        if fwf_engine not in ('dask', 'numpy'):
+            raise ValueError("fwf_engine must be 'dask' or 'numpy'")
+        if fwf_blocksize < 1:
+            raise ValueError("fwf_blocksize must be a positive number of bytes")
+        if dtype_sample_rows < 1:
+            raise ValueError("dtype_sample_rows must be a positive integer")
+        if self.extract_workers < 1:
+            raise ValueError("extract_workers must be a positive integer or None")
+        if self.read_workers < 1:
+            raise ValueError("read_workers must be a positive integer or None")
+        if read_executor not in ('thread', 'process'):
+            raise ValueError("read_executor must be 'thread' or 'process'")
+        if count_rows not in ('exact', 'probe', 'deferred'):
+            raise ValueError("count_rows must be 'exact', 'probe' or 'deferred'")
 
     def s4h_extract(self):
         """
@@ -191,6 +464,9 @@ class Extractor:
         except Exception as e:
             logging.error(f"Exception while extracting data: {e}")
             raise ValueError(f"Extraction failed: {str(e)}")
+        finally:
+            if self.manifest is not None:
+                self.manifest.save()
 
         if not self.dataframes:
             logging.warning("No data was extracted. The extraction process returned an empty result.")
@@ -219,18 +495,19 @@ class Extractor:
                     filepath = download_request(
                         self.input_path,
                         filename,
-                        self.output_path
+                        self.output_path,
+                        progress=pbar,
+                        chunk_size=self.chunk_size,
+                        checksum=self.checksums.get(filename),
+                        cache=self.download_cache
                     )
+                if filepath is None:
+                    raise ValueError("download returned no file")
 
                 # Process the downloaded file(s) using local mode logic
                 files_to_process = []
                 if any(filepath.endswith(ext) for ext in self.compressed_ext):
-                    extracted_files = compressed2files(
-                        input_archive=filepath,
-                        target_directory=self.output_path,
-                        down_ext=self.down_ext
-                    )
-                    files_to_process.extend(extracted_files)
+                    files_to_process.extend(self._expand_archive(filepath, self.output_path))
                 else:
                     files_to_process.append(filepath)
 
@@ -273,20 +550,19 @@ class Extractor:
                     logging.warning("Invalid input, proceeding with first 30 files")
                     links = dict(islice(links.items(), 30))
 
-        # Step 3: Download files with progress tracking
-        downloaded_files = []
-        failed_downloads = []
-
+        # Step 3: Download files concurrently with aggregate progress tracking
         os.makedirs(self.output_path, exist_ok=True)
         logging.info(f"Downloading files to: {self.output_path}")
 
-        for filename, url in tqdm(links.items(), desc="Downloading files"):
-            try:
-                filepath = download_request(url, filename, self.output_path)
-                downloaded_files.append(filepath)
-            except Exception as e:
-                logging.warning(f"Failed to download {filename}: {e}")
-                failed_downloads.append((filename, str(e)))
+        downloaded_files, failed_downloads = download_files(
+            links,
+            self.output_path,
+            max_workers=self.download_workers,
+            max_per_host=self.max_per_host,
+            chunk_size=self.chunk_size,
+            checksums=self.checksums,
+            cache=self.download_cache
+        )
 
         if not downloaded_files:
             logging.warning("No files were successfully downloaded. Returning empty extraction.")
@@ -313,20 +589,18 @@ class Extractor:
         files_to_process = []
         zip_to_delete = []
 
-        # Classify and extract compressed files
+        # Extract all compressed files at once so they can be decompressed in parallel
+        archives = []
         for filepath in downloaded_files:
             if any(filepath.endswith(ext) for ext in self.compressed_ext):
                 base_name = os.path.splitext(os.path.basename(filepath))[0]
-                target_dir = os.path.join(self.output_path, base_name)
-                os.makedirs(target_dir, exist_ok=True)
-
-                extracted = compressed2files(
-                    input_archive=filepath,
-                    target_directory=target_dir,
-                    down_ext=self.down_ext
-                )
-                files_to_process.extend(extracted)
-                if self.delete_zip_after:
+                archives.append((filepath, os.path.join(self.output_path, base_name)))
+        expanded = dict(zip([filepath for filepath, _ in archives], self._expand_archives(archives)))
+
+        for filepath in downloaded_files:
+            if filepath in expanded:
+                files_to_process.extend(expanded[filepath])
+                if self.delete_zip_after and not any(isinstance(f, ArchiveMember) for f in expanded[filepath]):
                     zip_to_delete.append(filepath)
             else:
                 files_to_process.append(filepath)
@@ -343,55 +617,222 @@ class Extractor:
                 except Exception as e:
                     logging.warning(f"Could not delete zip file {zip_path}: {e}")
 
+    def _expand_archive(self, filepath, target_dir):
+        """Extract a single archive (see :meth:`_expand_archives`)"""
+        return self._expand_archives([(filepath, target_dir)])[0]
+
+    def _expand_archives(self, archives):
+        """
+        Extract ``(archive, target_dir)`` pairs, using ``extract_workers`` processes, and return one list of files per
+        archive, in input order. With ``read_from_archive`` the members read in place are listed instead of extracted.
+        """
+        jobs = []
+        in_place = []
+        reused = {}
+        options = {}
+        for index, (filepath, target_dir) in enumerate(archives):
+            os.makedirs(target_dir, exist_ok=True)
+            members = []
+            if self.read_from_archive and zipfile.is_zipfile(filepath):
+                streamable = [ext for ext in self.down_ext if ext not in self.compressed_ext]
+                if not self.is_fwf:
+                    streamable = [ext for ext in streamable if ext.lower() in ('.csv', '.txt')]
+                members = list_archive_members(filepath, streamable)
+                logging.info(f"Reading {len(members)} members of {os.path.basename(filepath)} in place")
+            in_place.append(members)
+            job = dict(
+                input_archive=filepath,
+                target_directory=target_dir,
+                down_ext=self.down_ext,
+                skip={member.name for member in members}
+            )
+            options[index] = _extraction_options_token(job)
+
+            previous = self.manifest.get(filepath, 'extracted') if self.manifest is not None else None
+            if (isinstance(previous, dict) and previous.get('options') == options[index]
+                    and all(os.path.exists(f) for f in previous['files'])):
+                logging.info(f"Unchanged since last run, reusing extracted files: {os.path.basename(filepath)}")
+                reused[index] = previous['files']
+                continue
+            jobs.append(job)
+
+        extracted = iter(extract_archives(jobs, max_workers=self.extract_workers))
+        results = []
+        for index, (filepath, _) in enumerate(archives):
+            if index in reused:
+                files = reused[index]
+            else:
+                files = next(extracted)
+                if self.manifest is not None:
+                    self.manifest.record(filepath, extracted={'options': options[index], 'files': files})
+            results.append(in_place[index] + files)
+        return results
+
     def _process_files_locally(self, files):
         """Shared local processing logic used by both modes"""
-        valid_files = 0
-
-        for filepath in tqdm(files, desc="Processing files"):
+        sources = []
+        for filepath in files:
             try:
-                if os.path.getsize(filepath) == 0:
+                if isinstance(filepath, ArchiveMember):
+                    if filepath.size == 0:
+                        logging.warning(f"Skipping empty file: {filepath.name} in {filepath.archive}")
+                        continue
+                elif os.path.getsize(filepath) == 0:
                     logging.warning(f"Skipping empty file: {filepath}")
                     continue
+            except OSError as e:
+                self._record_error(filepath, e)
+                continue
+            sources.append(filepath)
 
-                self._read_file(filepath)
-                valid_files += 1
-            except Exception as e:
-                logging.warning(f"Error processing {filepath}: {e}")
+        valid_files = 0
+        first = len(self.dataframes)
+        sources_read = []
+        for source, (frames, error, value_labels, manifest) in zip(sources, self._read_sources(sources)):
+            # Merged in input order, whatever order the workers finished in
+            self.value_labels.update(value_labels)
+            if manifest is not None:
+                self.manifest.merge(manifest)
+            if error is not None:
+                self._record_error(source, error)
+                continue
+            self.dataframes.extend(df for df, _, _ in frames)
+            self.row_counts.extend(rows for _, rows, _ in frames)
+            sources_read.extend(origin for _, _, origin in frames)
+            valid_files += 1
+
+        if self.profile_columns:
+            self._profile_frames(first, sources_read)
 
         logging.info(f"Successfully processed {valid_files}/{len(files)} files")
 
+    def _profile_frames(self, first, sources):
+        """
+        Profile the frames from index ``first`` on, read from ``sources`` (``(filepath, key)`` pairs), in one
+        ``compute``. Profiles of unchanged files are taken from the manifest, and profiled row counts replace lazy ones.
+        """
+        options = self._read_options_token()
+        profiles, pending = {}, []
+        for index, (filepath, key) in enumerate(sources, start=first):
+            cached = self.manifest.get(filepath, 'profile', key=key) if self.manifest is not None else None
+            if cached is not None and cached.get('options') == options and cached.get('top_k') == DEFAULT_TOP_K:
+                profiles[index] = cached['profile']
+            else:
+                pending.append(index)
+        if pending:
+            logging.info(f"Profiling the columns of {len(pending)} DataFrames...")
+        for index, profile in zip(pending, compute_profiles([self.dataframes[i] for i in pending])):
+            profiles[index] = profile
+            if self.manifest is not None:
+                filepath, key = sources[index - first]
+                self.manifest.record(filepath, key=key, profile={'options': options, 'top_k': DEFAULT_TOP_K,
+                                                                 'profile': profile})
+        for index, profile in profiles.items():
+            if isinstance(self.dataframes[index], dd.DataFrame):
+                self.profiles[self.dataframes[index]._name] = profile
+            if not isinstance(self.row_counts[index], int):
+                self.row_counts[index] = profile['rows']
+
+    def _record_error(self, source, error):
+        name = f"{source.archive}::{source.name}" if isinstance(source, ArchiveMember) else str(source)
+        logging.warning(f"Error processing {name}: {error}")
+        self.errors[name] = str(error)
+
+    def _read_sources(self, sources):
+        """
+        ``(frames, error, value_labels, manifest)`` of each source, in order, read by ``read_workers`` workers.
+        Value labels and manifest entries are only returned by process workers; threads record them in place.
+        """
+        workers = min(self.read_workers, len(sources))
+        if workers <= 1:
+            return [self._read_source(source) + ({}, None) for source in tqdm(sources, desc="Processing files")]
+
+        if self.read_executor == 'process':
+            with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as executor:
+                futures = [executor.submit(_read_detached, self._detached_reader(source), source)
+                           for source in sources]
+                for _ in tqdm(as_completed(futures), total=len(futures), desc="Processing files"):
+                    pass
+            return [future.result() for future in futures]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._read_source, source) for source in sources]
+            for _ in tqdm(as_completed(futures), total=len(futures), desc="Processing files"):
+                pass
+        return [future.result() + ({}, None) for future in futures]
+
+    def _detached_reader(self, source):
+        """Picklable copy of the extractor for a process worker, with only the manifest entries of ``source``"""
+        reader = copy.copy(self)
+        reader.READERS = {ext: getattr(reader, method.__name__) if getattr(method, '__self__', None) is self else method
+                          for ext, method in self.READERS.items()}
+        reader.download_cache = None
+        reader.dataframes, reader.value_labels, reader.errors, reader.row_counts = [], {}, {}, []
+        if self.manifest is not None:
+            key = f"{source.archive}::{source.name}" if isinstance(source, ArchiveMember) else \
+                os.path.realpath(source)
+            reader.manifest = self.manifest.subset(key)
+        return reader
+
+    def _read_source(self, source):
+        """``(frames, error)`` of one file or archive member, ``frames`` being ``(frame, rows, (filepath, key))``
+        tuples; ``dataframes`` is left untouched"""
+        try:
+            if isinstance(source, ArchiveMember):
+                return self._read_archive_member(source), None
+            return self._read_file(source), None
+        except Exception as e:
+            return [], e
+
+    def _build_inventory(self):
+        """
+        Scan ``input_path`` once, recursively, and classify the files matching ``down_ext`` into archives and
+        directly readable files. Hidden entries are ignored and files reached through several paths (symlinks)
+        are kept once.
+        """
+        wanted_ext = tuple(ext.lower() for ext in self.down_ext)
+        archive_ext = tuple(ext.lower() for ext in self.compressed_ext)
+        inventory = {'archives': [], 'files': [], 'extracted': {}}
+        seen = set()
+
+        for root, dirs, names in os.walk(self.input_path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.') and not d.endswith(CACHE_SUFFIX))
+            for name in sorted(names):
+                if name.startswith('.') or not name.lower().endswith(wanted_ext):
+                    continue
+                filepath = os.path.join(root, name)
+                real_path = os.path.realpath(filepath)
+                if real_path in seen:
+                    continue
+                seen.add(real_path)
+                kind = 'archives' if name.lower().endswith(archive_ext) else 'files'
+                inventory[kind].append(filepath)
+
+        logging.info(f"Found {len(inventory['archives'])} archives and {len(inventory['files'])} files "
+                     f"in {self.input_path}")
+        return inventory
+
     def _extract_local_mode(self):
         """Local mode extraction that now uses the shared processing logic"""
         logging.info("Extracting data in local mode...")
-        files_list = []
-        compressed_list = []
+        self.inventory = self._build_inventory()
 
-        compressed_inter = set(self.compressed_ext) & set(self.down_ext)
-        iter_ext = list(compressed_inter) + list(set(self.down_ext) - compressed_inter)
+        archives = []
+        for filepath in self.inventory['archives']:
+            base_name = os.path.splitext(os.path.basename(filepath))[0]
+            parent_dir = self.output_path if self.output_path else os.path.dirname(filepath)
+            archives.append((filepath, os.path.join(parent_dir, base_name)))
 
+        # Each archive is extracted exactly once
         extracted_files = []
         zip_to_delete = []
+        for (filepath, _), extracted in zip(archives, self._expand_archives(archives)):
+            self.inventory['extracted'][filepath] = extracted
+            extracted_files.extend(extracted)
+            if self.delete_zip_after and not any(isinstance(f, ArchiveMember) for f in extracted):
+                zip_to_delete.append(filepath)
 
-        for ext in iter_ext:
-            full_pattern = os.path.join(self.input_path, f"**/*{ext}")
-            if ext in self.compressed_ext:
-                compressed_list.extend(glob.glob(full_pattern, recursive=True))
-                for filepath in compressed_list:
-                    base_name = os.path.splitext(os.path.basename(filepath))[0]
-                    parent_dir = self.output_path if self.output_path else os.path.dirname(filepath)
-                    target_dir = os.path.join(parent_dir, base_name)
-                    os.makedirs(target_dir, exist_ok=True)
-                    extracted_files.extend(
-                        compressed2files(
-                            input_archive=filepath,
-                            target_directory=target_dir,
-                            down_ext=self.down_ext
-                        )
-                    )
-                    if self.delete_zip_after:
-                        zip_to_delete.append(filepath)
-            else:
-                files_list.extend(glob.glob(full_pattern, recursive=True))
+        files_list = self.inventory['files']
         # Process all files using the shared method
         self._process_files_locally(files_list + extracted_files)
 
@@ -407,77 +848,413 @@ class Extractor:
         if not self.dataframes:
             logging.warning("No files found matching the specified extensions.")
 
+    def _select_columns(self, columns):
+        """Columns among ``columns`` requested in ``usecols`` (compared upper-cased), or ``None`` to keep them all"""
+        if self.usecols is None:
+            return None
+        wanted = {str(col).strip().upper() for col in self.usecols}
+        return [col for col in columns if str(col).strip().upper() in wanted]
+
+    def _text_dialect(self, source, default_sep):
+        """Delimiter, quoting, header row and encoding of a text file or archive member, sniffed once per version"""
+        if isinstance(source, ArchiveMember):
+            filepath, key = source.archive, f"{source.archive}::{source.name}"
+        else:
+            filepath, key = source, None
+        options = self._read_options_token(row_filters=False)
+        cached = self.manifest.get(filepath, 'dialect', key=key) if self.manifest is not None else None
+        if cached is not None and cached.get('options') == options:
+            return TextDialect(**cached['dialect'])
+        dialect = sniff_text(read_head(source), sep=self.sep, encoding=self.encoding, default_sep=default_sep)
+        if self.manifest is not None:
+            self.manifest.record(filepath, key=key, dialect={'options': options, 'dialect': dialect._asdict()})
+        return dialect
+
     def _read_csv(self, filepath):
+        dialect = self._text_dialect(filepath, ',')
+        if self.text_engine == 'pyarrow':
+            return self._read_csv_arrow(filepath, dialect, self.ddtype, on_bad_lines=self.on_bad_lines)
+        usecols = None
+        if self.usecols is not None:
+            usecols = self._select_columns(pd.read_csv(filepath, nrows=0, **dialect._asdict()).columns)
         # Read everything as text first to avoid dtype issues
-        df = dd.read_csv(
+        return dd.read_csv(
             filepath,
-            encoding=self.encoding,
-            sep=self.sep if self.sep else ',',
+            **dialect._asdict(),
             dtype=self.ddtype,
-            assume_missing = True,
+            usecols=usecols,
+            assume_missing=True,
             on_bad_lines=self.on_bad_lines
         )
-        if len(df.columns) == 1:
-            # Try different separator if we only got one column
-            df = dd.read_csv(
-                filepath,
-                encoding=self.encoding,
-                sep=',' if self.sep != ',' else ';',
-                dtype=self.ddtype,
-                assume_missing=True,
-                on_bad_lines=self.on_bad_lines
-            )
-        return df
 
     def _read_excel(self, filepath):
-        return dd.from_pandas(pd.read_excel(filepath,
-                             sheet_name=self.sheet_name,
-                             dtype=self.dtype,
-                             engine=self.engine))
-    
+        sheets = list_excel_sheets(filepath, engine=self.engine)
+        selected = self.sheet_name if isinstance(self.sheet_name, list) else \
+            [sheet.name for sheet in sheets] if self.sheet_name is None else [self.sheet_name]
+        by_name = {sheet.name: sheet for sheet in sheets}
+        dtype = self.dtype or 'object'
+
+        frames = {}
+        for name in selected:
+            sheet = sheets[name] if isinstance(name, int) else by_name.get(name)
+            if sheet is None:
+                raise ValueError(f"Worksheet {name!r} not found in {os.path.basename(filepath)}")
+            head = read_excel_chunk(filepath, sheet.name, 0, 1, dtype=dtype, engine=self.engine).iloc[:0]
+            if head.columns.empty:
+                logging.info(f"Skipping empty sheet {sheet.name!r} of {os.path.basename(filepath)}")
+                continue
+            usecols = self._select_columns(head.columns)
+            if sheet.rows is None:
+                # Sheets that cannot be streamed are loaded whole: read them once
+                offsets, row_limit = [0], None
+            else:
+                offsets, row_limit = range(0, max(sheet.rows - 1, 1), self.excel_chunksize), self.excel_chunksize
+            df = dd.from_map(
+                read_excel_chunk,
+                [filepath] * len(offsets),
+                [sheet.name] * len(offsets),
+                offsets,
+                row_limit=row_limit,
+                dtype=dtype,
+                engine=self.engine,
+                meta=head
+            )
+            if usecols is not None:
+                df = df[usecols]
+            df['sheet'] = sheet.name
+            frames[sheet.name] = df
+        return frames
+
     def _read_parquet(self, filepath):
-        return dd.read_parquet(filepath)
+        df = dd.read_parquet(filepath)
+        usecols = self._select_columns(df.columns)
+        filters = resolve_filters(self.filters, df.columns) if self.filters else None
+        if usecols is None and filters is None:
+            return df
+        return dd.read_parquet(filepath, columns=usecols, filters=filters)
 
     def _read_json(self, filepath):
-        with open(filepath, 'r', encoding=self.encoding) as f:
-            return dd.from_pandas(json.load(f))
+        ext = Path(filepath).suffix.lower()
+        lines = True if ext in ('.jsonl', '.ndjson') else None
+        encoding = self.encoding or 'utf-8'
+        try:
+            if not is_ascii_compatible(encoding):
+                raise ValueError(f"{encoding} encoded files cannot be split into blocks")
+            blocks, columns, lines = json_layout(filepath, lines=lines, record_path=self.json_record_path,
+                                                 blocksize=self.json_blocksize, encoding=encoding)
+        except ValueError as e:
+            if self.json_record_path is not None:
+                raise
+            # Not an array of records (e.g. a single object of columns): let pandas read the whole document
+            logging.info(f"Reading {os.path.basename(filepath)} as a single partition: {e}")
+            with open(filepath, 'r', encoding=encoding) as f:
+                df = pd.read_json(f, dtype=False)
+            usecols = self._select_columns(df.columns)
+            return dd.from_pandas(df.astype(self.ddtype) if usecols is None else df[usecols].astype(self.ddtype),
+                                  npartitions=1)
+
+        if self.usecols is not None:
+            columns = self._select_columns(columns)
+        meta = read_json_block(filepath, 0, 0, columns=columns, dtype=self.ddtype)
+        if not blocks:
+            return dd.from_pandas(meta, npartitions=1)
+        starts, ends = zip(*blocks)
+        return dd.from_map(
+            read_json_block,
+            [filepath] * len(blocks),
+            starts,
+            ends,
+            lines=lines,
+            encoding=encoding,
+            columns=columns,
+            dtype=self.ddtype,
+            meta=meta
+        )
 
     def _read_geospatial(self, filepath):
-        gpd = import_optional('geopandas', extra='geo')
-        return gpd.read_file(filepath)
+        import_optional('dask_geopandas', extra='geo')  # registers the GeoDataFrame backend of dd.from_map
+        filters = dict(bbox=self.geo_bbox, where=self.geo_where)
+        meta = read_geo_chunk(filepath, 0, 1, **filters).iloc[:0]
+        usecols = self._select_columns([col for col in meta.columns if col != meta.geometry.name])
+        if usecols is not None:
+            filters['columns'] = usecols
+            meta = meta[usecols + [meta.geometry.name]]
+        if self.geo_bbox is not None or self.geo_where is not None:
+            # Find the matching features once, so partitions read them by id instead of filtering the file again
+            fids = geo_feature_ids(filepath, bbox=self.geo_bbox, where=self.geo_where)
+            if not len(fids):
+                return dd.from_map(read_geo_chunk, [filepath], [0], max_features=0, meta=meta, **filters)
+            chunks = [fids[start:start + self.geo_chunksize] for start in range(0, len(fids), self.geo_chunksize)]
+            return dd.from_map(
+                read_geo_features,
+                [filepath] * len(chunks),
+                chunks,
+                columns=filters.get('columns'),
+                meta=meta
+            )
+        total = count_geo_features(filepath, **filters)
+        offsets = range(0, max(total, 1), self.geo_chunksize)
+        return dd.from_map(
+            read_geo_chunk,
+            [filepath] * len(offsets),
+            offsets,
+            max_features=self.geo_chunksize,
+            meta=meta,
+            **filters
+        )
     
+    def _read_csv_arrow(self, filepath, dialect, dtype, **kwargs):
+        blocks, names = csv_layout(filepath, sep=dialect.sep, encoding=dialect.encoding, skiprows=dialect.skiprows,
+                                   quotechar=dialect.quotechar)
+        kwargs = dict(sep=dialect.sep, quotechar=dialect.quotechar, encoding=dialect.encoding,
+                      usecols=self._select_columns(names), dtype=dtype, **kwargs)
+        meta = csv_meta(names, kwargs['usecols'], dtype)
+        if not blocks:
+            return dd.from_pandas(meta, npartitions=1)
+        starts, ends = zip(*blocks)
+        return dd.from_map(read_csv_block, [filepath] * len(blocks), starts, ends, names=names, meta=meta, **kwargs)
+
     def _read_txt(self, filepath):
-        return dd.read_csv(filepath, sep=self.sep or '\t', encoding=self.encoding, dtype=self.dtype or 'object')
+        dialect = self._text_dialect(filepath, '\t')
+        if self.text_engine == 'pyarrow':
+            return self._read_csv_arrow(filepath, dialect, self.dtype or 'object')
+        usecols = None
+        if self.usecols is not None:
+            usecols = self._select_columns(pd.read_csv(filepath, nrows=0, **dialect._asdict()).columns)
+        return dd.read_csv(filepath, **dialect._asdict(), dtype=self.dtype or 'object', usecols=usecols)
+
+    def _read_sav_metadata(self, filepath):
+        """Read the header of a ``.sav`` file and keep its value labels"""
+        _, meta = pyreadstat.read_sav(filepath, encoding=self.encoding, metadataonly=True)
+        self.value_labels[os.path.basename(filepath)] = meta.variable_value_labels
+        return meta
 
     def _read_sav(self, filepath):
-        df, meta = pyreadstat.read_sav(filepath, encoding=self.encoding)
+        meta = self._read_sav_metadata(filepath)
+
+        usecols = self._select_columns(meta.column_names)
+        head = read_sav_chunk(filepath, 0, 1, encoding=self.encoding, usecols=usecols).iloc[:0]
+        if meta.number_rows == 0:
+            return dd.from_pandas(head, npartitions=1)
+        if meta.number_rows is None:
+            # Row count not stored in the file header: read it as a single partition (row_limit=0 reads all rows)
+            offsets, row_limit = [0], 0
+        else:
+            offsets, row_limit = range(0, meta.number_rows, self.sav_chunksize), self.sav_chunksize
+        return dd.from_map(
+            read_sav_chunk,
+            [filepath] * len(offsets),
+            offsets,
+            row_limit=row_limit,
+            encoding=self.encoding,
+            usecols=usecols,
+            meta=head
+        )
+
+    def _fwf_columns(self):
+        """``(colnames, colspecs)`` of the fixed-width columns requested in ``usecols``"""
+        usecols = self._select_columns(self.colnames)
+        if usecols is None:
+            return self.colnames, self.colspecs
+        selected = [(name, spec) for name, spec in zip(self.colnames, self.colspecs) if name in usecols]
+        return [name for name, _ in selected], [spec for _, spec in selected]
+
+    def _read_fwf(self, filepath):
+        df = self._read_fwf_frame(filepath)
+        if self.text_engine == 'pyarrow':
+            df = df.map_partitions(to_arrow_strings, meta=to_arrow_strings(df._meta))
         return df
-    
+
+    def _read_fwf_frame(self, filepath):
+        if self.fwf_engine == 'dask':
+            colnames, colspecs = self._fwf_columns()
+            if not colnames:
+                # read_fwf would infer the columns from the data
+                return dd.from_pandas(pd.DataFrame(), npartitions=1)
+            return dd.read_fwf(
+                filepath,
+                colspecs=colspecs,
+                names=colnames,
+                encoding=self.encoding,
+                dtype=self.ddtype,
+                assume_missing=True,
+                on_bad_lines='warn'
+            )
+        kwargs = dict(colspecs=self.colspecs, names=self.colnames, dtypes=self.fwf_dtypes, encoding=self.encoding,
+                      usecols=self._select_columns(self.colnames))
+        meta = read_fwf_block(filepath, 0, 0, **kwargs)
+        blocks = line_blocks(filepath, self.fwf_blocksize)
+        if not blocks:
+            return dd.from_pandas(meta, npartitions=1)
+        starts, ends = zip(*blocks)
+        return dd.from_map(read_fwf_block, [filepath] * len(blocks), starts, ends, meta=meta, **kwargs)
+
+    def _read_archive_member(self, member):
+        """Build a Dask DataFrame whose partition tasks read a member straight out of its zip archive: one per byte
+        block of whole lines when the member is stored uncompressed, otherwise a single one streaming the member"""
+        ext = Path(member.name).suffix.lower()
+        if self.is_fwf:
+            reader = 'fwf'
+            colnames, colspecs = self._fwf_columns()
+            if not colnames:
+                logging.info(f"None of the requested columns found in {os.path.basename(member.name)}")
+                return []
+            kwargs = dict(colspecs=colspecs, names=colnames, encoding=self.encoding, dtype=self.ddtype)
+        elif ext == '.txt':
+            reader = 'csv'
+            kwargs = dict(self._text_dialect(member, '\t')._asdict(), dtype=self.dtype or 'object')
+        else:
+            reader = 'csv'
+            kwargs = dict(self._text_dialect(member, ',')._asdict(), dtype=self.ddtype, on_bad_lines=self.on_bad_lines)
+
+        meta = read_archive_member(member, reader, nrows=100, **kwargs)
+        names = list(meta.columns)
+        if reader == 'csv' and self.usecols is not None:
+            kwargs['usecols'] = self._select_columns(meta.columns)
+            meta = meta[kwargs['usecols']]
+        if reader == 'csv' and self.text_engine == 'pyarrow':
+            reader = 'arrow'
+            kwargs.update(names=names, header=True)
+            meta = csv_meta(names, kwargs.get('usecols'), kwargs['dtype'])
+
+        blocksize = self.fwf_blocksize if reader == 'fwf' else DEFAULT_CSV_BLOCKSIZE
+        blocks = member_blocks(member, blocksize)
+        if blocks:
+            if reader == 'csv':
+                kwargs.update(names=names, header=0)
+            starts, ends = zip(*blocks)
+            firsts = [index == 0 for index in range(len(blocks))]
+            df = dd.from_map(read_member_block, [member] * len(blocks), starts, ends, firsts, reader=reader,
+                             meta=meta.iloc[:0], **kwargs)
+        else:
+            if member.size > LARGE_MEMBER_SIZE:
+                logging.warning(f"{member.name} is compressed inside {os.path.basename(member.archive)}, so its "
+                                f"{member.size / 1024 ** 2:.0f} MiB are read as a single partition; extract it "
+                                f"(read_from_archive=False) to read it in parallel")
+            df = dd.from_map(read_archive_member, [member], reader=reader, meta=meta.iloc[:0], **kwargs)
+        if self.text_engine == 'pyarrow' and reader == 'fwf':
+            df = df.map_partitions(to_arrow_strings, meta=to_arrow_strings(df._meta))
+        frame = self._add_frame(df, member.archive, os.path.basename(member.name),
+                                key=f"{member.archive}::{member.name}")
+        return [frame] if frame is not None else []
+
+    def _read_options_token(self, row_filters=True):
+        """Fingerprint of the reading options; manifest entries recorded with other options are not reused"""
+        options = [self.encoding, self.is_fwf, self.colnames, self.colspecs, self.sep, self.ddtype, self.dtype,
+                   self.engine, self.text_engine, self.sheet_name, self.on_bad_lines, self.json_record_path,
+                   self.geo_bbox, self.geo_where, self.fwf_engine, self.fwf_dtypes,
+                   sorted({str(col).strip().upper() for col in self.usecols}) if self.usecols is not None else None]
+        if row_filters:
+            # The Parquet cache keeps every row with the types read, so it does not depend on these options
+            options += [self.filters, self.optimize_dtypes, self.dtype_sample_rows if self.optimize_dtypes else None]
+        return hashlib.md5(json.dumps(options, default=str).encode()).hexdigest()
+
+    def _sample(self, df):
+        """Up to ``dtype_sample_rows`` rows taken from the head of up to four evenly spaced partitions"""
+        if not isinstance(df, dd.DataFrame):
+            return df.head(self.dtype_sample_rows)
+        parts = sorted({round(i * (df.npartitions - 1) / 3) for i in range(4)})
+        rows = max(self.dtype_sample_rows // len(parts), 1)
+        heads = [df.partitions[i].head(rows, npartitions=1, compute=False) for i in parts]
+        return pd.concat(dask.compute(*heads))
+
+    def _infer_dtypes(self, df, filepath, key=None):
+        """Compact data types of ``df``, reused from the manifest when the file and the options did not change"""
+        cached = self.manifest.get(filepath, 'dtypes', key=key) if self.manifest is not None else None
+        if cached is not None and cached.get('options') == self._read_options_token():
+            return cached['dtypes']
+        dtypes = infer_dtypes(self._sample(df))
+        if self.manifest is not None:
+            self.manifest.record(filepath, key=key, dtypes={'options': self._read_options_token(), 'dtypes': dtypes})
+        return dtypes
+
+    def _add_frame(self, df, filepath, filename, key=None):
+        """
+        Tag a frame read from ``filepath`` with its file name and return it with its row count (lazy when it is not
+        known cheaply) and its ``(filepath, key)`` in the manifest, or ``None`` if it has no rows
+        """
+        if self.usecols is not None and len(df.columns) == 0:
+            logging.info(f"None of the requested columns found in {filename}")
+            return None
+        if self.filters:
+            filters = resolve_filters(self.filters, df.columns)
+            if filters is None:
+                logging.warning(f"Filter columns not found in {filename}, its rows are not filtered")
+            elif isinstance(df, dd.DataFrame):
+                df = df.map_partitions(filter_rows, filters, meta=df._meta)
+            else:
+                df = filter_rows(df, filters)
+        if self.optimize_dtypes:
+            dtypes = self._infer_dtypes(df, filepath, key=key)
+            if dtypes and isinstance(df, dd.DataFrame):
+                # Categories are only known per partition
+                meta = clear_known_categories(apply_dtypes(df._meta, dtypes), index=False)
+                df = df.map_partitions(apply_dtypes, dtypes, meta=meta)
+            elif dtypes:
+                df = apply_dtypes(df, dtypes)
+        cached = self.manifest.get(filepath, 'read', key=key) if self.manifest is not None else None
+        if cached is not None and cached.get('options') == self._read_options_token() and 'rows' in cached:
+            rows = cached['rows']
+        elif self.count_rows == 'deferred':
+            rows = None
+        else:
+            rows = self._count_rows(df, filepath)
+            if self.manifest is not None:
+                self.manifest.record(filepath, key=key, read={
+                    'options': self._read_options_token(),
+                    'schema': {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+                    'rows': rows,
+                })
+        if rows == 0:
+            return None
+        df['filename'] = filename
+        return df, rows if rows is not None else df.shape[0], (filepath, key)
+
+    def _count_rows(self, df, filepath):
+        """Row count of ``df`` if it is cheap to get (or ``count_rows`` is ``'exact'``), ``0`` if it is empty and
+        ``None`` if it has rows"""
+        if self.count_rows == 'exact' or not isinstance(df, dd.DataFrame):
+            return len(df)
+        if Path(filepath).suffix.lower() == '.parquet' and not self.filters:
+            return parquet_row_count(filepath)
+        return None if has_rows(df) else 0
+
     def _read_file(self, filepath):
+        """``(frame, rows, (filepath, key))`` read from ``filepath``: one per file, or one per sheet of an Excel
+        workbook"""
         try:
             df = []
-            if self.is_fwf:
+            ext = Path(filepath).suffix.lower()
+            cacheable = self.parquet_cache and ext != '.parquet'
+            cached = load_parquet_cache(filepath, self._read_options_token(row_filters=False)) if cacheable else None
+            if cached is not None:
+                df = cached
+                if ext == '.sav' and not self.is_fwf:
+                    # Value labels are not part of the Parquet copy: read them from the file header
+                    self._read_sav_metadata(filepath)
+            elif self.is_fwf:
                 if not self.colnames or not self.colspecs:
                     logging.error("Column specs required for fixed-width files")
                     raise ValueError("Column specs required for fixed-width files")
-                df = dd.read_fwf(
-                    filepath,
-                    colspecs=self.colspecs,
-                    names=self.colnames,
-                    encoding=self.encoding,
-                    dtype=self.ddtype,
-                    assume_missing=True,
-                    on_bad_lines='warn'
-                )
+                df = self._read_fwf(filepath)
             else:
-                ext = Path(filepath).suffix.lower()
                 if ext in self.READERS:
                     df = self.READERS[ext](filepath)
                 else:
                     logging.warning(f"Unsupported extension: {ext}")
-            if len(df) != 0:
-                df['filename'] = os.path.basename(filepath) 
-                self.dataframes.append(df)
+            if cacheable and cached is None and isinstance(df, (dd.DataFrame, pd.DataFrame)):
+                if isinstance(df, pd.DataFrame):
+                    df = dd.from_pandas(df, npartitions=1)
+                df = write_parquet_cache(df, filepath, self._read_options_token(row_filters=False))
+            if isinstance(df, (dd.DataFrame, pd.DataFrame)):
+                frames = [self._add_frame(df, filepath, os.path.basename(filepath))]
+            elif isinstance(df, dict):
+                # One frame per Excel sheet
+                frames = [self._add_frame(frame, filepath, os.path.basename(filepath),
+                                          key=f"{os.path.realpath(filepath)}::{name}") for name, frame in df.items()]
+            else:
+                frames = []
+            return [frame for frame in frames if frame is not None]
 
         except Exception as e:
             logging.error(f"Error reading {filepath}: {e}")
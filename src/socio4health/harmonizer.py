@@ -3,20 +3,42 @@ Harmonizer class for harmonizing and processing Dask DataFrames in health data i
 
 """
 
+import heapq
 import json
+from collections import defaultdict
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Dict, Union, Type, List
+import dask
 import dask.dataframe as dd
 import pandas as pd
 from tqdm import tqdm
 import logging
 
-from socio4health.enums.dict_enum import ColumnMappingEnum
+from socio4health.utils.harmonizer_utils import s4h_select_columns
+from socio4health.utils.row_counts import has_rows
+from socio4health.utils.column_profile import profile_values, combine_profiles
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+def _null_dtype(dtype):
+    """Type able to hold missing values for columns of ``dtype``: nullable integers and booleans for NumPy ones"""
+    if pd.api.types.is_bool_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+        return pd.BooleanDtype()
+    if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+        return pd.api.types.pandas_dtype(dtype.name.capitalize().replace('Uint', 'UInt'))
+    return dtype
+
+
+def _align_partition(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """Reorder the columns of a partition as ``dtypes`` and add the missing ones as typed missing values"""
+    missing = {col: pd.Series(index=df.index, dtype=dtype) for col, dtype in dtypes.items() if col not in df.columns}
+    if missing:
+        df = pd.concat([df, pd.DataFrame(missing, index=df.index)], axis=1)
+    return df[list(dtypes)]
+
+
 class Harmonizer:
     """
         Initialize the Harmonizer class for harmonizing and processing `Dask <https://docs.dask.org>`_ DataFrames in health data integration.
@@ -53,6 +75,18 @@ class Harmonizer:
             Key column for joining DataFrames (default is ``None``).
         aux_key : str
             Auxiliary key column for joining DataFrames (default is ``None``).
+        deferred_stats : bool
+            Whether ``s4h_data_selector`` leaves the row counts of the selected DataFrames lazy in ``row_counts``
+            instead of checking each one for rows, so they can be computed together with the frames through
+            ``row_counts.compute_with_row_counts`` (default is ``False``).
+        row_counts : list
+            Set by ``s4h_data_selector`` with ``deferred_stats``: lazy row count of each selected DataFrame.
+        profiles : dict
+            Column profiles of DataFrames keyed by their name, as built by ``Extractor(profile_columns=True)`` in
+            ``Extractor.profiles`` (default is an empty dict). ``s4h_vertical_merge`` adds the combined profile of
+            the frames it merges from profiled ones. ``drop_nan_columns`` takes the ``NaN`` ratios of
+            profiled DataFrames from them, and strict ``s4h_harmonize_dataframes`` their distinct values when the
+            profile lists all of them, instead of reading the data again.
     """
     def __init__(self,
                  min_common_columns: int = 1,
@@ -69,7 +103,9 @@ class Harmonizer:
                  key_val: Optional[List[Union[str, int, float]]] = None,
                  extra_cols: Optional[List[str]] = None,
                  join_key: str = None,
-                 aux_key: Optional[str] = None):
+                 aux_key: Optional[str] = None,
+                 deferred_stats: bool = False,
+                 profiles: Optional[Dict[str, dict]] = None):
         """
         Initialize the Harmonizer class with default parameters.
         """
@@ -88,6 +124,11 @@ class Harmonizer:
         self.extra_cols = extra_cols or []
         self.join_key = join_key
         self.aux_key = aux_key
+        self.deferred_stats = deferred_stats
+        self.profiles = profiles or {}
+        self.row_counts = []
+        # Names of the frames merged into each frame built by s4h_vertical_merge
+        self._merged_from = {}
 
 
 
@@ -142,6 +183,16 @@ class Harmonizer:
         """Get the categories for data selection."""
         return self._categories
 
+    @property
+    def deferred_stats(self) -> bool:
+        """Get whether row counts of selected DataFrames are left lazy."""
+        return self._deferred_stats
+
+    @property
+    def profiles(self) -> Dict[str, dict]:
+        """Get the column profiles of DataFrames, keyed by DataFrame name."""
+        return self._profiles
+
     @property
     def key_col(self) -> Optional[str]:
         """Get the key column for data selection."""
@@ -220,6 +271,20 @@ class Harmonizer:
             raise ValueError("categories must be a list of strings")
         self._categories = value
 
+    @deferred_stats.setter
+    def deferred_stats(self, value: bool):
+        """Set whether row counts of selected DataFrames are left lazy."""
+        if not isinstance(value, bool):
+            raise ValueError("deferred_stats must be a boolean")
+        self._deferred_stats = value
+
+    @profiles.setter
+    def profiles(self, value: Dict[str, dict]):
+        """Set the column profiles of DataFrames, keyed by DataFrame name."""
+        if not isinstance(value, dict):
+            raise ValueError("profiles must be a dict")
+        self._profiles = value
+
     @key_col.setter
     def key_col(self, value: Optional[str]):
         """Set the key column for data selection."""
@@ -241,6 +306,16 @@ class Harmonizer:
             raise ValueError("extra_cols must be a list of strings")
         self._extra_cols = value
 
+    def _profile(self, ddf) -> Optional[Dict[str, dict]]:
+        """Column statistics of a profiled Dask DataFrame, keyed by cleaned (upper-cased) column name"""
+        profile = self.profiles.get(getattr(ddf, '_name', None)) if isinstance(ddf, dd.DataFrame) else None
+        if profile is None:
+            return None
+        columns = {}
+        for col, stats in profile['columns'].items():
+            columns.setdefault(str(col).upper().strip(), dict(stats, rows=profile['rows']))
+        return columns
+
     def s4h_vertical_merge(self, ddfs: List[dd.DataFrame], overlap_threshold: float = 1, method: str = "union") -> List[dd.DataFrame]:
         """
         Merge a list of `Dask <https://docs.dask.org>`_ DataFrames vertically using instance parameters.
@@ -265,6 +340,10 @@ class Harmonizer:
         -----
         - DataFrames are grouped and merged if they share at least ``min_common_columns`` columns and their column overlap coefficient is above ``overlap_threshold``.
         - Only columns with matching data types are considered compatible for merging.
+        - Merged frames whose members all have a profile in ``profiles`` get the combined profile of their members.
+        - Frames are compared through their normalized column names and data types, computed once per frame. Frames
+          with the same columns and types share the result of a comparison, and a group is only compared with the
+          frames that share one of its columns, so files with a common layout are grouped in near-linear time.
         """
         if not ddfs:
             return []
@@ -272,46 +351,62 @@ class Harmonizer:
         if not isinstance(overlap_threshold, (int, float)) or not 0 <= overlap_threshold <= 1:
             raise ValueError("overlap_threshold must be a float between 0 and 1")
 
-        groups = []
-        used_indices = set()
+        # Normalized column names and data types, taken once from the metadata of each frame
+        schemas = [{str(col).upper().strip(): str(dtype) for col, dtype in df.dtypes.items()} for df in ddfs]
+        signatures = [tuple(sorted(schema.items())) for schema in schemas]
+        frames_by_column = defaultdict(list)
+        for index, schema in enumerate(schemas):
+            for col in schema:
+                frames_by_column[col].append(index)
+        # Frames without common columns only match when neither the count nor the overlap is required
+        match_all = self.min_common_columns == 0 and overlap_threshold == 0
+
+        def compatible(group_schema, schema):
+            common_cols = group_schema.keys() & schema.keys()
+            smallest = min(len(group_schema), len(schema))
+            overlap = len(common_cols) / smallest if smallest > 0 else 0
+            return (len(common_cols) >= self.min_common_columns and overlap >= overlap_threshold
+                    and all(group_schema[col] == schema[col] for col in common_cols))
 
-        for i, df1 in enumerate(tqdm(ddfs, desc="Grouping DataFrames")):
-            if i in used_indices:
+        groups = []
+        used = [False] * len(ddfs)
+        for i in tqdm(range(len(ddfs)), desc="Grouping DataFrames"):
+            if used[i]:
                 continue
-
-            df1 = df1.rename(columns=lambda x: str(x).upper().strip())
-            cols1 = set(df1.columns)
-            dtypes1 = {col: str(df1[col].dtype) for col in df1.columns}
+            used[i] = True
             current_group = [i]
-            used_indices.add(i)
-
-            for j, df2 in enumerate(ddfs[i + 1:]):
-                j_actual = i + 1 + j
-                if j_actual in used_indices:
+            group_schema = dict(schemas[i])
+            # Later frames sharing a column with the group, checked in order as the original pairwise scan did
+            candidates = list(range(i + 1, len(ddfs))) if match_all else \
+                sorted({j for col in group_schema for j in frames_by_column[col] if j > i})
+            queued = set(candidates)
+            heapq.heapify(candidates)
+            # Frames with the same signature get the same answer until the group gains columns
+            version, answers = 0, {}
+
+            while candidates:
+                j = heapq.heappop(candidates)
+                if used[j]:
+                    continue
+                answer = answers.get(signatures[j])
+                if answer is None or answer[0] != version:
+                    answer = (version, compatible(group_schema, schemas[j]))
+                    answers[signatures[j]] = answer
+                if not answer[1]:
                     continue
 
-                df2 = df2.rename(columns=lambda x: str(x).upper().strip())
-                cols2 = set(df2.columns)
-                common_cols = cols1 & cols2
-                
-                overlap = len(common_cols) / min(len(cols1), len(cols2)) if min(len(cols1), len(cols2)) > 0 else 0
-
-                if (len(common_cols) >= self.min_common_columns and
-                        overlap >= overlap_threshold):
-
-                    compatible = True
-                    for col in common_cols:
-                        if col in dtypes1 and col in df2.columns:
-                            if str(df2[col].dtype) != dtypes1[col]:
-                                compatible = False
-                                break
-
-                    if compatible:
-                        current_group.append(j_actual)
-                        used_indices.add(j_actual)
-                        cols1.update(cols2)
-                        for col in cols2 - cols1:
-                            dtypes1[col] = str(df2[col].dtype)
+                current_group.append(j)
+                used[j] = True
+                new_cols = [col for col in schemas[j] if col not in group_schema]
+                if not new_cols:
+                    continue
+                version += 1
+                for col in new_cols:
+                    group_schema[col] = schemas[j][col]
+                    for k in frames_by_column[col]:
+                        if k > j and k not in queued:
+                            queued.add(k)
+                            heapq.heappush(candidates, k)
 
             groups.append(current_group)
 
@@ -327,37 +422,57 @@ class Harmonizer:
                         common_cols.intersection_update(df.columns)
                     aligned_dfs = [df[list(common_cols)] for df in group_dfs]
                 elif method == "union":
-                    import numpy as np
-                    all_cols = set()
+                    # Target schema: every column in order of appearance, typed as in the first frame holding it
+                    dtypes = {}
                     for df in group_dfs:
-                        all_cols.update(df.columns)
-                    all_cols = list(all_cols)
-                    aligned_dfs = []
+                        for col, dtype in df.dtypes.items():
+                            dtypes.setdefault(col, _null_dtype(dtype))
+                    # One reindexing task per partition; frames with the same layout share the aligned meta
+                    aligned_dfs, metas = [], {}
                     for df in group_dfs:
-                        missing_cols = [col for col in all_cols if col not in df.columns]
-                        for col in missing_cols:
-                            df[col] = np.nan
-                        aligned_dfs.append(df[all_cols])
+                        if list(df.columns) == list(dtypes):
+                            aligned_dfs.append(df)
+                            continue
+                        layout = tuple(df.dtypes.items())
+                        if layout not in metas:
+                            metas[layout] = _align_partition(df._meta, dtypes)
+                        aligned_dfs.append(df.map_partitions(_align_partition, dtypes, meta=metas[layout]))
                 else:
                     raise ValueError("method must be 'union' or 'intersection'")
                 merged_df = dd.concat(aligned_dfs, axis=0, ignore_index=True)
                 merged_dfs.append(merged_df)
+                self._merged_from[merged_df._name] = [df._name for df in group_dfs]
+                # The merged frame is profiled when all its members are, so it is not read again
+                profiles = [self.profiles.get(df._name) for df in group_dfs]
+                if all(profile is not None for profile in profiles):
+                    self.profiles = {**self.profiles,
+                                     merged_df._name: combine_profiles(profiles, list(merged_df.columns))}
         if len(merged_dfs) > 1:
             logging.warning("Dataframes that do not have the same columns could not be merged.")
 
         return merged_dfs
 
-    def drop_nan_columns(self, ddf_or_ddfs: Union[dd.DataFrame, List[dd.DataFrame]]) -> Union[
-        dd.DataFrame, List[dd.DataFrame]]:
+    def drop_nan_columns(self, ddf_or_ddfs: Union[dd.DataFrame, List[dd.DataFrame]],
+                         row_counts: Optional[Union[int, List, Dict[str, int]]] = None) -> Union[dd.DataFrame, List[dd.DataFrame]]:
         """
 
         Drop columns where the majority of values are ``NaN`` using instance parameters.
 
+        The ``NaN`` statistics of all the DataFrames are built lazily and computed together in a single
+        ``dask.compute`` call, so files shared by several frames are read once.
 
         Parameters
         ----------
         ddf_or_ddfs : `dask.dataframe.DataFrame <https://docs.dask.org/en/stable/generated/dask.dataframe.DataFrame.html>`_ or list of dask.dataframe.DataFrame
             The `Dask <https://docs.dask.org>`_ DataFrame or list of `Dask <https://docs.dask.org>`_ DataFrames to process.
+        row_counts : int, list or dict, optional
+            Row count of the DataFrame, or of each DataFrame of the list, such as ``Extractor.row_counts`` for the
+            extracted DataFrames. Counts can also be given as a dict keyed by DataFrame name (``ddf._name``), e.g.
+            ``dict(zip((df._name for df in dfs), extractor.row_counts))``: the count of a DataFrame built by
+            ``s4h_vertical_merge`` is then the sum of the counts of the DataFrames it merges, so the extracted counts
+            still apply after merging. Known (integer) counts are reused instead of being counted again; lazy and
+            missing ones are computed with the ``NaN`` statistics. Ignored when ``sample_frac`` is set. DataFrames
+            found in ``profiles`` need neither.
 
         Returns
         -------
@@ -373,18 +488,34 @@ class Harmonizer:
 
         if not 0 <= self.nan_threshold <= 1:
             raise ValueError("Threshold must be between 0 and 1")
-
-        def process_ddf(ddf):
-            ddf = ddf.rename(columns=lambda x: str(x).upper().strip())
-            #ddf = ddf.loc[:, ~ddf.columns.duplicated()]
-            if self.sample_frac is not None:
-                if not 0 < self.sample_frac <= 1:
-                    raise ValueError("sample_frac must be between 0 and 1")
-                sample = ddf.sample(frac=self.sample_frac).compute()
-                nan_percentages = sample.isna().mean()
+        if self.sample_frac is not None and not 0 < self.sample_frac <= 1:
+            raise ValueError("sample_frac must be between 0 and 1")
+
+        ddfs = ddf_or_ddfs if isinstance(ddf_or_ddfs, list) else [ddf_or_ddfs]
+        if row_counts is None:
+            row_counts = [None] * len(ddfs)
+        elif isinstance(row_counts, dict):
+            row_counts = [self._merged_rows(ddf._name, row_counts) for ddf in ddfs]
+        elif not isinstance(row_counts, list):
+            row_counts = [row_counts]
+        if len(row_counts) != len(ddfs):
+            raise ValueError("row_counts must have one count per DataFrame")
+        profiles = [self._profile(ddf) for ddf in ddfs]
+        ddfs = [ddf.rename(columns=lambda x: str(x).upper().strip()) for ddf in ddfs]
+
+        stats = []
+        for ddf, rows, profile in zip(ddfs, row_counts, profiles):
+            if profile is not None and not ddf.columns.duplicated().any() and all(col in profile for col in ddf.columns):
+                nulls = pd.Series({col: profile[col]['nulls'] for col in ddf.columns}, dtype='float64')
+                stats.append((nulls, next(iter(profile.values()))['rows'] if profile else 0))
+            elif self.sample_frac is not None:
+                stats.append(ddf.sample(frac=self.sample_frac).isna().mean())
             else:
-                nan_percentages = ddf.isna().mean().compute()
+                stats.append((ddf.isna().sum(), rows if rows is not None else ddf.shape[0]))
+        stats = dask.compute(*stats)
 
+        def process_ddf(ddf, stat):
+            nan_percentages = stat[0] / stat[1] if isinstance(stat, tuple) else stat
             columns_to_drop = nan_percentages[nan_percentages > self.nan_threshold].index.tolist()
 
             if columns_to_drop:
@@ -394,12 +525,21 @@ class Harmonizer:
                 logging.info("No columns with majority NaN values found")
                 return ddf
 
-        if isinstance(ddf_or_ddfs, list):
-            return [process_ddf(ddf) for ddf in ddf_or_ddfs]
-        else:
-            return process_ddf(ddf_or_ddfs)
-
-    def s4h_drop_nan_columns(self, ddf_or_ddfs: Union[dd.DataFrame, List[dd.DataFrame]]) -> Union[
+        results = [process_ddf(ddf, stat) for ddf, stat in zip(ddfs, stats)]
+        return results if isinstance(ddf_or_ddfs, list) else results[0]
+
+    def _merged_rows(self, name, row_counts):
+        """Row count of the frame called ``name``, adding up the counts of its members when it was merged"""
+        if name in row_counts:
+            return row_counts[name]
+        members = self._merged_from.get(name)
+        if not members:
+            return None
+        counts = [self._merged_rows(member, row_counts) for member in members]
+        return None if any(count is None for count in counts) else sum(counts)
+
+    def s4h_drop_nan_columns(self, ddf_or_ddfs: Union[dd.DataFrame, List[dd.DataFrame]],
+                             row_counts: Optional[Union[int, List, Dict[str, int]]] = None) -> Union[
         dd.DataFrame, List[dd.DataFrame]]:
         """
         Compatibility wrapper for the legacy `s4h_drop_nan_columns` API.
@@ -407,7 +547,7 @@ class Harmonizer:
         This delegates to :meth:`drop_nan_columns` and preserves the old
         public API expected by the documentation.
         """
-        return self.drop_nan_columns(ddf_or_ddfs)
+        return self.drop_nan_columns(ddf_or_ddfs, row_counts)
 
     @staticmethod
     def s4h_get_available_columns(df_or_dfs: Union[dd.DataFrame, pd.DataFrame, List[Union[dd.DataFrame, pd.DataFrame]]]) -> \
@@ -468,7 +608,8 @@ class Harmonizer:
         Note
         -----
         - Column and value mappings are applied per country using the provided configuration.
-        - If ``strict_mapping`` is enabled, unmapped columns or values will raise a ValueError.
+        - If ``strict_mapping`` is enabled, unmapped columns or values will raise a ValueError. The values of columns
+          whose profile (see ``profiles``) lists all their distinct values are checked without reading the data.
         - Column renaming and categorical value harmonization are performed in-place.
         """
 
@@ -505,6 +646,7 @@ class Harmonizer:
 
         def process_dataframe(df: dd.DataFrame, country: str) -> dd.DataFrame:
             """Process a single dataframe"""
+            profile = self._profile(df) or {}
             # Clean columns: uppercase, strip, deduplicate
             df = df.rename(columns=lambda x: str(x).upper().strip())
             df = df.loc[:, ~df.columns.duplicated()]
@@ -520,16 +662,23 @@ class Harmonizer:
 
             # 1. Harmonize column names
             df = df.rename(columns=col_map)
+            profile = {col_map.get(col, col): stats for col, stats in profile.items()}
 
             # 2. Harmonize categorical values
             for col, val_map in val_maps.items():
                 if col in df.columns:
-                    # Convert to string first to handle mixed types
-                    df[col] = df[col].astype('str')
+                    # Convert to string first to handle mixed types; string[pyarrow] columns already are
+                    dtype = df[col].dtype
+                    if dtype != 'string[pyarrow]':
+                        df[col] = df[col].astype('str')
 
                     # Map values with validation in strict mode
                     if self.strict_mapping:
-                        unique_vals = df[col].drop_duplicates().compute()
+                        unique_vals = profile_values(profile.get(col), dtype)
+                        if unique_vals is None:
+                            unique_vals = df[col].drop_duplicates().compute()
+                        elif dtype != 'string[pyarrow]':
+                            unique_vals = unique_vals.astype('str')
                         unmapped = set(unique_vals) - set(val_map.keys())
                         if unmapped:
                             raise ValueError(
@@ -628,19 +777,11 @@ class Harmonizer:
                 logging.warning("key_col or key_val not defined, row-wise size will not be reduced")
                 filtered_ddf = ddf
 
-            if isinstance(filtered_ddf, dd.DataFrame):
-                n_rows = filtered_ddf.shape[0].compute()
-            else:
-                n_rows = filtered_ddf.shape[0]
-
-            if n_rows == 0:
+            # Only the partitions up to the first match are read; counts are left lazy with deferred_stats
+            if not self.deferred_stats and not has_rows(filtered_ddf):
                 logging.warning("No rows found matching key values in DataFrame")
 
-            dict_df_filtered = dict_df[dict_df[ColumnMappingEnum.CATEGORY.value].isin(self.categories)]
-            columns_list = dict_df_filtered[ColumnMappingEnum.VARIABLE_NAME.value].dropna().unique().tolist()
-
-            if self.extra_cols:
-                columns_list.extend(col.upper() for col in self.extra_cols if col.upper() not in columns_list)
+            columns_list = s4h_select_columns(dict_df, self.categories, self.extra_cols)
 
             if self.join_key:
                 columns_list.extend(col.upper() for col in filtered_ddf.columns if col.upper() == self.join_key)
@@ -663,6 +804,8 @@ class Harmonizer:
 
             filtered_ddfs.append(filtered_ddf)
 
+        if self.deferred_stats:
+            self.row_counts = [ddf.shape[0] for ddf in filtered_ddfs]
         return filtered_ddfs
 
     def s4h_join_data(self, ddfs: List[dd.DataFrame]) -> pd.DataFrame:
@@ -679,7 +822,8 @@ class Harmonizer:
         pandas.DataFrame
             Merged DataFrame with duplicate columns removed.
         """
-        pandas_dfs = [df.compute() for df in ddfs]
+        # One compute shares the reads of frames that come from the same files
+        pandas_dfs = list(dask.compute(*ddfs))
         pandas_dfs = [df.rename(columns=lambda x: str(x).upper().strip()) for df in pandas_dfs]
         pandas_dfs = [df.loc[:, ~df.columns.duplicated()] for df in pandas_dfs]
 
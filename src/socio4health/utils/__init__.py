@@ -3,6 +3,15 @@ from . import harmonizer_utils
 from . import mapping_utils
 from . import standard_spider
 from . import deps
+from . import download_cache
+from . import manifest
+from . import parquet_cache
+from . import json_reader
+from . import fwf_reader
+from . import schema_inference
+from . import csv_reader
+from . import row_counts
+from . import column_profile
 
 __all__ = [
 	"extractor_utils",
@@ -10,4 +19,13 @@ __all__ = [
 	"mapping_utils",
 	"standard_spider",
 	"deps",
+	"download_cache",
+	"manifest",
+	"parquet_cache",
+	"json_reader",
+	"fwf_reader",
+	"schema_inference",
+	"csv_reader",
+	"row_counts",
+	"column_profile",
 ]
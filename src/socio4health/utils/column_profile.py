@@ -0,0 +1,184 @@
+"""Column profiles (missing values, distinct values, most frequent values and ranges) computed in a single pass."""
+import dask
+import dask.dataframe as dd
+import pandas as pd
+
+DEFAULT_TOP_K = 20
+
+
+def _scalar(value):
+    """Plain Python value of a NumPy or pandas scalar, so profiles can be stored as JSON"""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _has_values(dtype):
+    """Whether the most frequent values of a column of this type can be listed (and stored as JSON)"""
+    return (pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype)
+            or pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype))
+
+
+def _has_range(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def profile_tasks(df, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Lazy statistics of every column of a frame, to be evaluated by :func:`compute_profiles`.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or dask.dataframe.DataFrame
+        Frame to profile.
+    top_k : int
+        Number of most frequent values kept for each column. Defaults to ``20``.
+
+    Returns
+    -------
+    dict
+        Dask collections (or already computed values for a ``pandas`` frame) keyed by statistic.
+    """
+    lazy = isinstance(df, dd.DataFrame)
+    dtypes = df._meta.dtypes if lazy else df.dtypes
+    ranged = [col for col, dtype in dtypes.items() if _has_range(dtype)]
+    return {
+        'rows': df.shape[0],
+        'nulls': df.isna().sum(),
+        # HyperLogLog estimate on Dask frames
+        'distinct': {col: df[col].nunique_approx() if lazy else df[col].nunique(dropna=False) for col in df.columns},
+        'top': {col: df[col].value_counts().nlargest(top_k + 1) for col, dtype in dtypes.items()
+                if _has_values(dtype)},
+        'min': df[ranged].min() if ranged else None,
+        'max': df[ranged].max() if ranged else None,
+        'top_k': top_k,
+    }
+
+
+def _profile(stats):
+    top_k = stats['top_k']
+    columns = {}
+    for col, nulls in stats['nulls'].items():
+        nulls = int(nulls)
+        # The estimate counts missing values as one more distinct value
+        distinct = max(int(round(stats['distinct'][col])) - (nulls > 0), 0)
+        column = {'nulls': nulls, 'distinct': distinct}
+        if col in stats['top']:
+            counts = stats['top'][col]
+            counts = counts[counts > 0]
+            column['complete'] = len(counts) <= top_k
+            column['top'] = [[_scalar(value), int(count)] for value, count in counts.iloc[:top_k].items()]
+            if column['complete']:
+                column['distinct'] = len(counts)
+        if stats['min'] is not None and col in stats['min'].index:
+            low, high = stats['min'][col], stats['max'][col]
+            column['min'] = None if pd.isna(low) else _scalar(low)
+            column['max'] = None if pd.isna(high) else _scalar(high)
+        columns[str(col)] = column
+    return {'rows': int(stats['rows']), 'columns': columns}
+
+
+def compute_profiles(dfs: list, top_k: int = DEFAULT_TOP_K) -> list:
+    """
+    Profile the columns of several frames with a single ``dask.compute`` call, so every file is read once.
+
+    Each profile is a JSON-serializable dictionary ``{'rows': int, 'columns': {column: statistics}}``. The statistics
+    of a column are its number of missing values (``'nulls'``) and of distinct values (``'distinct'``, estimated with
+    HyperLogLog for Dask frames). Boolean, numeric, text and categorical columns also have their ``top_k`` most
+    frequent values with their counts (``'top'``) and whether that list holds every distinct value
+    (``'complete'``, in which case ``'distinct'`` is exact). Numeric columns have their ``'min'`` and ``'max'``.
+
+    Parameters
+    ----------
+    dfs : list of pandas.DataFrame or dask.dataframe.DataFrame
+        Frames to profile.
+    top_k : int
+        Number of most frequent values kept for each column. Defaults to ``20``.
+
+    Returns
+    -------
+    list of dict
+        The profile of each frame, in the same order.
+    """
+    stats = dask.compute(*[profile_tasks(df, top_k) for df in dfs])
+    return [_profile(frame_stats) for frame_stats in stats]
+
+
+def combine_profiles(profiles: list, columns: list = None, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Profile of the rows of several profiled frames stacked together, as :func:`dask.dataframe.concat` does.
+
+    A column missing from some of the frames is missing in all their rows. Counts of the most frequent values are
+    added up; the list stays ``'complete'`` only when it is complete in every frame holding the column and holds at
+    most ``top_k`` values. Otherwise ``'distinct'`` is the largest estimate of the frames, a lower bound.
+
+    Parameters
+    ----------
+    profiles : list of dict
+        Profiles of the frames, as returned by :func:`compute_profiles`.
+    columns : list of str, optional
+        Columns of the stacked frame. Default is ``None`` (every column of the profiles, in order of appearance).
+    top_k : int
+        Number of most frequent values kept for each column. Defaults to ``20``.
+
+    Returns
+    -------
+    dict
+        The profile of the stacked rows.
+    """
+    if columns is None:
+        columns = list(dict.fromkeys(col for profile in profiles for col in profile['columns']))
+    rows = sum(profile['rows'] for profile in profiles)
+    combined = {}
+    for col in columns:
+        col = str(col)
+        present = [profile['columns'][col] for profile in profiles if col in profile['columns']]
+        absent = sum(profile['rows'] for profile in profiles if col not in profile['columns'])
+        column = {'nulls': sum(stats['nulls'] for stats in present) + absent,
+                  'distinct': max((stats['distinct'] for stats in present), default=0)}
+        if present and all('top' in stats for stats in present):
+            counts = {}
+            for stats in present:
+                for value, count in stats['top']:
+                    counts[value] = counts.get(value, 0) + count
+            top = sorted(counts.items(), key=lambda item: -item[1])
+            column['complete'] = all(stats['complete'] for stats in present) and len(top) <= top_k
+            column['top'] = [[value, count] for value, count in top[:top_k]]
+            if column['complete']:
+                column['distinct'] = len(top)
+        if present and all('min' in stats for stats in present):
+            lows = [stats['min'] for stats in present if stats['min'] is not None]
+            highs = [stats['max'] for stats in present if stats['max'] is not None]
+            column['min'] = min(lows) if lows else None
+            column['max'] = max(highs) if highs else None
+        combined[col] = column
+    return {'rows': rows, 'columns': combined}
+
+
+def profile_values(stats: dict, dtype=None):
+    """
+    Every distinct value of a column according to its statistics in a profile.
+
+    Parameters
+    ----------
+    stats : dict
+        Statistics of the column (``profile['columns'][column]``), or ``None``.
+    dtype : str or numpy.dtype, optional
+        Type of the column. When given, the values are converted to it as a ``pandas.Series``, with a missing value
+        when the column has any. Default is ``None`` (a list of the values as profiled, missing values excluded).
+
+    Returns
+    -------
+    list, pandas.Series or None
+        The values, or ``None`` if the profile does not list all of them or they cannot be converted to ``dtype``.
+    """
+    if stats is None or not stats.get('complete'):
+        return None
+    values = [value for value, _ in stats['top']]
+    if dtype is None:
+        return values
+    # Categories of the column are not known from its type
+    if isinstance(dtype, pd.CategoricalDtype):
+        return None
+    try:
+        return pd.Series(values + ([None] if stats['nulls'] else []), dtype=dtype)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,171 @@
+"""Delimited text reading with the multithreaded ``pyarrow`` CSV parser, keeping text as ``string[pyarrow]``."""
+import io
+import logging
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from socio4health.utils.extractor_utils import line_blocks
+
+DEFAULT_CSV_BLOCKSIZE = 64 * 1024 * 1024
+ARROW_STRING = pd.StringDtype('pyarrow')
+_TEXT_TYPES = (None, object, str, 'object', 'str', 'string', 'string[pyarrow]')
+
+
+def _is_text_type(dtype):
+    return any(dtype is kind or (isinstance(kind, str) and dtype == kind) for kind in _TEXT_TYPES)
+
+
+def _bad_line_handler(on_bad_lines):
+    if on_bad_lines == 'error':
+        return None
+
+    def handler(row):
+        if on_bad_lines == 'warn':
+            logging.warning(f"Skipping line {row.text!r}: expected {row.expected_columns} fields, "
+                            f"saw {row.actual_columns}")
+        return 'skip'
+    return handler
+
+
+def csv_layout(filepath: str, sep: str = ',', encoding: str = 'utf-8', blocksize: int = DEFAULT_CSV_BLOCKSIZE,
+               skiprows: int = 0, quotechar: str = '"'):
+    """
+    Read the header of a delimited text file and split the rest into byte blocks of whole lines.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file. The line after ``skiprows`` lines holds the column names.
+    sep : str
+        Field delimiter. Defaults to ``','``.
+    encoding : str
+        Character encoding of the file. Defaults to ``'utf-8'``.
+    blocksize : int
+        Approximate size in bytes of each block. Defaults to 64 MiB.
+    skiprows : int
+        Number of lines before the header line. Defaults to ``0``.
+    quotechar : str
+        Character quoting fields. Defaults to ``'"'``.
+
+    Returns
+    -------
+    tuple
+        ``(blocks, names)``: the ``(start, end)`` byte spans of the blocks after the header and the column names.
+    """
+    with open(filepath, 'rb') as file:
+        for _ in range(skiprows):
+            file.readline()
+        header = file.readline()
+        offset = file.tell()
+    names = pa_csv.read_csv(
+        io.BytesIO(header),
+        read_options=pa_csv.ReadOptions(encoding=encoding),
+        parse_options=pa_csv.ParseOptions(delimiter=sep, quote_char=quotechar),
+    ).column_names
+    return line_blocks(filepath, blocksize, offset=offset), names
+
+
+def _convert(df, dtype):
+    if isinstance(dtype, dict):
+        dtype = {col: kind for col, kind in dtype.items() if col in df.columns and not _is_text_type(kind)}
+    elif _is_text_type(dtype):
+        dtype = None
+    return df.astype(dtype) if dtype else df
+
+
+def csv_meta(names: list, usecols: list = None, dtype=None) -> pd.DataFrame:
+    """Empty frame with the columns and types :func:`read_csv_arrow` returns, for use as Dask ``meta``"""
+    columns = [name for name in names if usecols is None or name in usecols]
+    return _convert(pd.DataFrame({name: pd.Series(dtype=ARROW_STRING) for name in columns}), dtype)
+
+
+def read_csv_arrow(source, names: list, header: bool = False, sep: str = ',', encoding: str = 'utf-8',
+                   usecols: list = None, dtype=None, on_bad_lines: str = 'error', skiprows: int = 0,
+                   quotechar: str = '"') -> pd.DataFrame:
+    """
+    Parse delimited text with ``pyarrow.csv``, using several threads.
+
+    Every column is parsed as text, so codes such as ``'05'`` keep their leading zeros, and text columns are returned
+    as ``string[pyarrow]`` without going through Python objects. Empty fields are missing values.
+
+    Parameters
+    ----------
+    source : str or file-like
+        Path or binary stream of the text.
+    names : list of str
+        Column names (see :func:`csv_layout`).
+    header : bool
+        Whether the text has a header line (after ``skiprows`` lines), which is skipped. Defaults to ``False``.
+    sep : str
+        Field delimiter. Defaults to ``','``.
+    encoding : str
+        Character encoding of the text. Defaults to ``'utf-8'``.
+    usecols : list of str, optional
+        Columns to read. Default is ``None`` (all columns).
+    dtype : str or dict, optional
+        Data type(s) of the columns. Text types (``'object'``, ``'str'``...) become ``string[pyarrow]``; other types
+        are applied after parsing. Default is ``None`` (all text).
+    on_bad_lines : str
+        ``'error'``, ``'warn'`` or ``'skip'`` lines with the wrong number of fields. Defaults to ``'error'``.
+    skiprows : int
+        Number of lines to skip at the start of the text. Defaults to ``0``.
+    quotechar : str
+        Character quoting fields. Defaults to ``'"'``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The parsed rows.
+    """
+    table = pa_csv.read_csv(
+        source,
+        read_options=pa_csv.ReadOptions(encoding=encoding, column_names=names, skip_rows=skiprows + int(header),
+                                        use_threads=True),
+        parse_options=pa_csv.ParseOptions(delimiter=sep, quote_char=quotechar,
+                                          invalid_row_handler=_bad_line_handler(on_bad_lines)),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True,
+        ),
+    )
+    df = table.to_pandas(types_mapper={pa.string(): ARROW_STRING, pa.large_string(): ARROW_STRING}.get)
+    return _convert(df, dtype)
+
+
+def read_csv_block(filepath: str, start: int, end: int, names: list, **kwargs) -> pd.DataFrame:
+    """
+    Parse the lines in one byte block found by :func:`csv_layout` with :func:`read_csv_arrow`.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file.
+    start, end : int
+        Byte span of the block.
+    names : list of str
+        Column names.
+    **kwargs
+        Keyword arguments forwarded to :func:`read_csv_arrow`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The parsed rows.
+    """
+    if end <= start:
+        return csv_meta(names, kwargs.get('usecols'), kwargs.get('dtype'))
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return read_csv_arrow(io.BytesIO(data), names, **kwargs)
+
+
+def to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the Python object and ``str`` columns of a frame to ``string[pyarrow]``"""
+    text = [col for col, dtype in df.dtypes.items() if pd.api.types.is_object_dtype(dtype)
+            or (isinstance(dtype, pd.StringDtype) and dtype != ARROW_STRING)]
+    return df.astype(dict.fromkeys(text, ARROW_STRING)) if text else df
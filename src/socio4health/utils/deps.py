@@ -3,6 +3,8 @@ from importlib import import_module
 
 OPTIONAL_EXTRAS = {
     'geopandas': 'geo',
+    'dask_geopandas': 'geo',
+    'pyogrio': 'geo',
     'matplotlib': 'viz',
     'transformers': 'ml',
     'torch': 'ml',
@@ -0,0 +1,199 @@
+"""Persistent, content-addressed cache for files downloaded by the Extractor."""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_CACHE_SIZE = 20 * 1024 ** 3
+
+
+class DownloadCache:
+    """
+    Cache of downloaded files that survives between runs.
+
+    Each cached ``URL`` keeps the ``ETag`` and ``Last-Modified`` headers of its last response so that later requests
+    can be made conditional (``If-None-Match`` / ``If-Modified-Since``). File contents are stored once per ``sha256``
+    digest, so identical archives published under several ``URL`` s share the same blob. When the cache grows beyond
+    ``max_size`` bytes the least recently used entries are evicted.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory holding the cache index and the cached files.
+    max_size : int
+        Maximum total size in bytes of the cached files. Defaults to 20 GiB.
+    """
+    INDEX_NAME = 'index.json'
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_CACHE_SIZE):
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be a positive number of bytes")
+        self.cache_dir = str(cache_dir)
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        os.makedirs(os.path.join(self.cache_dir, 'blobs'), exist_ok=True)
+        self._index = self._load_index()
+
+    @property
+    def _index_path(self):
+        return os.path.join(self.cache_dir, self.INDEX_NAME)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as file:
+                index = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable download cache index: {e}")
+            return {}
+        # Drop entries whose blob was removed behind our back
+        return {url: entry for url, entry in index.items() if os.path.exists(self._blob_path(entry['digest']))}
+
+    def _save_index(self):
+        """Merge the in-memory index with the one on disk and write the result, so that several processes sharing
+        the cache do not drop each other's entries"""
+        with _file_lock(self._index_path + '.lock'):
+            index = self._load_index()
+            for url, entry in self._index.items():
+                if url not in index or index[url]['last_access'] <= entry['last_access']:
+                    index[url] = entry
+            # Entries evicted here or by another process have lost their blob
+            self._index = {url: entry for url, entry in index.items()
+                           if os.path.exists(self._blob_path(entry['digest']))}
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self._index, file)
+            os.replace(tmp_path, self._index_path)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, 'blobs', digest[:2], digest)
+
+    def conditional_headers(self, url: str) -> dict:
+        """Return the revalidation headers for a cached ``URL`` (empty if the ``URL`` is not cached)."""
+        with self._lock:
+            entry = self._index.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, filepath: str, etag: str = None, last_modified: str = None) -> str:
+        """Add the downloaded ``filepath`` to the cache under ``url`` and return the path of the cached blob."""
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        digest = digest.hexdigest()
+        blob = self._blob_path(digest)
+
+        with self._lock:
+            if not os.path.exists(blob):
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                _link_or_copy(filepath, blob)
+            self._index[url] = {
+                'digest': digest,
+                'size': os.path.getsize(blob),
+                'etag': etag,
+                'last_modified': last_modified,
+                'last_access': time.time(),
+            }
+            self._evict()
+            self._save_index()
+        return blob
+
+    def materialize(self, url: str, filepath: str) -> str:
+        """Place the cached copy of ``url`` at ``filepath`` and mark it as recently used.
+
+        Raises ``KeyError`` if ``url`` is not cached, e.g. because it was evicted after its request was made.
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                raise KeyError(f"{url} is not cached")
+            blob = self._blob_path(entry['digest'])
+            if not os.path.exists(blob):
+                del self._index[url]
+                raise KeyError(f"{url} was evicted from the cache")
+            if not (os.path.exists(filepath) and os.path.samefile(blob, filepath)):
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                _link_or_copy(blob, filepath)
+            entry['last_access'] = time.time()
+            self._save_index()
+        return filepath
+
+    def discard(self, url: str):
+        """Remove ``url`` from the cache, e.g. when its cached copy turned out to be corrupted."""
+        with self._lock:
+            if url in self._index:
+                self._remove(url)
+                self._save_index()
+
+    def size(self) -> int:
+        """Total size in bytes of the cached blobs."""
+        with self._lock:
+            return sum({e['digest']: e['size'] for e in self._index.values()}.values())
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+        total = self.size()
+        by_age = sorted(self._index.items(), key=lambda item: item[1]['last_access'])
+        while by_age and total > self.max_size:
+            url, entry = by_age.pop(0)
+            if self._remove(url):
+                total -= entry['size']
+            logging.info(f"Evicted from download cache: {url}")
+
+    def _remove(self, url):
+        """Drop ``url`` from the index and delete its blob unless another entry shares it; True if it was deleted"""
+        entry = self._index.pop(url)
+        if any(e['digest'] == entry['digest'] for e in self._index.values()):
+            return False
+        try:
+            os.remove(self._blob_path(entry['digest']))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not remove cached file for {url}: {e}")
+        return True
+
+
+@contextmanager
+def _file_lock(path, timeout=60):
+    """Hold an exclusive lock file, breaking locks left behind for more than ``timeout`` seconds"""
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > timeout:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+
+def _link_or_copy(src, dst):
+    """Hard-link ``src`` to ``dst``, copying when links are not possible (e.g. across file systems)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
@@ -8,9 +8,24 @@ import py7zr
 import os
 import requests
 import hashlib
+import json
+import pandas as pd
+import pyreadstat
+import openpyxl
 import multiprocessing
 import logging
+import threading
+import csv
+import codecs
+import io
+import struct
+from collections import namedtuple, Counter
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from urllib.parse import urlparse
 from importlib import import_module
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
 from socio4health.utils.deps import import_optional
 import zipfile
 import shutil
@@ -92,8 +107,65 @@ def run_standard_spider(url, depth, down_ext, key_words):
         return False
 
 
-def download_request(url, filename, download_dir):
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def _file_digest(filepath, algorithm, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return the hex digest of a file computed with the given ``hashlib`` algorithm"""
+    digest = hashlib.new(algorithm)
+    with open(filepath, 'rb') as file:
+        for block in iter(lambda: file.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _verify_checksum(filepath, checksum):
+    """Check a file against a checksum given as ``'algorithm:hexdigest'`` (``sha256`` if no algorithm is given)"""
+    algorithm, _, expected = checksum.rpartition(':')
+    actual = _file_digest(filepath, algorithm or 'sha256')
+    return actual.lower() == expected.strip().lower()
+
+
+def _use_cached_copy(cache, url, filepath, checksum):
+    """Place the cached copy of an unchanged file at ``filepath``, unless it was evicted or fails its checksum"""
+    try:
+        cache.materialize(url, filepath)
+    except KeyError:
+        logging.info(f"{url} was evicted from the download cache, downloading it again")
+        return False
+    if checksum and not _verify_checksum(filepath, checksum):
+        logging.warning(f"Cached copy of {url} does not match its checksum, downloading it again")
+        os.remove(filepath)
+        cache.discard(url)
+        return False
+    return True
+
+
+def _read_part_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _discard_partial(part_path, meta_path):
+    for path in (part_path, meta_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_request(url, filename, download_dir, session=None, progress=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     checksum=None, cache=None):
     """Download a file from the specified ``URL`` and save it to the given directory.
+
+    Data is first written to ``<filename>.part``. If a previous attempt left a partial file behind, only the missing
+    bytes are requested with an HTTP ``Range`` header, guarded by ``If-Range`` so that a file changed on the server
+    (different ``ETag`` or ``Last-Modified``) is downloaded again from the start. The partial file is renamed to its
+    final name once its size matches the announced ``Content-Length`` and, if given, its checksum matches.
+
+    When a ``cache`` is given, the request is made conditional on the cached ``ETag``/``Last-Modified`` values and an
+    unchanged file (``304 Not Modified``) is taken from the cache instead of being transferred again.
     
     Parameters
     ----------
@@ -103,24 +175,107 @@ def download_request(url, filename, download_dir):
         The name to save the downloaded file.
     download_dir : str
         The directory where the file will be saved.
+    session : requests.Session, optional
+        Session used to issue the request. Sharing one session between downloads reuses pooled connections.
+        Defaults to ``None`` (a one-off request is made).
+    progress : tqdm.tqdm, optional
+        Progress bar updated with the number of bytes written. Default is ``None``.
+    chunk_size : int, optional
+        Size in bytes of the chunks streamed to disk. Default is 1 MiB.
+    checksum : str, optional
+        Expected checksum of the complete file as ``'algorithm:hexdigest'`` (e.g. ``'md5:9e10...'``). A bare digest is
+        treated as ``sha256``. Default is ``None`` (no verification).
+    cache : socio4health.utils.download_cache.DownloadCache, optional
+        Persistent cache used to revalidate and store the download. Default is ``None``.
     
     Returns
     -------
     str
-        The path to the downloaded file, or ``None`` if the download failed.
+        The path to the downloaded file, or ``None`` if the download failed. An interrupted download keeps its
+        ``.part`` file so the next call resumes it.
 
     """
+    http = session or requests
+    filepath = os.path.join(download_dir, filename)
+    part_path = filepath + '.part'
+    meta_path = part_path + '.json'
+
+    meta = _read_part_meta(meta_path) if os.path.exists(part_path) else {}
+    offset = os.path.getsize(part_path) if meta else 0
+    headers = {}
+    if offset:
+        headers['Range'] = f"bytes={offset}-"
+        etag = meta.get('etag')
+        validator = etag if etag and not etag.startswith('W/') else meta.get('last_modified')
+        if validator:
+            headers['If-Range'] = validator
+    elif cache is not None:
+        headers.update(cache.conditional_headers(url))
+
     try:
         # Request to download
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-
-        filepath = os.path.join(download_dir, filename)
-        # Save file to the directory
-        with open(filepath, 'wb') as file:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    file.write(chunk)
+        response = http.get(url, stream=True, headers=headers)
+        if response.status_code == 304 and cache is not None:
+            response.close()
+            if _use_cached_copy(cache, url, filepath, checksum):
+                logging.info(f"Not modified since last download, using cached copy: {filename}")
+                return filepath
+            response = http.get(url, stream=True)
+        if response.status_code == 416 and offset:
+            # Nothing left to request: the partial file is either complete or does not match the remote file
+            response.close()
+            if offset != meta.get('total'):
+                _discard_partial(part_path, meta_path)
+                raise requests.exceptions.RequestException("partial file does not match the remote file, discarded")
+        else:
+            response.raise_for_status()
+            resumed = response.status_code == 206
+            if resumed and not response.headers.get('Content-Range', '').startswith(f"bytes {offset}-"):
+                raise requests.exceptions.RequestException(
+                    f"unexpected Content-Range {response.headers.get('Content-Range')!r}")
+            if resumed and meta.get('etag') and response.headers.get('ETag') not in (None, meta['etag']):
+                raise requests.exceptions.RequestException("file changed on the server while resuming")
+            if not resumed:
+                if offset:
+                    logging.info(f"Server does not support resuming {filename}, restarting download")
+                offset = 0
+
+            length = response.headers.get('Content-Length')
+            meta = {
+                'url': url,
+                'etag': response.headers.get('ETag', meta.get('etag') if resumed else None),
+                'last_modified': response.headers.get('Last-Modified', meta.get('last_modified') if resumed else None),
+                'total': offset + int(length) if length is not None else None,
+            }
+            with open(meta_path, 'w', encoding='utf-8') as file:
+                json.dump(meta, file)
+
+            if offset and progress is not None:
+                progress.update(offset)
+            # Save file to the directory
+            with open(part_path, 'ab' if resumed else 'wb') as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        file.write(chunk)
+                        if progress is not None:
+                            progress.update(len(chunk))
+
+        size = os.path.getsize(part_path)
+        if meta.get('total') is not None and size != meta['total']:
+            logging.error(f"Incomplete download of {filename}: {size} of {meta['total']} bytes, will resume on next run")
+            return None
+        if checksum and not _verify_checksum(part_path, checksum):
+            logging.error(f"Checksum mismatch for {filename}, discarding downloaded data")
+            _discard_partial(part_path, meta_path)
+            return None
+
+        os.replace(part_path, filepath)
+        os.remove(meta_path)
+        if cache is not None:
+            try:
+                cache.store(url, filepath, etag=meta.get('etag'), last_modified=meta.get('last_modified'))
+            except OSError as e:
+                logging.warning(f"Could not add {filename} to the download cache: {e}")
         logging.info(f"Successfully downloaded: {filename}")
         return filepath
     except requests.exceptions.RequestException as e:
@@ -128,9 +283,155 @@ def download_request(url, filename, download_dir):
         return None
 
 
-def compressed2files(input_archive, target_directory, down_ext, current_depth=0, max_depth=5, found_files=set()):
+def _build_session(pool_size):
+    """Create a ``requests`` session whose connection pool can serve ``pool_size`` concurrent downloads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class _LockedProgress:
+    """Thread-safe proxy around a ``tqdm`` bar shared by several download workers"""
+
+    def __init__(self, bar):
+        self._bar = bar
+        self._lock = threading.Lock()
+
+    def update(self, n):
+        with self._lock:
+            self._bar.update(n)
+
+
+def download_files(links, download_dir, max_workers=4, max_per_host=2, session=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                   checksums=None, cache=None):
+    """Download several files concurrently using a bounded pool of worker threads.
+
+    All workers share a single pooled ``requests.Session`` and a byte-level progress bar.
+    The number of simultaneous connections to the same host is capped by ``max_per_host``
+    so that statistical offices' servers are not flooded.
+
+    Parameters
+    ----------
+    links : dict
+        Mapping of file names to the ``URL`` they should be downloaded from.
+    download_dir : str
+        The directory where the files will be saved.
+    max_workers : int, optional
+        Maximum number of downloads running at the same time. Default is 4.
+    max_per_host : int, optional
+        Maximum number of simultaneous downloads from a single host. Default is 2.
+    session : requests.Session, optional
+        Session to reuse. If ``None``, a session with a connection pool sized to ``max_workers`` is created.
+    chunk_size : int, optional
+        Size in bytes of the chunks streamed to disk. Default is 1 MiB.
+    checksums : dict, optional
+        Mapping of file names to the checksum their content must match (see :func:`download_request`).
+    cache : socio4health.utils.download_cache.DownloadCache, optional
+        Persistent cache used to skip files that did not change since the previous run. Default is ``None``.
+
+    Returns
+    -------
+    tuple
+        ``(downloaded, failed)`` where ``downloaded`` is the list of downloaded file paths in the same order as
+        ``links`` and ``failed`` is a list of ``(filename, reason)`` tuples.
+    """
+    if max_workers < 1 or max_per_host < 1:
+        raise ValueError("max_workers and max_per_host must be positive integers")
+
+    checksums = checksums or {}
+    own_session = session is None
+    session = session or _build_session(max_workers)
+    host_limits = {}
+    for url in links.values():
+        host = urlparse(url).netloc
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(max_per_host)
+
+    def _worker(filename, url):
+        with host_limits[urlparse(url).netloc]:
+            return download_request(url, filename, download_dir, session=session, progress=progress,
+                                    chunk_size=chunk_size, checksum=checksums.get(filename), cache=cache)
+
+    downloaded = []
+    failed = []
+    try:
+        with tqdm(desc="Downloading files", unit='B', unit_scale=True, unit_divisor=1024) as bar:
+            progress = _LockedProgress(bar)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(filename, executor.submit(_worker, filename, url)) for filename, url in links.items()]
+                for filename, future in futures:
+                    try:
+                        filepath = future.result()
+                    except Exception as e:
+                        logging.warning(f"Failed to download {filename}: {e}")
+                        failed.append((filename, str(e)))
+                        continue
+                    if filepath is None:
+                        failed.append((filename, "download failed"))
+                    else:
+                        downloaded.append(filepath)
+    finally:
+        if own_session:
+            session.close()
+
+    return downloaded, failed
+
+
+NESTED_ARCHIVE_EXT = ('.zip', '.7z', '.tar', '.gz', '.tgz')
+
+
+def _member_dest(source, member_name, target_directory):
+    """Build the flattened, collision-free destination path of an archive member"""
+    archive_hash = hashlib.md5(source.encode()).hexdigest()[:8]
+    parent_folders = member_name.replace('\\', '/').strip('/').replace('/', '_')
+    return os.path.join(target_directory, f"{archive_hash}_{parent_folders}")
+
+
+def _zip_members(input_archive):
+    """Yield ``(name, open_member)`` pairs for the files of a zip archive, falling back to ``pyzipper`` when needed"""
+    with zipfile.ZipFile(input_archive, 'r') as zip_ref:
+        fallback = None
+        try:
+            for zinfo in zip_ref.infolist():
+                if zinfo.is_dir():
+                    continue
+                if getattr(zinfo, 'compress_type', None) == 9 and fallback is None:
+                    logging.warning(f"Extracting Deflate64-compressed zip file: {input_archive}. This may take a while...")
+
+                def open_member(zinfo=zinfo):
+                    nonlocal fallback
+                    try:
+                        return zip_ref.open(zinfo)
+                    except NotImplementedError as e:
+                        if fallback is None:
+                            logging.warning(f"zipfile failed for {input_archive}: {e}. Trying pyzipper fallback.")
+                            fallback = pyzipper.ZipFile(input_archive, 'r')
+                        return fallback.open(zinfo.filename)
+
+                yield zinfo.filename, open_member
+        finally:
+            if fallback is not None:
+                fallback.close()
+
+
+def _tar_members(input_archive):
+    """Yield ``(name, open_member)`` pairs for the regular files of a tar archive, reading it as a stream"""
+    with tarfile.open(input_archive, 'r:*') as tar_ref:
+        for member in tar_ref:
+            if member.isfile():
+                yield member.name, lambda member=member: tar_ref.extractfile(member)
+
+
+def compressed2files(input_archive, target_directory, down_ext, current_depth=0, max_depth=5, found_files=set(),
+                     source=None, skip=None):
     """Extract files from a compressed archive and return the paths of the extracted files.
 
+    The member list of the archive is inspected first and only members whose extension is in ``down_ext`` are
+    decompressed, each one written straight to its final location in ``target_directory``. Nested archives are
+    copied out one at a time and processed recursively, without expanding the rest of their parent.
+
     Parameters
     ----------
     input_archive : str
@@ -144,7 +445,12 @@ def compressed2files(input_archive, target_directory, down_ext, current_depth=0,
     max_depth : int, optional
         The maximum depth of extraction is to prevent infinite recursion. Default is 5.
     found_files : set, optional
-        A set to keep track of already found files, used to avoid duplicates. Default is an empty set.
+        Unused, kept for backwards compatibility.
+    source : str, optional
+        Name used to build the unique prefix of the extracted files. Defaults to ``input_archive``; nested archives
+        use ``<parent source>/<member name>`` so that their output names are stable between runs.
+    skip : collection of str, optional
+        Names of members of ``input_archive`` to leave untouched (e.g. because they are read in place).
 
     Returns
     -------
@@ -158,86 +464,699 @@ def compressed2files(input_archive, target_directory, down_ext, current_depth=0,
         logging.warning(f"Max depth {max_depth} reached")
         return set()
 
+    source = source or input_archive
+    wanted_ext = {ext.lower() for ext in down_ext}
+    skip = set(skip or ())
     found_files = set()
+    skipped = []
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        try:
-            # Extract the archive
-            if zipfile.is_zipfile(input_archive):
-                try:
-                    with zipfile.ZipFile(input_archive, 'r') as zip_ref:
-                        for zinfo in zip_ref.infolist():
-                            if getattr(zinfo, 'compress_type', None) == 9:
-                                logging.warning(f"Extracting Deflate64-compressed zip file: {input_archive}. This may take a while...")
-                                break
-                        zip_ref.extractall(temp_dir)
-                except NotImplementedError as e:
-                    logging.warning(f"zipfile failed for {input_archive}: {e}. Trying pyzipper fallback.")
-                    try:
-                        with pyzipper.ZipFile(input_archive, 'r') as zip_ref:
-                            zip_ref.extractall(temp_dir)
-                    except Exception as e2:
-                        logging.error(f"pyzipper extraction failed for {input_archive}: {e2}")
-                        return set()
-            elif tarfile.is_tarfile(input_archive):
-                with tarfile.open(input_archive, 'r:*') as tar_ref:
-                    tar_ref.extractall(temp_dir)
-            elif input_archive.endswith('.7z'):
-                with py7zr.SevenZipFile(input_archive, mode='r') as z_ref:
-                    z_ref.extractall(temp_dir)
-            else:
-                logging.error(f"Unsupported format: {input_archive}")
-                return set()
-
-            # Process all extracted items
-            for root, dirs, files in os.walk(temp_dir):
-                for name in files:
-                    item_path = os.path.join(root, name)
-                    rel_path = os.path.relpath(item_path, temp_dir)
-
-                    # Handle nested archives
-                    if any(item_path.endswith(ext) for ext in ['.zip', '.7z', '.tar', '.gz']):
-                        found_files.update(compressed2files(
-                            item_path,
-                            target_directory,
-                            down_ext,
-                            current_depth + 1,
-                            max_depth
-                        ))
-
-                    # Handle regular files with matching extensions
-                    else:
-                        file_ext = os.path.splitext(name)[1].lower()
-                        if any(file_ext == ext.lower() for ext in down_ext):
-                            # Create unique filename with archive path hash
-                            archive_hash = hashlib.md5(input_archive.encode()).hexdigest()[:8]
-                            parent_folders = rel_path.replace(os.path.sep, '_')
-                            unique_name = f"{archive_hash}_{parent_folders}"
-                            dest_path = os.path.join(target_directory, unique_name)
-
-                            # Ensure parent directory exists
-                            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-
-                            # Always move the file (no duplicate checking)
-                            shutil.move(item_path, dest_path)
-                            found_files.add(dest_path)
-                            logging.info(f"Extracted: {unique_name}")
+    def handle_member(name, open_member):
+        if name in skip:
+            return
+        if name.lower().endswith(NESTED_ARCHIVE_EXT):
+            # Only this member is copied out, so it can be opened as an archive on its own
+            fd, nested_path = tempfile.mkstemp(dir=target_directory, suffix=os.path.splitext(name)[1])
+            try:
+                with os.fdopen(fd, 'wb') as out, open_member() as stream:
+                    shutil.copyfileobj(stream, out, DEFAULT_CHUNK_SIZE)
+                found_files.update(compressed2files(
+                    nested_path,
+                    target_directory,
+                    down_ext,
+                    current_depth + 1,
+                    max_depth,
+                    source=f"{source}/{name}"
+                ))
+            finally:
+                os.remove(nested_path)
+        elif os.path.splitext(name)[1].lower() in wanted_ext:
+            dest_path = _member_dest(source, name, target_directory)
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            with open_member() as stream, open(dest_path, 'wb') as out:
+                shutil.copyfileobj(stream, out, DEFAULT_CHUNK_SIZE)
+            found_files.add(dest_path)
+            logging.info(f"Extracted: {os.path.basename(dest_path)}")
+        else:
+            skipped.append(name)
 
-        except Exception as e:
-            logging.error(f"Failed to process {input_archive}: {str(e)}", exc_info=True)
+    try:
+        os.makedirs(target_directory, exist_ok=True)
+        if zipfile.is_zipfile(input_archive):
+            for name, open_member in _zip_members(input_archive):
+                handle_member(name, open_member)
+        elif tarfile.is_tarfile(input_archive):
+            for name, open_member in _tar_members(input_archive):
+                handle_member(name, open_member)
+        elif input_archive.endswith('.7z'):
+            with py7zr.SevenZipFile(input_archive, mode='r') as z_ref:
+                names = [info.filename for info in z_ref.list() if not info.is_directory]
+            selected = [n for n in names
+                        if n.lower().endswith(NESTED_ARCHIVE_EXT) or os.path.splitext(n)[1].lower() in wanted_ext]
+            skipped.extend(n for n in names if n not in selected)
+            if selected:
+                # py7zr cannot stream single members, so only the selected ones are decompressed into a staging
+                # folder on the target's file system and then renamed (not copied) into place
+                with tempfile.TemporaryDirectory(dir=target_directory) as staging:
+                    with py7zr.SevenZipFile(input_archive, mode='r') as z_ref:
+                        z_ref.extract(path=staging, targets=selected)
+                    for name in selected:
+                        staged = os.path.join(staging, name)
+                        if name.lower().endswith(NESTED_ARCHIVE_EXT):
+                            handle_member(name, lambda staged=staged: open(staged, 'rb'))
+                        else:
+                            dest_path = _member_dest(source, name, target_directory)
+                            os.replace(staged, dest_path)
+                            found_files.add(dest_path)
+                            logging.info(f"Extracted: {os.path.basename(dest_path)}")
+        else:
+            logging.error(f"Unsupported format: {input_archive}")
             return set()
 
-    if not found_files:
-        logging.warning(f"No matches in {os.path.basename(input_archive)}. Contents:")
-        for root, dirs, files in os.walk(temp_dir):
-            for f in files:
-                logging.info(f"  Found: {os.path.relpath(os.path.join(root, f), temp_dir)}")
+    except Exception as e:
+        logging.error(f"Failed to process {input_archive}: {str(e)}", exc_info=True)
+        return set()
 
-    if not found_files:
-            logging.warning("No files found matching the specified extensions.")
+    if not found_files and not skip:
+        logging.warning(f"No matches in {os.path.basename(input_archive)}. Contents:")
+        for name in skipped:
+            logging.info(f"  Found: {name}")
 
     return found_files
 
+def _run_compressed2files(kwargs):
+    return sorted(compressed2files(**kwargs))
+
+
+def process_pool_context():
+    """``multiprocessing`` context of the process pools of the Extractor.
+
+    Processes are spawned: forked children of a process running Dask or pyarrow threads can deadlock.
+    """
+    return multiprocessing.get_context('spawn')
+
+
+def extract_archives(jobs, max_workers=1):
+    """Run :func:`compressed2files` for several archives, decompressing them in parallel processes.
+
+    Parameters
+    ----------
+    jobs : list of dict
+        Keyword arguments of one :func:`compressed2files` call per archive.
+    max_workers : int, optional
+        Number of worker processes. With ``1`` the archives are extracted sequentially in the current process.
+        Default is 1.
+
+    Returns
+    -------
+    list of list of str
+        For each job, in the same order, the sorted paths of the extracted files.
+    """
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [_run_compressed2files(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs)), mp_context=process_pool_context()) as executor:
+        return list(tqdm(executor.map(_run_compressed2files, jobs), total=len(jobs), desc="Extracting archives"))
+
+
+ArchiveMember = namedtuple('ArchiveMember', ['archive', 'name', 'size'])
+ArchiveMember.__doc__ = """A file stored inside a zip archive that is read in place instead of being extracted"""
+
+
+def list_archive_members(input_archive, extensions):
+    """List the files of a zip archive whose extension is in ``extensions``.
+
+    Parameters
+    ----------
+    input_archive : str
+        The path to the zip archive.
+    extensions : collection of str
+        File extensions to keep (case insensitive).
+
+    Returns
+    -------
+    list of ArchiveMember
+        The matching members, in archive order.
+    """
+    wanted_ext = {ext.lower() for ext in extensions}
+    with zipfile.ZipFile(input_archive, 'r') as zip_ref:
+        return [ArchiveMember(input_archive, zinfo.filename, zinfo.file_size)
+                for zinfo in zip_ref.infolist()
+                if not zinfo.is_dir() and os.path.splitext(zinfo.filename)[1].lower() in wanted_ext]
+
+
+def read_archive_member(member, reader='csv', stream=None, **kwargs):
+    """Read a tabular member of a zip archive into a pandas DataFrame by streaming it from the archive.
+
+    This is meant to run inside Dask partition tasks, so that nothing is written to disk.
+
+    Parameters
+    ----------
+    member : ArchiveMember
+        The archive member to read.
+    reader : str, optional
+        ``'csv'`` to parse delimited text with ``pandas.read_csv``, ``'arrow'`` to parse it with
+        :func:`socio4health.utils.csv_reader.read_csv_arrow` or ``'fwf'`` for fixed-width text with
+        ``pandas.read_fwf``. Default is ``'csv'``.
+    stream : file-like, optional
+        Bytes of the member already read, e.g. by :func:`read_member_block`. Default is ``None`` (the member is
+        streamed from the archive).
+    **kwargs
+        Keyword arguments forwarded to the reader.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The parsed member.
+    """
+    if reader == 'arrow':
+        from socio4health.utils.csv_reader import read_csv_arrow as read
+    else:
+        read = pd.read_fwf if reader == 'fwf' else pd.read_csv
+    if stream is not None:
+        return read(stream, **kwargs)
+    with _open_member(member) as stream:
+        return read(stream, **kwargs)
+
+
+LARGE_MEMBER_SIZE = 1024 ** 3
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+
+def member_blocks(member, blocksize):
+    """Split an uncompressed archive member into byte ranges of whole lines of the archive file.
+
+    Members stored without compression (and without encryption) are plain bytes inside the archive, so each range
+    can be read with a seek, like a regular file. Compressed members can only be decompressed from their start, so
+    they are not split.
+
+    Parameters
+    ----------
+    member : ArchiveMember
+        The archive member.
+    blocksize : int
+        Approximate size in bytes of each range.
+
+    Returns
+    -------
+    list of tuple or None
+        ``(start, end)`` byte offsets of each range in the archive file, end exclusive, or ``None`` when the member
+        is compressed or encrypted.
+    """
+    with zipfile.ZipFile(member.archive, 'r') as zip_ref:
+        zinfo = zip_ref.getinfo(member.name)
+    if zinfo.compress_type != zipfile.ZIP_STORED or zinfo.flag_bits & 0x1:
+        return None
+    with open(member.archive, 'rb') as file:
+        file.seek(zinfo.header_offset)
+        fields = _LOCAL_HEADER.unpack(file.read(_LOCAL_HEADER.size))
+    start = zinfo.header_offset + _LOCAL_HEADER.size + fields[-2] + fields[-1]
+    return line_blocks(member.archive, blocksize, offset=start, end=start + zinfo.compress_size)
+
+
+def read_member_block(member, start, end, first, reader='csv', **kwargs):
+    """Read a byte range found by :func:`member_blocks` into a pandas DataFrame.
+
+    Parameters
+    ----------
+    member : ArchiveMember
+        The archive member.
+    start, end : int
+        Byte range of the archive file to read.
+    first : bool
+        Whether the range is the first one of the member, holding the lines skipped by ``skiprows`` and the header.
+        Later ranges are parsed without them.
+    reader : str, optional
+        Reader of the text, see :func:`read_archive_member`. ``'csv'`` ranges need ``names`` and ``header=0``.
+    **kwargs
+        Keyword arguments forwarded to the reader.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The parsed rows.
+    """
+    with open(member.archive, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    if not first and reader != 'fwf':
+        kwargs.update(skiprows=0, header=None if reader == 'csv' else False)
+    return read_archive_member(member, reader, stream=io.BytesIO(data), **kwargs)
+
+
+@contextmanager
+def _open_member(member):
+    """Binary stream of an archive member, through ``pyzipper`` for compression methods ``zipfile`` lacks"""
+    with zipfile.ZipFile(member.archive, 'r') as zip_ref:
+        try:
+            stream = zip_ref.open(member.name)
+        except NotImplementedError:
+            with pyzipper.ZipFile(member.archive, 'r') as fallback, fallback.open(member.name) as stream:
+                yield stream
+            return
+        with stream:
+            yield stream
+
+
+def read_sav_chunk(filepath, row_offset, row_limit, encoding=None, usecols=None):
+    """Read a block of rows of an SPSS ``.sav`` file with ``pyreadstat``.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the ``.sav`` file.
+    row_offset : int
+        Index of the first row to read.
+    row_limit : int
+        Maximum number of rows to read.
+    encoding : str, optional
+        Character encoding of the file. Default is ``None`` (detected by ``pyreadstat``).
+    usecols : list of str, optional
+        Columns to read. Default is ``None`` (all columns).
+
+    Returns
+    -------
+    pandas.DataFrame
+        The requested rows.
+    """
+    df, _ = pyreadstat.read_sav(filepath, encoding=encoding, usecols=usecols,
+                                row_offset=row_offset, row_limit=row_limit)
+    return df
+
+
+def line_blocks(filepath, blocksize, offset=0, end=None):
+    """Split a text file into byte ranges of whole lines.
+
+    Each range ends at the first line break after ``blocksize`` bytes, so the file is not read, only sought.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file.
+    blocksize : int
+        Approximate size in bytes of each range.
+    offset : int
+        Byte where the first range starts (e.g. to skip a byte order mark). Defaults to ``0``.
+    end : int, optional
+        Byte where the last range ends. Defaults to ``None`` (the end of the file).
+
+    Returns
+    -------
+    list of tuple
+        ``(start, end)`` byte offsets of each range, end exclusive.
+    """
+    size = os.path.getsize(filepath) if end is None else end
+    blocks = []
+    with open(filepath, 'rb') as file:
+        start = offset
+        while start < size:
+            file.seek(min(start + blocksize, size))
+            file.readline()
+            end = min(file.tell(), size)
+            blocks.append((start, end))
+            start = end
+    return blocks
+
+
+DEFAULT_SNIFF_SIZE = 64 * 1024
+SNIFF_DELIMITERS = ',;\t|'
+_UTF8_BOM = codecs.BOM_UTF8
+
+TextDialect = namedtuple('TextDialect', ['sep', 'quotechar', 'skiprows', 'encoding'])
+
+
+def read_head(source, size=DEFAULT_SNIFF_SIZE):
+    """Read the first ``size`` bytes of a file path or of an :class:`ArchiveMember`."""
+    if isinstance(source, ArchiveMember):
+        with _open_member(source) as stream:
+            return stream.read(size)
+    with open(source, 'rb') as file:
+        return file.read(size)
+
+
+def _sniff_encoding(head, encoding):
+    if head.startswith(_UTF8_BOM):
+        return 'utf-8-sig'
+    if head.isascii() or codecs.lookup(encoding).name == 'utf-8':
+        return encoding
+    try:
+        # The head may end in the middle of a character
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return encoding
+    return 'utf-8'
+
+
+def sniff_text(head, sep=None, encoding='latin1', default_sep=','):
+    """Detect how a delimited text file is written from its first bytes.
+
+    Parameters
+    ----------
+    head : bytes
+        First bytes of the file (see :func:`read_head`).
+    sep : str, optional
+        Expected field delimiter, used when it appears in the text. Default is ``None`` (detected among ``,``,
+        ``;``, tab and ``|``).
+    encoding : str, optional
+        Expected character encoding. A UTF-8 byte order mark gives ``'utf-8-sig'``, and non-``ASCII`` text that is
+        valid UTF-8 gives ``'utf-8'``; otherwise ``encoding`` is kept. Default is ``'latin1'``. Only ``head`` is
+        examined: a file whose first non-``ASCII`` character comes after it keeps ``encoding``, so UTF-8 files of
+        that kind need ``encoding='utf-8'``.
+    default_sep : str, optional
+        Delimiter used when ``sep`` is ``None`` and none is detected. Default is ``','``.
+
+    Returns
+    -------
+    TextDialect
+        ``(sep, quotechar, skiprows, encoding)``, where ``skiprows`` is the number of lines (titles, notes...) before
+        the header line. Leading lines are skipped while they have fewer fields than the usual number and than the
+        next non-blank line; a trailing delimiter does not count as a field.
+    """
+    encoding = _sniff_encoding(head, encoding)
+    text = head.decode(encoding, errors='replace')
+    lines = text.splitlines()
+    if len(head) == DEFAULT_SNIFF_SIZE and len(lines) > 1:
+        # The last line may be cut
+        lines = lines[:-1]
+    lines = lines[:100]
+    sample = '\n'.join(line for line in lines if line.strip())
+
+    if sep is not None and sep not in sample:
+        sep = None
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=sep or SNIFF_DELIMITERS)
+        delimiter, quotechar = dialect.delimiter, dialect.quotechar or '"'
+    except csv.Error:
+        delimiter, quotechar = sep or default_sep, '"'
+
+    # A trailing delimiter ('1;2;3;') does not add a field
+    counts = [len(row) - next((i for i, field in enumerate(reversed(row)) if field), len(row))
+              for row in csv.reader(lines, delimiter=delimiter, quotechar=quotechar)]
+    skiprows = 0
+    if counts:
+        usual = Counter(count for count in counts if count).most_common(1)[0][0] if any(counts) else 0
+        # Only lines with fewer fields than the usual and than the next line are titles; a line with as many
+        # fields as the header is never skipped
+        while usual > 1 and skiprows < len(counts) - 1 and counts[skiprows] < usual:
+            following = next((count for count in counts[skiprows + 1:] if count), 0)
+            if counts[skiprows] >= following:
+                break
+            skiprows += 1
+    return TextDialect(delimiter, quotechar, skiprows, encoding)
+
+
+def count_geo_features(filepath, layer=None, bbox=None, where=None):
+    """Count the features of a geospatial file that pass the ``bbox``/``where`` filters, without reading geometries.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the geospatial file (``.shp``, ``.geojson``, ``.kml``...).
+    layer : str or int, optional
+        Layer to read. Default is ``None`` (the first layer).
+    bbox : tuple, optional
+        ``(xmin, ymin, xmax, ymax)`` bounding box, in the coordinates of the file, that features must intersect.
+    where : str, optional
+        ``SQL`` ``WHERE`` clause on the attributes (e.g. ``"UF = 'SP'"``).
+
+    Returns
+    -------
+    int
+        Number of matching features.
+    """
+    pyogrio = import_optional('pyogrio', extra='geo')
+    if bbox is None and where is None:
+        features = pyogrio.read_info(filepath, layer=layer)['features']
+        if features >= 0:
+            return features
+    return len(geo_feature_ids(filepath, layer=layer, bbox=bbox, where=where))
+
+
+def geo_feature_ids(filepath, layer=None, bbox=None, where=None):
+    """Feature ids (FIDs) of the features of a geospatial file that pass the ``bbox``/``where`` filters.
+
+    Only the bounds of the geometries are read.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the geospatial file.
+    layer, bbox, where
+        See :func:`count_geo_features`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The FIDs of the matching features, in file order.
+    """
+    pyogrio = import_optional('pyogrio', extra='geo')
+    fids, _ = pyogrio.read_bounds(filepath, layer=layer, bbox=bbox, where=where)
+    return fids
+
+
+def read_geo_chunk(filepath, skip_features, max_features, layer=None, bbox=None, where=None, columns=None):
+    """Read a block of features of a geospatial file with ``pyogrio``.
+
+    Filters are applied by the reader, so ``skip_features`` counts matching features only. The reader steps over
+    the skipped features, which is cheap for drivers with random access (Shapefile, GeoPackage) when nothing is
+    filtered. Filtered files are better read by feature id with :func:`read_geo_features`.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the geospatial file.
+    skip_features : int
+        Number of matching features to skip.
+    max_features : int
+        Maximum number of features to read.
+    layer, bbox, where
+        See :func:`count_geo_features`.
+    columns : list of str, optional
+        Attribute columns to read. Default is ``None`` (all columns).
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        The requested features.
+    """
+    pyogrio = import_optional('pyogrio', extra='geo')
+    return pyogrio.read_dataframe(filepath, layer=layer, bbox=bbox, where=where, columns=columns,
+                                  skip_features=skip_features, max_features=max_features)
+
+
+def read_geo_features(filepath, fids, layer=None, columns=None):
+    """Read the features of a geospatial file with the given feature ids, found by :func:`geo_feature_ids`.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the geospatial file.
+    fids : array-like of int
+        Feature ids to read.
+    layer : str or int, optional
+        Layer to read. Default is ``None`` (the first layer).
+    columns : list of str, optional
+        Attribute columns to read. Default is ``None`` (all columns).
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        The requested features, in feature id order.
+    """
+    pyogrio = import_optional('pyogrio', extra='geo')
+    gdf = pyogrio.read_dataframe(filepath, layer=layer, columns=columns, fids=fids, fid_as_index=True)
+    return gdf.sort_index().reset_index(drop=True)
+
+
+ExcelSheet = namedtuple('ExcelSheet', ['name', 'rows'])
+
+
+def _streams_excel(filepath, engine):
+    """Whether ``filepath`` can be read row by row with ``openpyxl`` in read-only mode"""
+    return engine in (None, 'openpyxl') and os.path.splitext(filepath)[1].lower() in ('.xlsx', '.xlsm')
+
+
+def list_excel_sheets(filepath, engine=None):
+    """List the sheets of an Excel workbook without loading their cells.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the workbook.
+    engine : str, optional
+        Engine used to read the workbook. ``None`` or ``'openpyxl'`` open ``.xlsx``/``.xlsm`` files in read-only
+        mode; any other engine (and ``.xls`` files) goes through ``pandas.ExcelFile``.
+
+    Returns
+    -------
+    list of ExcelSheet
+        ``(name, rows)`` of each sheet in workbook order. ``rows`` is the number of rows declared by the sheet
+        (header included), or ``None`` when it is unknown.
+    """
+    if not _streams_excel(filepath, engine):
+        with pd.ExcelFile(filepath, engine=engine) as workbook:
+            return [ExcelSheet(name, None) for name in workbook.sheet_names]
+    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        return [ExcelSheet(sheet.title, sheet.max_row) for sheet in workbook.worksheets]
+    finally:
+        workbook.close()
+
+
+def read_excel_chunk(filepath, sheet, row_offset=0, row_limit=None, dtype=None, engine=None):
+    """Read a block of data rows of an Excel sheet.
+
+    The first row of the sheet is the header. With ``openpyxl`` the rows are streamed in read-only mode and the
+    block is selected by row number, so only the requested rows are held in memory; fully empty rows are skipped.
+    Other engines (and ``.xls`` files) load the whole sheet, so they should be read in a single block.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the workbook.
+    sheet : str
+        Name of the sheet.
+    row_offset : int
+        Index of the first data row to read (``0`` is the row following the header).
+    row_limit : int, optional
+        Maximum number of data rows to read. Default is ``None`` (up to the end of the sheet).
+    dtype : str or dict, optional
+        Data type(s) applied to the columns. Default is ``None`` (types as stored in the workbook).
+    engine : str, optional
+        Engine used to read the workbook, see :func:`list_excel_sheets`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The requested rows.
+    """
+    if not _streams_excel(filepath, engine):
+        return pd.read_excel(filepath, sheet_name=sheet, skiprows=range(1, row_offset + 1), nrows=row_limit,
+                             dtype=dtype, engine=engine)
+
+    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet]
+        header = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        if header is None:
+            return pd.DataFrame()
+        columns = [f"Unnamed: {i}" if name is None else str(name) for i, name in enumerate(header)]
+        stop = None if row_limit is None else row_offset + row_limit + 1
+        rows = worksheet.iter_rows(min_row=row_offset + 2, max_row=stop, values_only=True)
+        records = [row[:len(columns)] for row in rows if any(value is not None for value in row)]
+    finally:
+        workbook.close()
+    df = pd.DataFrame.from_records(records, columns=columns)
+    return df.astype(dtype) if dtype is not None else df
+
+
+_FILTER_OPERATORS = {
+    '==': lambda column, value: column == value,
+    '=': lambda column, value: column == value,
+    '!=': lambda column, value: column != value,
+    '<': lambda column, value: column < value,
+    '<=': lambda column, value: column <= value,
+    '>': lambda column, value: column > value,
+    '>=': lambda column, value: column >= value,
+    'in': lambda column, value: column.isin(list(value)),
+    'not in': lambda column, value: ~column.isin(list(value)),
+}
+
+
+def normalize_filters(filters):
+    """Validate a filter expression and put it in disjunctive normal form.
+
+    Parameters
+    ----------
+    filters : list
+        ``(column, op, value)`` predicates, as a list of predicates that must all hold or a list of such lists of
+        which at least one must hold (see :func:`filter_rows`).
+
+    Returns
+    -------
+    list of list of tuple or None
+        The predicates grouped in lists of which at least one must hold, or ``None`` when ``filters`` is empty.
+
+    Raises
+    ------
+    ValueError
+        If a predicate is not a ``(column, op, value)`` tuple or uses an unsupported operator.
+    """
+    if not filters:
+        return None
+    if all(isinstance(predicate, tuple) for predicate in filters):
+        filters = [filters]
+    normalized = []
+    for conjunction in filters:
+        predicates = []
+        for predicate in conjunction:
+            if not isinstance(predicate, (tuple, list)) or len(predicate) != 3:
+                raise ValueError(f"Filters must be (column, operator, value) tuples, got {predicate!r}")
+            column, op, value = predicate
+            op = op.lower()
+            if op not in _FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator {op!r}; use one of {list(_FILTER_OPERATORS)}")
+            if op in ('in', 'not in'):
+                value = list(value)
+            predicates.append((column, op, value))
+        normalized.append(predicates)
+    return normalized
+
+
+def resolve_filters(filters, columns):
+    """Map the columns of a normalized filter expression to the columns of a frame, case-insensitively.
+
+    Parameters
+    ----------
+    filters : list of list of tuple
+        Filter expression returned by :func:`normalize_filters`.
+    columns : iterable of str
+        Columns of the frame.
+
+    Returns
+    -------
+    list of list of tuple or None
+        The expression with the matching column names, or ``None`` if one of its columns is missing.
+    """
+    by_name = {str(col).strip().upper(): col for col in columns}
+    resolved = []
+    for conjunction in filters:
+        predicates = []
+        for column, op, value in conjunction:
+            name = by_name.get(str(column).strip().upper())
+            if name is None:
+                return None
+            predicates.append((name, op, value))
+        resolved.append(predicates)
+    return resolved
+
+
+def filter_rows(df, filters):
+    """Keep the rows of a DataFrame matching a filter expression.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame to filter, typically one partition of a Dask DataFrame.
+    filters : list
+        ``(column, op, value)`` predicates in disjunctive normal form, as in ``pyarrow`` and
+        ``dask.dataframe.read_parquet``: a list of predicates that must all hold, or a list of such lists of which at
+        least one must hold. Operators are ``==``, ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and ``not in``.
+        Missing values never match.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The matching rows.
+    """
+    mask = pd.Series(False, index=df.index)
+    for conjunction in normalize_filters(filters) or []:
+        matches = pd.Series(True, index=df.index)
+        for column, op, value in conjunction:
+            matches &= _FILTER_OPERATORS[op](df[column], value).fillna(False).astype(bool)
+        mask |= matches
+    return df[mask]
+
+
 def create_unique_path(archive_path, filename, target_dir):
     """Generate unique destination path"""
     archive_name = os.path.splitext(os.path.basename(archive_path))[0]
@@ -293,3 +1212,45 @@ def s4h_parse_fwf_dict(dict_df):
             colspecs.append((start, end))
 
     return colnames, colspecs
+
+
+FWF_DATA_TYPES = {
+    'int': 'Int64', 'integer': 'Int64', 'float': 'float64', 'numeric': 'float64', 'num': 'float64',
+    'str': 'object', 'string': 'object', 'char': 'object', 'text': 'object',
+}
+
+
+def s4h_fwf_dtypes(dict_df):
+    """Build the column data types of a fixed-width file from its dictionary.
+
+    The optional ``data_type`` column of the dictionary gives the type of each variable: ``int``/``integer``,
+    ``float``/``numeric``/``num``, ``str``/``string``/``char``/``text`` or any ``pandas`` dtype name. Variables
+    without a type are left out, so they are read as text.
+
+    Parameters
+    ----------
+    dict_df : pandas.DataFrame
+        Dictionary table describing fixed-width columns, with a ``variable_name`` column.
+
+    Returns
+    -------
+    dict
+        Mapping of column names to ``pandas`` dtypes, suitable for the ``fwf_dtypes`` parameter of ``Extractor``.
+
+    Raises
+    ------
+    ValueError
+        If the dictionary has no ``variable_name`` column.
+    """
+    if not 'variable_name' in dict_df.columns:
+        raise ValueError("No column names found in the dictionary DataFrame.")
+    if not 'data_type' in dict_df.columns:
+        return {}
+
+    dtypes = {}
+    for name, data_type in zip(dict_df['variable_name'], dict_df['data_type']):
+        if pd.isna(name) or pd.isna(data_type):
+            continue
+        data_type = str(data_type).strip()
+        dtypes[name] = FWF_DATA_TYPES.get(data_type.lower(), data_type)
+    return dtypes
@@ -0,0 +1,140 @@
+"""Fixed-width reader that slices memory-mapped files with NumPy instead of parsing them line by line."""
+import codecs
+import mmap
+import traceback
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+DEFAULT_FWF_BLOCKSIZE = 64 * 1024 * 1024
+
+_NEWLINE, _CARRIAGE_RETURN, _SPACE = 10, 13, 32
+
+
+def _line_bounds(data):
+    """Start and end (line break excluded) of the non-blank lines of a byte array"""
+    breaks = np.flatnonzero(data == _NEWLINE)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [len(data)]))
+    has_cr = ends > starts
+    has_cr[has_cr] = data[ends[has_cr] - 1] == _CARRIAGE_RETURN
+    ends = ends - has_cr
+    keep = ends > starts
+    return starts[keep], ends[keep]
+
+
+def _fields(data, starts, ends, width):
+    """
+    Return a function slicing the ``(start, end)`` field of every line as a ``(lines, end - start)`` byte matrix.
+
+    When all lines are evenly spaced and long enough (the usual layout of microdata files), the lines are a strided
+    view of ``data`` and fields are plain slices; otherwise bytes past the end of a line are read as spaces.
+    """
+    if len(starts) == 0:
+        return lambda start, end: np.zeros((0, end - start), dtype=np.uint8)
+    strides = np.diff(starts)
+    if (len(strides) == 0 or np.all(strides == strides[0])) and np.all(ends - starts >= width):
+        stride = int(strides[0]) if len(strides) else width
+        rows = np.lib.stride_tricks.as_strided(data[starts[0]:], shape=(len(starts), width), strides=(stride, 1),
+                                               writeable=False)
+        return lambda start, end: np.ascontiguousarray(rows[:, start:end])
+
+    def ragged(start, end):
+        index = starts[:, None] + np.arange(start, end)
+        inside = index < ends[:, None]
+        return np.where(inside, data[np.minimum(index, len(data) - 1)], _SPACE).astype(np.uint8)
+    return ragged
+
+
+def _arrow_text(values):
+    """Stripped text of fixed-size byte strings, with blank values as nulls"""
+    text = pc.utf8_trim_whitespace(pc.cast(pa.array(values, type=pa.binary()), pa.string()))
+    return pc.if_else(pc.equal(text, ''), pa.scalar(None, pa.string()), text)
+
+
+def _to_column(field, dtype, encoding):
+    values = field.view(f'S{field.shape[1]}').ravel() if field.shape[1] else np.full(len(field), b'')
+    if dtype is not None and (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)):
+        text = _arrow_text(values)
+        try:
+            numbers = pc.cast(text, pa.int64() if pd.api.types.is_integer_dtype(dtype) else pa.float64())
+            # Integers go straight to nullable Int64, not through float64 (which rounds beyond 2**53)
+            column = pd.Series(numbers.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get))
+        except pa.ArrowInvalid:
+            # Codes such as '.' or 'X' among the numbers
+            column = pd.to_numeric(pd.Series(text.to_pandas()), errors='coerce')
+        return column.astype(dtype)
+    if field.size == 0 or field.max() < 128 or codecs.lookup(encoding).name == 'utf-8':
+        # Plain ASCII (or UTF-8) bytes are already valid pyarrow strings
+        text = _arrow_text(values)
+    else:
+        text = pa.array(np.char.strip(np.char.decode(values, encoding)), type=pa.string())
+        text = pc.if_else(pc.equal(text, ''), pa.scalar(None, pa.string()), text)
+    column = text.to_pandas()
+    return column.astype(dtype) if dtype is not None else column
+
+
+def read_fwf_block(filepath: str, start: int, end: int, colspecs: list, names: list, dtypes: dict = None,
+                   encoding: str = 'latin1', usecols: list = None) -> pd.DataFrame:
+    """
+    Read the lines in a byte range of a fixed-width file.
+
+    The file is memory-mapped and the range is viewed as a NumPy byte array. Line breaks are located once; each
+    requested column is then sliced from every line at the same time and converted as a whole: numeric columns with
+    ``pyarrow`` casts, text columns with NumPy string operations. Values are stripped of surrounding whitespace and
+    blank values are missing.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the fixed-width file.
+    start, end : int
+        Byte range to read. It must start at the beginning of a line and end after a line break or at the end of the
+        file (see :func:`socio4health.utils.extractor_utils.line_blocks`).
+    colspecs : list of tuple
+        ``(start, end)`` byte positions of each column in a line, 0-based and end exclusive. They match character
+        positions for single-byte encodings such as ``latin1``.
+    names : list of str
+        Column names, in the order of ``colspecs``.
+    dtypes : dict, optional
+        Data type of some columns (e.g. ``{'V2009': 'Int64', 'V1028': 'float64'}``). Integer and float columns are
+        parsed as numbers; values that are not numbers become missing. Other columns are kept as text.
+    encoding : str
+        Character encoding of the text columns. Defaults to ``'latin1'``.
+    usecols : list of str, optional
+        Columns to read. Default is ``None`` (all columns).
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per non-blank line.
+    """
+    dtypes = dtypes or {}
+    columns = [(name, spec) for name, spec in zip(names, colspecs) if usecols is None or name in usecols]
+    width = max((spec[1] for _, spec in columns), default=0)
+
+    with open(filepath, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if end > start else None
+    try:
+        return _read_mapped(mapped, start, end, columns, width, dtypes, encoding)
+    except BaseException as e:
+        # The frames of the traceback hold views of the map, which cannot be closed while they exist
+        traceback.clear_frames(e.__traceback__)
+        raise
+    finally:
+        if mapped is not None:
+            mapped.close()
+
+
+def _read_mapped(mapped, start, end, columns, width, dtypes, encoding):
+    """Convert the requested columns of a byte range of a memory map; the result does not reference the map"""
+    data = np.frombuffer(mapped, dtype=np.uint8, count=end - start, offset=start) if mapped is not None \
+        else np.zeros(0, dtype=np.uint8)
+    starts, ends = _line_bounds(data)
+    field = _fields(data, starts, ends, width)
+    converted = {}
+    for name, spec in columns:
+        converted[name] = _to_column(field(*spec), dtypes.get(name), encoding)
+    return pd.DataFrame(converted)
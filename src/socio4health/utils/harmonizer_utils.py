@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 from typing import Any
 from .deps import import_optional
+from socio4health.enums.dict_enum import ColumnMappingEnum
 
 
 def s4h_standardize_dict(raw_dict: pd.DataFrame) -> pd.DataFrame:
@@ -314,6 +315,33 @@ def s4h_classify_rows(data: pd.DataFrame, col1: str, col2: str, col3: str, new_c
 
 
 
+def s4h_select_columns(dict_df: pd.DataFrame, categories: list, extra_cols: list = None) -> list:
+    """
+    List the columns selected by a set of categories of a dictionary.
+
+    These are the columns that ``Harmonizer.s4h_data_selector`` keeps, so they can also be given to ``Extractor`` as
+    ``usecols`` to read nothing else.
+
+    Parameters
+    ----------
+    dict_df : pandas.DataFrame
+        Dictionary with ``variable_name`` and ``category`` columns.
+    categories : list of str
+        Categories of interest.
+    extra_cols : list of str, optional
+        Additional columns to select.
+
+    Returns
+    -------
+    list of str
+        Upper-cased column names, in dictionary order followed by ``extra_cols``.
+    """
+    selected = dict_df[dict_df[ColumnMappingEnum.CATEGORY.value].isin(categories)]
+    columns = selected[ColumnMappingEnum.VARIABLE_NAME.value].dropna().astype(str).str.upper().unique().tolist()
+    columns.extend(col.upper() for col in extra_cols or [] if col.upper() not in columns)
+    return columns
+
+
 def _clean_column_name(name):
     cleaned = str(name).strip().upper()
     cleaned = cleaned.replace('\ufeff', '')
@@ -0,0 +1,240 @@
+"""Streaming JSON and line-delimited JSON (NDJSON) reading, split into byte blocks that Dask partitions parse."""
+import json
+
+import pandas as pd
+
+from socio4health.utils.extractor_utils import line_blocks
+
+DEFAULT_JSON_BLOCKSIZE = 64 * 1024 * 1024
+_READ_SIZE = 1024 * 1024
+_STRUCTURE = '[{":,]} \n'
+_BOM = b'\xef\xbb\xbf'
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Whether the JSON structural characters of ``encoding`` are single ``ASCII`` bytes (``utf-8``, ``latin1``...)"""
+    try:
+        return _STRUCTURE.encode(encoding) == _STRUCTURE.encode('ascii')
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _split_path(record_path):
+    if record_path is None:
+        return []
+    if isinstance(record_path, str):
+        return record_path.split('.')
+    return list(record_path)
+
+
+class _Scanner:
+    """
+    Incremental reader of a JSON document that keeps only a bounded window of it in memory.
+
+    The bytes are decoded as ``latin1``, which maps every byte to one character, so positions in the window are byte
+    offsets in the file and multi-byte characters of ``ASCII`` compatible encodings only show up inside strings.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.text = ''
+        self.pos = 0
+        self.base = file.tell()
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size=_READ_SIZE):
+        if self.eof:
+            return False
+        if self.pos > _READ_SIZE:
+            # Drop what was already consumed
+            self.base += self.pos
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        data = self.file.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.text += data.decode('latin1')
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at byte {self.base + self.pos}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next value and return it with its absolute ``(start, end)`` byte span"""
+        self.peek()
+        size = _READ_SIZE
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            if end == len(self.text) and self._fill(size):
+                # A number may continue in the next read
+                continue
+            start, self.pos = self.base + self.pos, end
+            return obj, start, self.base + end
+
+    def seek_path(self, path):
+        """Move to the value found under the keys of ``path``"""
+        for key in path:
+            self.expect('{')
+            while True:
+                if self.peek() == '}':
+                    raise ValueError(f"Key {key!r} of the record path not found")
+                name, _, _ = self.value()
+                self.expect(':')
+                if name == key:
+                    break
+                self.value()
+                if self.peek() == ',':
+                    self.pos += 1
+
+
+def _detect_lines(filepath, offset):
+    """Whether a document starting with ``{`` holds one object per line"""
+    with open(filepath, 'rb') as file:
+        file.seek(offset)
+        first = file.readline()
+        second = file.readline()
+    try:
+        json.loads(first.decode('latin1'))
+    except ValueError:
+        return False
+    return bool(second.strip())
+
+
+def _recode(key, encoding):
+    """Decode with ``encoding`` a key that the scanner decoded as ``latin1``"""
+    return key.encode('latin1').decode(encoding) if isinstance(key, str) else key
+
+
+def json_layout(filepath: str, lines: bool = None, record_path=None, blocksize: int = DEFAULT_JSON_BLOCKSIZE,
+                encoding: str = 'utf-8'):
+    """
+    Split a JSON file into byte blocks of whole records.
+
+    Line-delimited files are cut at the first line break after every ``blocksize`` bytes without being parsed. For a
+    JSON document, the array of records (at the top level or under ``record_path``) is scanned once with a bounded
+    buffer to find where each record starts and ends.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the JSON file. Its encoding must be ``ASCII`` compatible (see :func:`is_ascii_compatible`).
+    lines : bool, optional
+        Whether the file holds one record per line. Default is ``None`` (detected from the first lines).
+    record_path : str or list of str, optional
+        Keys leading to the array of records inside the document, as a list or joined with dots (e.g.
+        ``'result.records'``). Default is ``None`` (the document itself is the array).
+    blocksize : int
+        Approximate size in bytes of each block. Defaults to 64 MiB.
+    encoding : str
+        Character encoding of the file, used to decode the record keys. Defaults to ``'utf-8'``.
+
+    Returns
+    -------
+    tuple
+        ``(blocks, columns, lines)``: the ``(start, end)`` byte spans of the blocks, the record keys in order of
+        appearance (only those of the first block for line-delimited files) and whether the file is line-delimited.
+    """
+    with open(filepath, 'rb') as file:
+        offset = len(_BOM) if file.read(len(_BOM)) == _BOM else 0
+        file.seek(offset)
+        scanner = _Scanner(file)
+        first = scanner.peek()
+    path = [key.encode(encoding).decode('latin1') for key in _split_path(record_path)]
+    if lines is None:
+        lines = first == '{' and not path and _detect_lines(filepath, offset + scanner.pos)
+    if lines:
+        return _line_blocks(filepath, offset, blocksize, encoding)
+
+    blocks, columns = [], {}
+    with open(filepath, 'rb') as file:
+        file.seek(offset)
+        scanner = _Scanner(file)
+        scanner.seek_path(path)
+        scanner.expect('[')
+        block_start = block_end = None
+        while scanner.peek() != ']':
+            record, start, end = scanner.value()
+            if isinstance(record, dict):
+                columns.update(dict.fromkeys(record))
+            if block_start is None:
+                block_start = start
+            elif end - block_start > blocksize:
+                blocks.append((block_start, block_end))
+                block_start = start
+            block_end = end
+            if scanner.peek() == ',':
+                scanner.pos += 1
+        if block_start is not None:
+            blocks.append((block_start, block_end))
+    return blocks, [_recode(key, encoding) for key in columns], False
+
+
+def _line_blocks(filepath, offset, blocksize, encoding):
+    blocks = line_blocks(filepath, blocksize, offset=offset)
+    columns = {}
+    if blocks:
+        for record in _read_records(filepath, *blocks[0], lines=True, encoding=encoding):
+            if isinstance(record, dict):
+                columns.update(dict.fromkeys(record))
+    return blocks, list(columns), True
+
+
+def _read_records(filepath, start, end, lines, encoding):
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding)
+    if lines:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return json.loads(f"[{text}]")
+
+
+def read_json_block(filepath: str, start: int, end: int, lines: bool = False, encoding: str = 'utf-8',
+                    columns: list = None, dtype=None) -> pd.DataFrame:
+    """
+    Parse the records of one block found by :func:`json_layout`.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the JSON file.
+    start, end : int
+        Byte span of the block.
+    lines : bool
+        Whether the file holds one record per line.
+    encoding : str
+        Character encoding of the file. Defaults to ``'utf-8'``.
+    columns : list, optional
+        Columns of the result; keys missing in a record are left empty and other keys are dropped. Default is
+        ``None`` (the keys found in the block).
+    dtype : str or dict, optional
+        Data type(s) applied to the columns. Default is ``None`` (types as parsed).
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per record.
+    """
+    df = pd.DataFrame.from_records(_read_records(filepath, start, end, lines, encoding), columns=columns)
+    if isinstance(dtype, dict):
+        dtype = {col: kind for col, kind in dtype.items() if col in df.columns}
+    return df.astype(dtype) if dtype else df
@@ -0,0 +1,128 @@
+"""On-disk manifest that lets the Extractor skip inputs that did not change since the previous run."""
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from socio4health.utils.extractor_utils import _file_digest
+
+
+class ExtractionManifest:
+    """
+    Record of the files processed by previous extractions into an ``output_path``.
+
+    Each entry is keyed by the real path of a source file (or by ``<archive>::<member>`` for members read in place)
+    and stores the size, modification time and ``sha256`` digest of the file together with what was derived from it:
+    the extracted member paths, the inferred schema, the number of rows, etc. A file is considered unchanged when its
+    size and modification time match; if only the modification time differs, the digest decides.
+
+    Attributes
+    ----------
+    output_path : str
+        Directory where the manifest file (``.s4h_manifest.json``) is stored.
+    """
+    FILENAME = '.s4h_manifest.json'
+
+    def __init__(self, output_path: str):
+        self.output_path = str(output_path)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.entries = self._load()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.output_path, self.FILENAME)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable extraction manifest {self.path}: {e}")
+            return {}
+
+    def is_unchanged(self, filepath: str, key: str = None) -> bool:
+        """Return ``True`` if ``filepath`` still matches the fingerprint recorded under ``key``."""
+        key = key or os.path.realpath(filepath)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                return False
+            if stat.st_size != entry['size']:
+                return False
+            if stat.st_mtime == entry['mtime']:
+                return True
+            # Touched but possibly identical (e.g. copied again): let the content decide
+            if _file_digest(filepath, 'sha256') != entry['sha256']:
+                return False
+            entry['mtime'] = stat.st_mtime
+            self._dirty = True
+            return True
+
+    def get(self, filepath: str, field: str, key: str = None):
+        """Return a value recorded for ``filepath``, or ``None`` if it is unknown or the file changed."""
+        key = key or os.path.realpath(filepath)
+        with self._lock:
+            if not self.is_unchanged(filepath, key):
+                return None
+            return self.entries[key].get(field)
+
+    def record(self, filepath: str, key: str = None, **fields):
+        """Store ``fields`` for ``filepath``, resetting everything recorded for a previous version of the file."""
+        key = key or os.path.realpath(filepath)
+        with self._lock:
+            if not self.is_unchanged(filepath, key):
+                stat = os.stat(filepath)
+                self.entries[key] = {
+                    'path': os.path.realpath(filepath),
+                    'size': stat.st_size,
+                    'mtime': stat.st_mtime,
+                    'sha256': _file_digest(filepath, 'sha256'),
+                }
+            self.entries[key].update(fields)
+            self._dirty = True
+
+    def subset(self, key: str) -> 'ExtractionManifest':
+        """Return a detached copy holding only the entries of ``key`` and of its parts (``<key>::<part>``)."""
+        with self._lock:
+            subset = copy.copy(self)
+            subset.entries = copy.deepcopy({name: entry for name, entry in self.entries.items()
+                                            if name == key or name.startswith(f"{key}::")})
+            subset._dirty = False
+            return subset
+
+    def merge(self, other: 'ExtractionManifest'):
+        """Take the entries recorded in a copy returned by :meth:`subset` (e.g. by another process)."""
+        with self._lock:
+            if other._dirty:
+                self.entries.update(other.entries)
+                self._dirty = True
+
+    def save(self):
+        """Write the manifest to ``output_path`` if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.output_path, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_path, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self.entries, file, indent=1)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
@@ -0,0 +1,102 @@
+"""Parquet materialization of extracted files, so that slow text formats are parsed only once."""
+import json
+import logging
+import os
+import shutil
+
+import dask.dataframe as dd
+
+from socio4health.utils.deps import import_optional
+
+CACHE_SUFFIX = '.s4h.parquet'
+SIDECAR_NAME = '_s4h_cache.json'
+
+
+def parquet_cache_path(filepath: str) -> str:
+    """Return the directory holding the Parquet copy of ``filepath`` (next to the source file)."""
+    return filepath + CACHE_SUFFIX
+
+
+def _source_key(filepath, options_token):
+    stat = os.stat(filepath)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime, 'options': options_token}
+
+
+def _is_geo(ddf):
+    return getattr(ddf._meta, '_geometry_column_name', None) is not None
+
+
+def _read(cache_dir, geo):
+    if geo:
+        return import_optional('dask_geopandas', extra='geo').read_parquet(cache_dir)
+    return dd.read_parquet(cache_dir)
+
+
+def load_parquet_cache(filepath: str, options_token: str):
+    """
+    Return a `Dask <https://docs.dask.org>`_ DataFrame over the Parquet copy of ``filepath``.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the source file.
+    options_token : str
+        Fingerprint of the options used to parse the source (column specifications, encoding, dtypes...).
+
+    Returns
+    -------
+    dask.dataframe.DataFrame or None
+        The cached data, or ``None`` if there is no copy or it is stale: the source size or modification time
+        changed, or it was parsed with different options.
+    """
+    cache_dir = parquet_cache_path(filepath)
+    try:
+        with open(os.path.join(cache_dir, SIDECAR_NAME), 'r', encoding='utf-8') as file:
+            recorded = json.load(file)
+    except (OSError, ValueError):
+        return None
+    geo = recorded.pop('geo', False)
+    if recorded != _source_key(filepath, options_token):
+        logging.info(f"Parquet cache is stale for {os.path.basename(filepath)}")
+        return None
+    return _read(cache_dir, geo)
+
+
+def write_parquet_cache(ddf: dd.DataFrame, filepath: str, options_token: str):
+    """
+    Write ``ddf``, parsed from ``filepath``, as partitioned Parquet next to the source and return a frame reading it.
+
+    The data is written to a temporary folder that replaces the previous copy only once complete.
+    ``dask_geopandas.GeoDataFrame`` s are stored as GeoParquet. If the frame cannot be stored as Parquet (e.g. columns
+    mixing types), ``ddf`` is returned unchanged.
+
+    Parameters
+    ----------
+    ddf : dask.dataframe.DataFrame
+        The frame parsed from the source file.
+    filepath : str
+        Path of the source file.
+    options_token : str
+        Fingerprint of the options used to parse the source.
+
+    Returns
+    -------
+    dask.dataframe.DataFrame
+        A frame reading the Parquet copy, or ``ddf`` if it could not be written.
+    """
+    cache_dir = parquet_cache_path(filepath)
+    tmp_dir = cache_dir + '.tmp'
+    key = dict(_source_key(filepath, options_token), geo=_is_geo(ddf))
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        ddf.to_parquet(tmp_dir, write_index=False)
+        with open(os.path.join(tmp_dir, SIDECAR_NAME), 'w', encoding='utf-8') as file:
+            json.dump(key, file)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        os.replace(tmp_dir, cache_dir)
+    except Exception as e:
+        logging.warning(f"Could not write Parquet cache for {os.path.basename(filepath)}: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return ddf
+    logging.info(f"Wrote Parquet cache: {cache_dir}")
+    return _read(cache_dir, key['geo'])
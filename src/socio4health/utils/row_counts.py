@@ -0,0 +1,65 @@
+"""Row counts and emptiness checks that avoid parsing whole files only to know how many rows they hold."""
+import logging
+
+import dask
+import dask.dataframe as dd
+import pyarrow.parquet as pq
+
+
+def parquet_row_count(filepath: str) -> int:
+    """Number of rows of a Parquet file (or directory of files), read from the footer metadata only."""
+    return sum(fragment.metadata.num_rows for fragment in pq.ParquetDataset(filepath).fragments)
+
+
+def has_rows(df) -> bool:
+    """
+    Whether a DataFrame has at least one row.
+
+    The first partition of a Dask DataFrame is computed alone, then the following ones in parallel batches of
+    quadrupling size, until a batch holds a row. A frame with rows in its first partition costs a single partition
+    read instead of a full count, and an empty frame (e.g. after a filter that matches nothing) is scanned in about
+    ``log4(npartitions)`` parallel passes instead of one partition at a time.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or dask.dataframe.DataFrame
+        The frame to check.
+
+    Returns
+    -------
+    bool
+        ``True`` if a row was found.
+    """
+    if not isinstance(df, dd.DataFrame):
+        return len(df) > 0
+    start, batch = 0, 1
+    while start < df.npartitions:
+        stop = min(start + batch, df.npartitions)
+        if df.partitions[start:stop].map_partitions(len).compute().any():
+            return True
+        start, batch = stop, batch * 4
+    return False
+
+
+def compute_with_row_counts(ddfs: list, row_counts: list):
+    """
+    Compute DataFrames together with their pending row counts in a single ``dask.compute`` call.
+
+    Parameters
+    ----------
+    ddfs : list of dask.dataframe.DataFrame
+        Frames to compute.
+    row_counts : list
+        Row counts to resolve, as integers or lazy Dask scalars (e.g. ``Extractor.row_counts`` or
+        ``Harmonizer.row_counts``). Those that are zero are logged as warnings.
+
+    Returns
+    -------
+    tuple
+        ``(frames, counts)``: the computed ``pandas`` frames and the row counts as integers.
+    """
+    frames, counts = dask.compute(list(ddfs), list(row_counts))
+    for index, count in enumerate(counts):
+        if count == 0:
+            logging.warning(f"DataFrame {index} has no rows")
+    return frames, [int(count) for count in counts]
@@ -0,0 +1,116 @@
+"""Inference of compact column data types from a sample of an extracted file."""
+import logging
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SAMPLE_ROWS = 10_000
+_INTEGER = r'-?(?:0|[1-9]\d*)'
+_NUMBER = _INTEGER + r'(?:\.\d+)?'
+
+
+def _is_text(series):
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _numeric_type(values):
+    """``Int64`` for whole numbers and ``float64`` otherwise: the widest types, as later rows may exceed the sample"""
+    if len(values) == 0:
+        return None
+    return 'Int64' if np.all(np.mod(values, 1) == 0) and np.all(np.abs(values) < 2 ** 63) else 'float64'
+
+
+def _text_type(series, category_ratio, max_categories):
+    text = series.dropna().astype(str).str.strip()
+    text = text[text != '']
+    if text.empty:
+        return None
+    # Codes written with leading zeros or signs ('05', '+1') must stay text
+    if text.str.fullmatch(_NUMBER).all():
+        numbers = pd.to_numeric(text).astype('float64')
+        dtype = _numeric_type(numbers)
+        if dtype == 'Int64' or not text.str.fullmatch(_INTEGER).all():
+            return dtype
+        # Integers beyond Int64 would lose digits as floats
+    unique = text.nunique()
+    if unique <= max_categories and unique <= category_ratio * len(text):
+        return 'category'
+    return 'string[pyarrow]'
+
+
+def infer_dtypes(sample: pd.DataFrame, category_ratio: float = 0.05, max_categories: int = 1000) -> dict:
+    """
+    Infer compact data types for the columns of a sample.
+
+    Text columns holding only numbers written without leading zeros become ``Int64`` (whole numbers) or ``float64``;
+    other text columns become ``category`` when they have few distinct values and ``string[pyarrow]`` otherwise.
+    Numbers are not narrowed to the range of the sample, which the rest of the file may exceed. Other columns
+    (numbers, dates, booleans, geometries...) are left out.
+
+    Parameters
+    ----------
+    sample : pandas.DataFrame
+        Rows sampled from the file.
+    category_ratio : float
+        Maximum ratio of distinct values to non-missing values of a ``category`` column. Defaults to ``0.05``.
+    max_categories : int
+        Maximum number of distinct values of a ``category`` column. Defaults to ``1000``.
+
+    Returns
+    -------
+    dict
+        Mapping of column names to data type names. Columns whose type does not change are left out.
+    """
+    dtypes = {}
+    for column in sample.columns:
+        series = sample[column]
+        if _is_text(series):
+            dtype = _text_type(series, category_ratio, max_categories)
+        else:
+            dtype = None
+        if dtype is not None and dtype != str(series.dtype):
+            dtypes[column] = dtype
+    return dtypes
+
+
+def apply_dtypes(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """
+    Convert the columns of a DataFrame to the types found by :func:`infer_dtypes`.
+
+    Values of a numeric column that are not numbers of its type (e.g. a letter, or a decimal in an ``Int64`` column),
+    which means the sample was not representative of the whole file, become missing values and are reported in a
+    warning, as the other partitions of the frame must keep the same types.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame to convert, typically one partition of a Dask DataFrame.
+    dtypes : dict
+        Mapping of column names to data type names.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The converted frame.
+    """
+    df = df.copy()
+    for column, dtype in dtypes.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        if dtype in ('category', 'string[pyarrow]'):
+            df[column] = series.astype(dtype)
+            continue
+        text = series.astype('string').str.strip().replace('', pd.NA) if _is_text(series) else series
+        numbers = pd.to_numeric(text, errors='coerce').astype('float64')
+        if dtype == 'Int64':
+            whole = numbers.notna() & (numbers % 1 == 0) & (numbers.abs() < 2 ** 63)
+            # Integer text is parsed again without going through float64, which has 53 bits
+            exact = pd.to_numeric(text.where(whole), errors='coerce') if _is_text(series) else series.where(whole)
+            numbers = exact.astype('Int64')
+        invalid = numbers.isna() & text.notna()
+        if invalid.any():
+            logging.warning(f"Column {column!r}: {int(invalid.sum())} values do not fit the inferred type {dtype} "
+                            f"and are left missing (e.g. {text[invalid].iloc[0]!r})")
+        df[column] = numbers
+    return df
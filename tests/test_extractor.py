@@ -0,0 +1,483 @@
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+from socio4health import Extractor
+from socio4health.utils.row_counts import compute_with_row_counts
+
+
+def _write_zip(path, members):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+def test_read_from_archive_does_not_extract(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    _write_zip(source / "geih.zip", {
+        "Caracteristicas.csv": "DIRECTORIO;ORDEN\n1;1\n2;1\n",
+        "Ocupados.txt": "DIRECTORIO;OFICIO\n1;5\n",
+    })
+    output = tmp_path / "output"
+
+    extractor = Extractor(input_path=str(source), down_ext=['.zip', '.csv', '.txt'], output_path=str(output),
+                          sep=';', read_from_archive=True)
+    dfs = extractor.s4h_extract()
+
+    frames = {df['filename'].compute().iloc[0]: df.compute() for df in dfs}
+    assert sorted(frames) == ["Caracteristicas.csv", "Ocupados.txt"]
+    assert frames["Caracteristicas.csv"]["DIRECTORIO"].tolist() == ["1", "2"]
+    assert frames["Ocupados.txt"]["OFICIO"].tolist() == ["5"]
+    # Nothing was materialized next to the archive output folder
+    assert all(not files for _, _, files in os.walk(output))
+
+
+def test_read_from_archive_fixed_width(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    _write_zip(source / "pnadc.zip", {"PNADC_012024.txt": "2024011\n2024022\n"})
+
+    extractor = Extractor(input_path=str(source), down_ext=['.zip', '.txt'], output_path=str(tmp_path / "out"),
+                          is_fwf=True, colnames=['Ano', 'Trimestre', 'UF'], colspecs=[(0, 4), (4, 5), (5, 7)],
+                          read_from_archive=True)
+    df = extractor.s4h_extract()[0].compute()
+
+    assert df['UF'].tolist() == ["11", "22"]
+
+
+@pytest.mark.parametrize("text_engine", ['c', 'pyarrow'])
+def test_stored_archive_members_are_read_in_blocks(tmp_path, monkeypatch, caplog, text_engine) -> None:
+    import socio4health.extractor as extractor_module
+
+    source = tmp_path / "input"
+    source.mkdir()
+    rows = "".join(f"{i};{i % 3}\n" for i in range(50))
+    with zipfile.ZipFile(source / "geih.zip", 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr("Caracteristicas.csv", "GEIH 2024\nDIRECTORIO;ORDEN\n" + rows)
+        zf.writestr("PNADC_012024.txt", "2024011\n2024022\n" * 20)
+    _write_zip(source / "enaho.zip", {"Sumaria.csv": "UBIGEO;MIEPERHO\n010101;4\n"})
+    monkeypatch.setattr(extractor_module, "DEFAULT_CSV_BLOCKSIZE", 64)
+    monkeypatch.setattr(extractor_module, "LARGE_MEMBER_SIZE", 0)
+
+    dfs = Extractor(input_path=str(source), down_ext=['.zip', '.csv'], output_path=str(tmp_path / "out"),
+                    read_from_archive=True, text_engine=text_engine).s4h_extract()
+    frames = {df['filename'].compute().iloc[0]: df for df in dfs}
+
+    assert frames["Caracteristicas.csv"].npartitions > 1
+    result = frames["Caracteristicas.csv"].compute()
+    assert result['DIRECTORIO'].astype(int).tolist() == list(range(50))
+    assert frames["Sumaria.csv"].npartitions == 1
+    assert "Sumaria.csv is compressed inside enaho.zip" in caplog.text
+
+    fwf = Extractor(input_path=str(source), down_ext=['.zip', '.txt'], output_path=str(tmp_path / "fwf"),
+                    is_fwf=True, colnames=['Ano', 'Trimestre', 'UF'], colspecs=[(0, 4), (4, 5), (5, 7)],
+                    read_from_archive=True, fwf_blocksize=32).s4h_extract()[0]
+    assert fwf.npartitions > 1
+    assert fwf['UF'].compute().tolist() == ["11", "22"] * 20
+
+
+def test_local_inventory_extracts_each_archive_once(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "input"
+    (source / "2023").mkdir(parents=True)
+    _write_zip(source / "2023" / "a.zip", {"a.csv": "x\n1\n"})
+    _write_zip(source / "b.zip", {"b.csv": "x\n2\n"})
+    (source / "c.csv").write_text("x\n3\n")
+    os.symlink(source / "b.zip", source / "b_link.zip")
+
+    calls = []
+    import socio4health.utils.extractor_utils as extractor_utils
+    original = extractor_utils.compressed2files
+    monkeypatch.setattr(extractor_utils, "compressed2files",
+                        lambda **kwargs: calls.append(kwargs["input_archive"]) or original(**kwargs))
+
+    extractor = Extractor(input_path=str(source), down_ext=['.zip', '.7z', '.tar', '.csv'],
+                          output_path=str(tmp_path / "out"))
+    dfs = extractor.s4h_extract()
+
+    assert sorted(os.path.basename(c) for c in calls) == ["a.zip", "b.zip"]
+    assert sorted(os.path.basename(p) for p in extractor.inventory["archives"]) == ["a.zip", "b.zip"]
+    assert [os.path.basename(p) for p in extractor.inventory['files']] == ["c.csv"]
+    assert sorted(df['x'].compute().iloc[0] for df in dfs) == ["1", "2", "3"]
+
+
+def test_incremental_run_skips_unchanged_archives(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    _write_zip(source / "a.zip", {"a.csv": "x\n1\n"})
+    _write_zip(source / "b.zip", {"b.csv": "x\n2\n"})
+    output = tmp_path / "out"
+
+    def run():
+        extractor = Extractor(input_path=str(source), down_ext=['.zip', '.csv'], output_path=str(output),
+                              incremental=True)
+        return sorted(df['x'].compute().iloc[0] for df in extractor.s4h_extract())
+
+    assert run() == ["1", "2"]
+    assert (output / ".s4h_manifest.json").exists()
+
+    calls = []
+    import socio4health.utils.extractor_utils as extractor_utils
+    original = extractor_utils.compressed2files
+    monkeypatch.setattr(extractor_utils, "compressed2files",
+                        lambda **kwargs: calls.append(kwargs["input_archive"]) or original(**kwargs))
+
+    assert run() == ["1", "2"]
+    assert calls == []
+
+    _write_zip(source / "b.zip", {"b.csv": "x\n3\n"})
+    assert run() == ["1", "3"]
+    assert [os.path.basename(c) for c in calls] == ["b.zip"]
+
+
+def test_incremental_run_checks_extraction_options(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    _write_zip(source / "a.zip", {"a.csv": "x\n1\n", "a.txt": "x\n2\n"})
+
+    def run(down_ext, **kwargs):
+        extractor = Extractor(input_path=str(source), down_ext=down_ext, output_path=str(tmp_path / "out"),
+                              incremental=True, **kwargs)
+        extractor.s4h_extract()
+        extracted = extractor.inventory['extracted'][str(source / "a.zip")]
+        return [(os.path.splitext(getattr(f, 'name', f))[1], isinstance(f, str)) for f in extracted]
+
+    assert run(['.zip', '.csv']) == [(".csv", True)]
+    assert run(['.zip', '.txt']) == [(".txt", True)]
+    assert run(['.zip', '.txt'], read_from_archive=True) == [(".txt", False)]
+    assert run(['.zip', '.csv']) == [(".csv", True)]
+
+
+def test_parquet_cache_is_reused_and_invalidated(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    data = source / "PNADC_2024.txt"
+    data.write_text("2024111\n2024122\n")
+
+    def run(colspecs):
+        extractor = Extractor(input_path=str(source), down_ext=['.txt'], output_path=str(tmp_path / "out"),
+                              is_fwf=True, colnames=['Ano', 'Trimestre', 'UF'], colspecs=colspecs,
+                              parquet_cache=True)
+        return extractor.s4h_extract()[0]
+
+    first = run([(0, 4), (4, 5), (5, 7)])
+    cache_dir = source / "PNADC_2024.txt.s4h.parquet"
+    assert cache_dir.is_dir()
+    assert first.compute()['UF'].tolist() == ["11", "22"]
+
+    # A second run reads the Parquet copy instead of parsing the text file
+    import dask.dataframe as dd
+    read_fwf = dd.read_fwf
+    monkeypatch.setattr(dd, "read_fwf", lambda *args, **kwargs: pytest.fail("source parsed again"))
+    second = run([(0, 4), (4, 5), (5, 7)])
+    assert second.compute()['UF'].tolist() == ["11", "22"]
+
+    # Different column specifications invalidate the copy
+    monkeypatch.setattr(dd, "read_fwf", read_fwf)
+    third = run([(0, 4), (4, 6), (6, 7)])
+    assert third.compute()['UF'].tolist() == ["1", "2"]
+
+
+def test_sav_is_read_lazily_in_chunks(tmp_path) -> None:
+    import pyreadstat
+
+    source = tmp_path / "input"
+    source.mkdir()
+    df = pd.DataFrame({'UBIGEO': [f"{i:06d}" for i in range(25)], 'P207': [1.0, 2.0] * 12 + [1.0]})
+    pyreadstat.write_sav(df, str(source / "enaho01.sav"), variable_value_labels={'P207': {1.0: 'Hombre', 2.0: 'Mujer'}})
+
+    extractor = Extractor(input_path=str(source), down_ext=['.sav'], output_path=str(tmp_path / "out"),
+                          encoding='utf-8', sav_chunksize=10)
+    ddf = extractor.s4h_extract()[0]
+
+    assert ddf.npartitions == 3
+    result = ddf.compute()
+    assert result['UBIGEO'].tolist() == df['UBIGEO'].tolist()
+    assert extractor.value_labels['enaho01.sav'] == {'P207': {1.0: 'Hombre', 2.0: 'Mujer'}}
+
+
+def test_sav_value_labels_survive_the_parquet_cache(tmp_path) -> None:
+    import pyreadstat
+
+    source = tmp_path / "input"
+    source.mkdir()
+    pyreadstat.write_sav(pd.DataFrame({'P207': [1.0, 2.0]}), str(source / "enaho01.sav"),
+                         variable_value_labels={'P207': {1.0: 'Hombre', 2.0: 'Mujer'}})
+
+    for _ in range(2):
+        extractor = Extractor(input_path=str(source), down_ext=['.sav'], output_path=str(tmp_path / "out"),
+                              parquet_cache=True)
+        assert extractor.s4h_extract()[0]['P207'].compute().tolist() == [1.0, 2.0]
+        assert extractor.value_labels == {'enaho01.sav': {'P207': {1.0: 'Hombre', 2.0: 'Mujer'}}}
+    assert (source / "enaho01.sav.s4h.parquet").is_dir()
+
+
+def test_excel_sheets_are_streamed_in_partitions(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    with pd.ExcelWriter(source / "anexo.xlsx") as writer:
+        pd.DataFrame({'DPTO': [f"{i:02d}" for i in range(7)], 'TOTAL': range(7)}).to_excel(writer, sheet_name="Hogares", index=False)
+        pd.DataFrame({'DPTO': ["05"], 'TOTAL': [3]}).to_excel(writer, sheet_name="Personas", index=False)
+
+    extractor = Extractor(input_path=str(source), down_ext=['.xlsx'], output_path=str(tmp_path / "out"),
+                          excel_chunksize=3)
+    frames = {df['sheet'].compute().iloc[0]: df for df in extractor.s4h_extract()}
+
+    assert sorted(frames) == ["Hogares", "Personas"]
+    assert frames["Hogares"].npartitions == 3
+    hogares = frames["Hogares"].compute()
+    assert hogares['DPTO'].tolist() == [f"{i:02d}" for i in range(7)]
+    assert set(hogares['filename']) == {"anexo.xlsx"}
+
+    selected = Extractor(input_path=str(source), down_ext=['.xlsx'], output_path=str(tmp_path / "out"),
+                         sheet_name=[1]).s4h_extract()
+    assert [df['sheet'].compute().iloc[0] for df in selected] == ["Personas"]
+
+
+def test_json_records_are_read_in_blocks(tmp_path) -> None:
+    import json
+
+    source = tmp_path / "input"
+    source.mkdir()
+    records = [{"ID": i, "MUNICIPIO": f"{i:05d}"} for i in range(30)]
+    (source / "api.json").write_text(json.dumps({"data": records}), encoding='utf-8')
+    (source / "api.ndjson").write_text("\n".join(json.dumps(r) for r in records), encoding='utf-8')
+
+    extractor = Extractor(input_path=str(source), down_ext=['.json', '.ndjson'], output_path=str(tmp_path / "out"),
+                          encoding='utf-8', json_record_path='data', json_blocksize=200)
+    frames = {df['filename'].compute().iloc[0]: df for df in extractor.s4h_extract()}
+
+    assert sorted(frames) == ["api.json", "api.ndjson"]
+    for df in frames.values():
+        assert df.npartitions > 1
+        result = df.compute()
+        assert result['MUNICIPIO'].tolist() == [r["MUNICIPIO"] for r in records]
+
+
+def test_geospatial_files_are_partitioned_and_filtered(tmp_path) -> None:
+    gpd = pytest.importorskip("geopandas")
+    dask_geopandas = pytest.importorskip("dask_geopandas")
+    from shapely.geometry import Point
+
+    source = tmp_path / "input"
+    source.mkdir()
+    gpd.GeoDataFrame(
+        {'CD_MUN': [f"{i:07d}" for i in range(20)], 'SIGLA_UF': ["SP", "RJ"] * 10},
+        geometry=[Point(i, i) for i in range(20)], crs=4326
+    ).to_file(source / "municipios.geojson")
+
+    def run():
+        extractor = Extractor(input_path=str(source), down_ext=['.geojson'], output_path=str(tmp_path / "out"),
+                              geo_chunksize=2, geo_bbox=(0, 0, 9.5, 9.5), geo_where="SIGLA_UF = 'SP'",
+                              parquet_cache=True)
+        return extractor.s4h_extract()[0]
+
+    gdf = run()
+    assert isinstance(gdf, dask_geopandas.GeoDataFrame)
+    assert gdf.npartitions == 3
+    assert gdf.compute()['CD_MUN'].tolist() == ["0000000", "0000002", "0000004", "0000006", "0000008"]
+
+    # The second run reads the GeoParquet copy
+    assert (source / "municipios.geojson.s4h.parquet").is_dir()
+    cached = run()
+    assert isinstance(cached, dask_geopandas.GeoDataFrame)
+    assert cached.compute().geometry.x.tolist() == [0, 2, 4, 6, 8]
+
+
+def test_geodriver_is_deprecated(tmp_path) -> None:
+    with pytest.warns(DeprecationWarning, match="geodriver"):
+        Extractor(input_path=str(tmp_path), down_ext=['.shp'], output_path=str(tmp_path / "out"),
+                  geodriver='ESRI Shapefile')
+
+
+def test_numpy_fixed_width_engine(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "PNADC_012024.txt").write_text("".join(f"2024{i % 4 + 1}{i:03d}\n" for i in range(50)))
+
+    extractor = Extractor(input_path=str(source), down_ext=['.txt'], output_path=str(tmp_path / "out"), is_fwf=True,
+                          colnames=['Ano', 'Trimestre', 'V2009'], colspecs=[(0, 4), (4, 5), (5, 8)],
+                          fwf_engine='numpy', fwf_dtypes={'V2009': 'Int64'}, fwf_blocksize=64)
+    ddf = extractor.s4h_extract()[0]
+
+    assert ddf.npartitions > 1
+    result = ddf.compute()
+    assert result['V2009'].tolist() == list(range(50))
+    assert result['Trimestre'].tolist()[:4] == ["1", "2", "3", "4"]
+
+
+def test_usecols_are_pushed_into_readers(tmp_path) -> None:
+    import pyreadstat
+    from socio4health.utils.harmonizer_utils import s4h_select_columns
+
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_text("directorio;P6020;P6040;FEX_C18\n1;1;30;2.5\n")
+    (source / "PNADC_012024.txt").write_text("2024111\n")
+    pd.DataFrame({'UF': ["11"], 'V2009': [30.0]}).to_parquet(source / "pnad.parquet")
+    pyreadstat.write_sav(pd.DataFrame({'ubigeo': ["010101"], 'P207': [1.0]}), str(source / "enaho.sav"))
+    (source / "Vivienda.csv").write_text("P4030S1;P4030S5\n1;2\n")
+
+    dic = pd.DataFrame({'variable_name': ['P6020', 'P6040', 'UF', 'P207', 'Trimestre'],
+                        'category': ['Demographic', 'Business', 'Demographic', 'Demographic', 'Demographic']})
+    usecols = s4h_select_columns(dic, ['Demographic'], extra_cols=['directorio', 'ubigeo'])
+    assert usecols == ['P6020', 'UF', 'P207', 'TRIMESTRE', 'DIRECTORIO', 'UBIGEO']
+
+    def extract(down_ext, **kwargs):
+        extractor = Extractor(input_path=str(source), down_ext=down_ext, output_path=str(tmp_path / "out"),
+                              sep=';', encoding='utf-8', usecols=usecols, **kwargs)
+        return {df['filename'].compute().iloc[0]: list(df.columns) for df in extractor.s4h_extract()}
+
+    assert extract(['.csv', '.parquet', '.sav']) == {
+        "Caracteristicas.csv": ['directorio', 'P6020', 'filename'],
+        "pnad.parquet": ['UF', 'filename'],
+        "enaho.sav": ['ubigeo', 'P207', 'filename'],
+    }
+    for engine in ('dask', 'numpy'):
+        assert extract(['.txt'], is_fwf=True, colnames=['Ano', 'Trimestre', 'UF'], colspecs=[(0, 4), (4, 5), (5, 7)],
+                       fwf_engine=engine) == {"PNADC_012024.txt": ['Trimestre', 'UF', 'filename']}
+
+
+def test_filters_are_applied_while_reading(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_text("DPTO;P6040\n05;30\n11;41\n76;18\n05;62\n")
+    pd.DataFrame({'dpto': ["05", "11", "76", "91"], 'valor': [1, 2, 3, 4]}).to_parquet(source / "hogares.parquet",
+                                                                                      row_group_size=1)
+    (source / "Otros.csv").write_text("CODIGO;NOMBRE\n1;x\n")
+
+    extractor = Extractor(input_path=str(source), down_ext=['.csv', '.parquet'], output_path=str(tmp_path / "out"),
+                          sep=';', filters=[('DPTO', 'in', ['05', '11'])])
+    frames = {df['filename'].compute().iloc[0]: df.compute() for df in extractor.s4h_extract()}
+
+    assert frames["Caracteristicas.csv"]['P6040'].tolist() == ["30", "41", "62"]
+    assert frames["hogares.parquet"]['valor'].tolist() == [1, 2]
+    # Files without the filter column are kept whole
+    assert len(frames["Otros.csv"]) == 1
+
+    with pytest.raises(ValueError):
+        Extractor(input_path=str(source), filters=[('DPTO', 'like', '0%')])
+
+
+def test_optimize_dtypes_from_sample(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_text("DPTO;P6040;FEX_C18\n" + "05;30;2.5\n11;41;1.25\n" * 50)
+
+    def extract():
+        extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"), sep=';',
+                              optimize_dtypes=True, dtype_sample_rows=10, incremental=True)
+        return extractor.s4h_extract()[0]
+
+    df = extract()
+    assert df['P6040'].dtype == 'Int64'
+    assert df['FEX_C18'].dtype == 'float64'
+    assert df.compute()['DPTO'].tolist()[:2] == ["05", "11"]
+    # Reused from the manifest on the next run
+    assert extract().dtypes.to_dict() == df.dtypes.to_dict()
+
+
+def test_optimize_dtypes_beyond_the_sample(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    rows = [f"{i % 100};{i};{'AB'[i % 2]}" for i in range(1000)] + ["300;1000;C"]
+    (source / "Caracteristicas.csv").write_text("P6040;ORDEN;CLASE\n" + "\n".join(rows) + "\n")
+    extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"), sep=';',
+                          optimize_dtypes=True, dtype_sample_rows=100)
+
+    dfs = extractor.s4h_extract()
+    assert len(dfs) == 1 and dfs[0]['P6040'].dtype == 'Int64'
+    assert dfs[0]['P6040'].max().compute() == 300
+    # Categories are only known per partition, so the meta does not claim an empty set
+    assert dfs[0]['CLASE'].dtype == 'category' and not dfs[0]['CLASE'].cat.known
+    assert sorted(dfs[0]['CLASE'].cat.as_known().cat.categories) == ["A", "B", "C"]
+
+
+def test_pyarrow_text_engine(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_text("DPTO;P6040\n05;30\n11;\n")
+    (source / "PNADC_012024.txt").write_text("2024105\n")
+    _write_zip(source / "geih.zip", {"Vivienda.csv": "DPTO;P4030\n76;1\n"})
+
+    def extract(down_ext, **kwargs):
+        extractor = Extractor(input_path=str(source), down_ext=down_ext, output_path=str(tmp_path / "out"), sep=';',
+                              encoding='utf-8', text_engine='pyarrow', **kwargs)
+        return {df['filename'].compute().iloc[0]: df for df in extractor.s4h_extract()}
+
+    frames = extract(['.csv'])
+    assert frames["Caracteristicas.csv"]['DPTO'].dtype == 'string[pyarrow]'
+    assert frames["Caracteristicas.csv"].compute()['DPTO'].tolist() == ["05", "11"]
+    assert extract(['.zip', '.csv'], read_from_archive=True)["Vivienda.csv"].compute()['DPTO'].tolist() == ["76"]
+    for engine in ('dask', 'numpy'):
+        df = extract(['.txt'], is_fwf=True, colnames=['Ano', 'UF'], colspecs=[(0, 4), (5, 7)],
+                     fwf_engine=engine)["PNADC_012024.txt"]
+        assert df['UF'].dtype == 'string[pyarrow]'
+        assert df.compute()['UF'].tolist() == ["05"]
+
+
+def test_text_dialect_is_sniffed_once(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_bytes(
+        "﻿Gran Encuesta\nDPTO;NOMBRE\n05;\"Medellín; Ant\"\n11;Bogotá\n".encode('utf-8'))
+
+    def extract(**kwargs):
+        extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"),
+                              incremental=True, **kwargs)
+        return extractor, extractor.s4h_extract()[0].compute()
+
+    for engine in ('c', 'pyarrow'):
+        extractor, df = extract(text_engine=engine)
+        assert list(df.columns) == ['DPTO', 'NOMBRE', 'filename']
+        assert df['NOMBRE'].tolist() == ["Medellín; Ant", "Bogotá"]
+
+    entry = next(iter(extractor.manifest.entries.values()))
+    assert entry['dialect']['dialect'] == {'sep': ';', 'quotechar': '"', 'skiprows': 1, 'encoding': 'utf-8-sig'}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_reading_keeps_order_and_errors(tmp_path, executor) -> None:
+    import pyreadstat
+
+    source = tmp_path / "input"
+    source.mkdir()
+    for name in ("a_personas", "c_hogares"):
+        pyreadstat.write_sav(pd.DataFrame({'P207': [1.0, 2.0]}), str(source / f"{name}.sav"),
+                             variable_value_labels={'P207': {1.0: "Hombre", 2.0: "Mujer"}})
+    (source / "b_vivienda.csv").write_text("DPTO;P4030\n05;1\n")
+    (source / "d_roto.xlsx").write_bytes(b"not a workbook")
+
+    def extract():
+        extractor = Extractor(input_path=str(source), down_ext=['.sav', '.csv', '.xlsx'], sep=';',
+                              output_path=str(tmp_path / "out"), incremental=True, read_workers=4,
+                              read_executor=executor)
+        return extractor, [df['filename'].compute().iloc[0] for df in extractor.s4h_extract()]
+
+    extractor, names = extract()
+    assert names == ["a_personas.sav", "b_vivienda.csv", "c_hogares.sav"]
+    assert list(extractor.errors) == [str(source / "d_roto.xlsx")]
+    assert extractor.value_labels["c_hogares.sav"] == {'P207': {1.0: "Hombre", 2.0: "Mujer"}}
+    # Row counts recorded by the workers are saved in the manifest
+    assert sum('read' in entry for entry in extractor.manifest.entries.values()) == 3
+
+
+def test_row_counts_avoid_full_reads(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_text("DPTO;P6040\n05;30\n11;41\n")
+    (source / "Vacio.csv").write_text("DPTO;P6040\n")
+    pd.DataFrame({'DPTO': ["05", "11", "76"]}).to_parquet(source / "hogares.parquet")
+
+    def extract(count_rows):
+        extractor = Extractor(input_path=str(source), down_ext=['.csv', '.parquet'], output_path=str(tmp_path / "out"),
+                              sep=';', count_rows=count_rows)
+        return extractor.s4h_extract(), extractor.row_counts
+
+    dfs, counts = extract('probe')
+    assert len(dfs) == 2
+    assert counts[1] == 3
+    assert compute_with_row_counts(dfs, counts)[1] == [2, 3]
+    assert extract('exact')[1] == [2, 3]
+    assert len(extract('deferred')[0]) == 3
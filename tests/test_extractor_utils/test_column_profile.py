@@ -0,0 +1,47 @@
+import json
+
+import dask.dataframe as dd
+import pandas as pd
+from socio4health.utils.column_profile import combine_profiles, compute_profiles, profile_values
+
+
+def test_profiles_are_computed_in_one_pass() -> None:
+    read = []
+
+    def read_block(dpto):
+        read.append(dpto)
+        return pd.DataFrame({'DPTO': [dpto, dpto], 'P6040': [30, None], 'ID': [f"{dpto}1", f"{dpto}2"]})
+
+    meta = pd.DataFrame({'DPTO': pd.Series(dtype=object), 'P6040': pd.Series(dtype='float64'),
+                         'ID': pd.Series(dtype=object)})
+    ddf = dd.from_map(read_block, ["05", "11", "76"], meta=meta)
+    pdf = pd.DataFrame({'SEXO': pd.Series(["1", "2", None], dtype='string[pyarrow]')})
+
+    profile, small = compute_profiles([ddf, pdf], top_k=4)
+    assert sorted(read) == ["05", "11", "76"]
+    assert profile['rows'] == 6
+    assert sorted(profile['columns']['DPTO'].pop('top')) == [["05", 2], ["11", 2], ["76", 2]]
+    assert profile['columns']['DPTO'] == {'nulls': 0, 'distinct': 3, 'complete': True}
+    assert profile['columns']['P6040'] == {'nulls': 3, 'distinct': 1, 'complete': True, 'top': [[30.0, 3]],
+                                           'min': 30.0, 'max': 30.0}
+    assert not profile['columns']['ID']['complete'] and len(profile['columns']['ID']['top']) == 4
+    assert profile_values(profile['columns']['ID']) is None
+    assert sorted(profile_values(small['columns']['SEXO'])) == ["1", "2"]
+    assert profile_values(profile['columns']['P6040'], 'Int64').tolist() == [30, pd.NA]
+    assert small['columns']['SEXO']['nulls'] == 1
+    assert json.loads(json.dumps(profile)) == profile
+
+
+def test_profiles_of_stacked_frames_are_combined() -> None:
+    first, second = compute_profiles([pd.DataFrame({'UF': ["SP", "RJ"], 'IDADE': [30, 41]}),
+                                      pd.DataFrame({'UF': ["SP", "MG", "BA"]})], top_k=3)
+
+    combined = combine_profiles([first, second], top_k=3)
+
+    assert combined['rows'] == 5
+    assert combined['columns']['IDADE'] == {'nulls': 3, 'distinct': 2, 'complete': True,
+                                            'top': [[30, 1], [41, 1]], 'min': 30, 'max': 41}
+    assert combined['columns']['UF']['top'][0] == ["SP", 2]
+    # Four distinct values do not fit in the top 3
+    assert not combined['columns']['UF']['complete'] and combined['columns']['UF']['distinct'] == 3
+    assert list(combine_profiles([first, second], columns=['UF'])['columns']) == ['UF']
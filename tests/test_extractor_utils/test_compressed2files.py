@@ -0,0 +1,80 @@
+import hashlib
+import io
+import os
+import tarfile
+import zipfile
+
+import py7zr
+from socio4health.utils.extractor_utils import compressed2files, extract_archives
+
+
+def _zip_bytes(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_zip_extracts_only_matching_members(tmp_path) -> None:
+    archive = tmp_path / "survey.zip"
+    archive.write_bytes(_zip_bytes({
+        "data/persons.csv": "a,b\n1,2\n",
+        "docs/manual.pdf": "not wanted",
+        "inner.zip": _zip_bytes({"households.csv": "c\n3\n", "readme.txt": "skip"}),
+    }))
+    target = tmp_path / "out"
+
+    found = compressed2files(str(archive), str(target), ['.csv'])
+
+    prefix = hashlib.md5(str(archive).encode()).hexdigest()[:8]
+    assert os.path.join(str(target), f"{prefix}_data_persons.csv") in found
+    assert sorted(os.path.basename(p).split('_', 1)[1] for p in found) == ["data_persons.csv", "households.csv"]
+    # Neither unwanted members nor the nested archive are left behind
+    assert sorted(os.listdir(target)) == sorted(os.path.basename(p) for p in found)
+
+
+def test_nested_member_names_are_stable(tmp_path) -> None:
+    archive = tmp_path / "outer.zip"
+    archive.write_bytes(_zip_bytes({"inner.zip": _zip_bytes({"x.csv": "a\n1\n"})}))
+
+    first = compressed2files(str(archive), str(tmp_path / "a"), ['.csv'])
+    second = compressed2files(str(archive), str(tmp_path / "b"), ['.csv'])
+
+    assert [os.path.basename(p) for p in first] == [os.path.basename(p) for p in second]
+
+
+def test_tar_and_7z_members(tmp_path) -> None:
+    source = tmp_path / "src"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "table.csv").write_text("a\n1\n")
+    (source / "notes.doc").write_text("skip")
+
+    tar_path = tmp_path / "data.tar.gz"
+    with tarfile.open(tar_path, 'w:gz') as tf:
+        tf.add(source, arcname="src")
+    seven_path = tmp_path / "data.7z"
+    with py7zr.SevenZipFile(seven_path, 'w') as zf:
+        zf.writeall(source, arcname="src")
+
+    for archive in (tar_path, seven_path):
+        target = tmp_path / f"out_{archive.name}"
+        found = compressed2files(str(archive), str(target), ['.csv'])
+        assert [os.path.basename(p).split('_', 1)[1] for p in found] == ["src_sub_table.csv"]
+        assert open(next(iter(found))).read() == "a\n1\n"
+        assert os.listdir(target) == [os.path.basename(next(iter(found)))]
+
+
+def test_extract_archives_in_parallel_keeps_order(tmp_path) -> None:
+    jobs = []
+    for year in range(2015, 2021):
+        archive = tmp_path / f"enaho_{year}.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr(f"modulo_{year}.csv", f"anio\n{year}\n")
+        jobs.append(dict(input_archive=str(archive), target_directory=str(tmp_path / str(year)), down_ext=['.csv']))
+
+    parallel = extract_archives(jobs, max_workers=3)
+
+    assert [os.path.basename(files[0]).split('_', 1)[1] for files in parallel] == \
+        [f"modulo_{year}.csv" for year in range(2015, 2021)]
+    assert parallel == extract_archives(jobs, max_workers=1)
@@ -0,0 +1,30 @@
+import pandas as pd
+from socio4health.utils.csv_reader import csv_layout, read_csv_block
+
+
+def test_blocks_keep_codes_as_arrow_strings(tmp_path) -> None:
+    path = tmp_path / "Caracteristicas.csv"
+    path.write_bytes(("DPTO;P6040;FEX_C18;NOMBRE\n" + "".join(f"{dpto:02d};{dpto + 20};{dpto / 4};São\n"
+                                                               for dpto in range(1, 40)) + "99;;;\n").encode('latin1'))
+
+    blocks, names = csv_layout(str(path), sep=';', encoding='latin1', blocksize=100)
+    df = pd.concat([read_csv_block(str(path), start, end, names, sep=';', encoding='latin1',
+                                   dtype={'FEX_C18': 'float64'}) for start, end in blocks], ignore_index=True)
+
+    assert len(blocks) > 1
+    assert names == ['DPTO', 'P6040', 'FEX_C18', 'NOMBRE']
+    assert df['DPTO'].dtype == 'string[pyarrow]'
+    assert df['DPTO'].tolist()[:3] == ["01", "02", "03"]
+    assert df['NOMBRE'].iloc[0] == "São"
+    assert df['FEX_C18'].dtype == 'float64'
+    assert df.iloc[-1].isna().tolist() == [False, True, True, True]
+
+
+def test_bad_lines_are_skipped(tmp_path) -> None:
+    path = tmp_path / "Vivienda.csv"
+    path.write_text("A,B\n1,2\n3\n4,5\n")
+
+    blocks, names = csv_layout(str(path))
+    df = read_csv_block(str(path), *blocks[0], names, usecols=['B'], on_bad_lines='skip')
+
+    assert df['B'].tolist() == ["2", "5"]
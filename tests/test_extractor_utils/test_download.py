@@ -0,0 +1,51 @@
+import functools
+from http.server import SimpleHTTPRequestHandler
+
+import pytest
+from socio4health.utils.extractor_utils import download_files
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_dir(tmp_path, http_server):
+    """Serve a temporary directory over HTTP as a stand-in for a statistics office server."""
+    served = tmp_path / "served"
+    served.mkdir()
+    return served, http_server(functools.partial(_QuietHandler, directory=str(served)))
+
+
+def test_download_files_concurrently(http_dir, tmp_path) -> None:
+    served, base_url = http_dir
+    links = {}
+    for i in range(6):
+        (served / f"file_{i}.csv").write_bytes(b"a,b\n" + str(i).encode() * 5000)
+        links[f"file_{i}.csv"] = f"{base_url}/file_{i}.csv"
+    out = tmp_path / "out"
+    out.mkdir()
+
+    downloaded, failed = download_files(links, str(out), max_workers=3, max_per_host=2)
+
+    assert failed == []
+    assert [p.split("/")[-1] for p in downloaded] == list(links)
+    for name in links:
+        assert (out / name).read_bytes() == (served / name).read_bytes()
+
+
+def test_download_files_reports_failures(http_dir, tmp_path) -> None:
+    served, base_url = http_dir
+    (served / "ok.csv").write_bytes(b"a\n1\n")
+    links = {"ok.csv": f"{base_url}/ok.csv", "missing.csv": f"{base_url}/missing.csv"}
+
+    downloaded, failed = download_files(links, str(tmp_path), max_workers=2)
+
+    assert len(downloaded) == 1
+    assert [name for name, _ in failed] == ["missing.csv"]
+
+
+def test_download_files_rejects_invalid_limits(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        download_files({}, str(tmp_path), max_workers=0)
@@ -0,0 +1,111 @@
+import hashlib
+import os
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from socio4health.utils.download_cache import DownloadCache
+from socio4health.utils.extractor_utils import download_request
+
+PAYLOAD = b"year,value\n" + b"2024,1\n" * 1000
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    etag = '"abc"'
+    statuses = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == self.etag:
+            type(self).statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        type(self).statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+
+@pytest.fixture
+def server(http_server):
+    _ETagHandler.statuses = []
+    return http_server(_ETagHandler)
+
+
+def test_unchanged_file_is_served_from_cache(server, tmp_path) -> None:
+    cache = DownloadCache(str(tmp_path / "cache"))
+    first_run, second_run = tmp_path / "run1", tmp_path / "run2"
+    first_run.mkdir()
+    second_run.mkdir()
+
+    download_request(f"{server}/a.csv", "a.csv", str(first_run), cache=cache)
+    path = download_request(f"{server}/a.csv", "a.csv", str(second_run), cache=cache)
+
+    assert _ETagHandler.statuses == [200, 304]
+    assert open(path, 'rb').read() == PAYLOAD
+    # The index is persisted, so a new cache instance also revalidates
+    assert DownloadCache(str(tmp_path / "cache")).conditional_headers(f"{server}/a.csv") == {'If-None-Match': '"abc"'}
+
+
+@pytest.mark.parametrize("stale", ["corrupted", "evicted"])
+def test_stale_cached_copy_is_downloaded_again(server, tmp_path, stale) -> None:
+    cache = DownloadCache(str(tmp_path / "cache"))
+    first_run, second_run = tmp_path / "run1", tmp_path / "run2"
+    first_run.mkdir()
+    second_run.mkdir()
+    download_request(f"{server}/a.csv", "a.csv", str(first_run), cache=cache)
+    blob = cache._blob_path(hashlib.sha256(PAYLOAD).hexdigest())
+    os.remove(first_run / "a.csv")
+    if stale == "corrupted":
+        with open(blob, 'wb') as file:
+            file.write(b"truncated")
+    else:
+        os.remove(blob)
+
+    checksum = f"sha256:{hashlib.sha256(PAYLOAD).hexdigest()}"
+    path = download_request(f"{server}/a.csv", "a.csv", str(second_run), checksum=checksum, cache=cache)
+
+    assert _ETagHandler.statuses == [200, 304, 200]
+    assert open(path, 'rb').read() == PAYLOAD
+    assert open(blob, 'rb').read() == PAYLOAD
+
+
+def test_caches_sharing_a_folder_keep_each_other_entries(tmp_path) -> None:
+    first, second = DownloadCache(str(tmp_path / "cache")), DownloadCache(str(tmp_path / "cache"))
+    for cache, name in ((first, "a"), (second, "b")):
+        source = tmp_path / name
+        source.write_bytes(name.encode() * 10)
+        cache.store(f"http://example.org/{name}", str(source), etag=name)
+
+    reloaded = DownloadCache(str(tmp_path / "cache"))
+    assert reloaded.conditional_headers("http://example.org/a") == {'If-None-Match': 'a'}
+    assert reloaded.conditional_headers("http://example.org/b") == {'If-None-Match': 'b'}
+    assert not os.path.exists(tmp_path / "cache" / "index.json.lock")
+
+
+def test_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = DownloadCache(str(tmp_path / "cache"), max_size=250)
+    for name in ("old", "mid", "new"):
+        source = tmp_path / name
+        source.write_bytes(name.encode() * 40)
+        cache.store(f"http://example.org/{name}", str(source), etag=name)
+
+    assert cache.size() <= 250
+    assert cache.conditional_headers("http://example.org/old") == {}
+    assert cache.conditional_headers("http://example.org/new") == {'If-None-Match': 'new'}
+
+
+def test_identical_content_is_stored_once(tmp_path) -> None:
+    cache = DownloadCache(str(tmp_path / "cache"))
+    source = tmp_path / "data.zip"
+    source.write_bytes(b"x" * 100)
+
+    first = cache.store("http://mirror-a.org/data.zip", str(source))
+    second = cache.store("http://mirror-b.org/data.zip", str(source))
+
+    assert first == second
+    assert cache.size() == 100
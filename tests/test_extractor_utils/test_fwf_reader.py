@@ -0,0 +1,74 @@
+import mmap
+
+import pandas as pd
+import pytest
+from socio4health.utils.extractor_utils import line_blocks, s4h_fwf_dtypes
+from socio4health.utils.fwf_reader import read_fwf_block
+
+COLSPECS = [(0, 4), (4, 5), (5, 7), (7, 10), (10, 13)]
+NAMES = ['Ano', 'Trimestre', 'UF', 'V2009', 'V1022']
+
+
+def test_blocks_match_pandas_read_fwf(tmp_path) -> None:
+    path = tmp_path / "PNADC_012024.txt"
+    path.write_bytes("".join(f"20241{uf:02d}{age:3d}{'São'[:age % 4]:<3}\r\n"
+                             for uf, age in zip(range(11, 53), range(40))).encode('latin1'))
+
+    blocks = line_blocks(str(path), 100)
+    df = pd.concat([read_fwf_block(str(path), start, end, COLSPECS, NAMES, dtypes={'V2009': 'Int64'})
+                    for start, end in blocks], ignore_index=True)
+
+    expected = pd.read_fwf(path, colspecs=COLSPECS, names=NAMES, dtype=object, encoding='latin1')
+    assert len(blocks) > 1
+    assert df['V2009'].dtype == 'Int64'
+    assert df['V2009'].tolist() == list(range(40))
+    for name in ['Ano', 'UF', 'V1022']:
+        assert df[name].fillna('').tolist() == expected[name].fillna('').tolist()
+
+
+def test_short_lines_and_codes_become_missing(tmp_path) -> None:
+    path = tmp_path / "PNAD.txt"
+    path.write_bytes(b"2024111 12\n2024\n\n20242 . 4\n")
+
+    df = read_fwf_block(str(path), 0, path.stat().st_size, COLSPECS, NAMES, dtypes={'UF': 'Int64', 'V2009': 'float64'},
+                        usecols=['Ano', 'UF', 'V2009'])
+
+    assert list(df.columns) == ['Ano', 'UF', 'V2009']
+    assert df['Ano'].tolist() == ["2024"] * 3
+    assert df['UF'].isna().tolist() == [False, True, True]
+    assert df['V2009'].tolist()[0::2] == [12.0, 4.0]
+
+
+def test_fwf_dtypes_from_dictionary() -> None:
+    dic = pd.DataFrame({'variable_name': ['UF', 'V2009', 'V1028', 'V2001'],
+                        'data_type': ['char', 'int', 'Numeric', None]})
+
+    assert s4h_fwf_dtypes(dic) == {'UF': 'object', 'V2009': 'Int64', 'V1028': 'float64'}
+
+
+def test_large_integers_are_parsed_exactly(tmp_path) -> None:
+    path = tmp_path / "ENAHO.txt"
+    path.write_bytes(b"12345678901234567\n                 \n")
+
+    df = read_fwf_block(str(path), 0, path.stat().st_size, [(0, 17)], ['CONGLOME'], dtypes={'CONGLOME': 'Int64'})
+
+    assert df['CONGLOME'].dtype == 'Int64'
+    assert df['CONGLOME'].tolist()[0] == 12345678901234567
+    assert df['CONGLOME'].isna().tolist() == [False, True]
+
+
+def test_map_is_closed_when_a_column_fails(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "PNAD.txt"
+    path.write_bytes(b"12a\n")
+    closed = []
+
+    class TrackedMap(mmap.mmap):
+        def close(self):
+            super().close()
+            closed.append(True)
+
+    monkeypatch.setattr(mmap, 'mmap', TrackedMap)
+    with pytest.raises(ValueError):
+        read_fwf_block(str(path), 0, path.stat().st_size, [(0, 3)], ['UF'], dtypes={'UF': 'int8'})
+
+    assert closed == [True]
@@ -0,0 +1,53 @@
+import json
+
+import pandas as pd
+from socio4health.utils import json_reader
+from socio4health.utils.json_reader import json_layout, read_json_block
+
+RECORDS = [{"CODIGO": f"{i:05d}", "VALOR": 1000000 + i, "ETIQUETA": "Bogotá"} for i in range(40)]
+
+
+def _read_all(path, blocks, columns, lines):
+    return pd.concat([read_json_block(str(path), start, end, lines=lines, columns=columns) for start, end in blocks])
+
+
+def test_record_path_is_scanned_with_a_small_buffer(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(json_reader, "_READ_SIZE", 16)
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps({"meta": {"total": 40, "note": "]}"}, "result": {"records": RECORDS}}), encoding='utf-8')
+
+    blocks, columns, lines = json_layout(str(path), record_path="result.records", blocksize=256)
+
+    assert not lines
+    assert len(blocks) > 1
+    assert columns == ["CODIGO", "VALOR", "ETIQUETA"]
+    df = _read_all(path, blocks, columns, lines)
+    assert df.to_dict('records') == RECORDS
+
+
+def test_line_delimited_blocks_end_at_line_breaks(tmp_path) -> None:
+    path = tmp_path / "export.json"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n", encoding='utf-8')
+
+    blocks, columns, lines = json_layout(str(path), blocksize=300)
+
+    assert lines
+    assert len(blocks) > 1
+    assert blocks[-1][1] == path.stat().st_size
+    assert _read_all(path, blocks, columns, lines).to_dict('records') == RECORDS
+
+
+def test_non_ascii_keys_are_decoded_with_the_file_encoding(tmp_path) -> None:
+    records = [{"AÑO": 2024, "DEPARTAMENTO": "Bogotá"}, {"AÑO": 2025, "DEPARTAMENTO": "Nariño"}]
+    for lines in (True, False):
+        path = tmp_path / "export.json"
+        text = "\n".join(json.dumps(r, ensure_ascii=False) for r in records) if lines else \
+            json.dumps({"datos": records}, ensure_ascii=False)
+        path.write_text(text, encoding='utf-8')
+
+        blocks, columns, found_lines = json_layout(str(path), record_path=None if lines else "datos",
+                                                   encoding='utf-8')
+
+        assert found_lines == lines
+        assert columns == ["AÑO", "DEPARTAMENTO"]
+        assert _read_all(path, blocks, columns, lines).to_dict('records') == records
@@ -0,0 +1,77 @@
+import hashlib
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from socio4health.utils.extractor_utils import download_request
+
+PAYLOAD = bytes(range(256)) * 400
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Minimal server honouring ``Range``/``If-Range`` requests for a single resource."""
+    etag = '"v1"'
+    ranges = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        start = 0
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        type(self).ranges.append(range_header)
+        if range_header and (if_range is None or if_range == self.etag):
+            start = int(range_header.split('=')[1].split('-')[0])
+        body = PAYLOAD[start:]
+        self.send_response(206 if start else 200)
+        if start:
+            self.send_header('Content-Range', f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server(http_server):
+    _RangeHandler.ranges = []
+    _RangeHandler.etag = '"v1"'
+    return f"{http_server(_RangeHandler)}/data.zip"
+
+
+def _leave_partial(tmp_path, size, etag='"v1"'):
+    (tmp_path / "data.zip.part").write_bytes(PAYLOAD[:size])
+    meta = {'etag': etag, 'last_modified': None, 'total': len(PAYLOAD)}
+    (tmp_path / "data.zip.part.json").write_text(json.dumps(meta))
+
+
+def test_download_resumes_from_partial_file(server, tmp_path) -> None:
+    _leave_partial(tmp_path, 30000)
+
+    path = download_request(server, "data.zip", str(tmp_path), chunk_size=4096)
+
+    assert path == str(tmp_path / "data.zip")
+    assert (tmp_path / "data.zip").read_bytes() == PAYLOAD
+    assert _RangeHandler.ranges == ["bytes=30000-"]
+    assert not (tmp_path / "data.zip.part").exists()
+    assert not (tmp_path / "data.zip.part.json").exists()
+
+
+def test_download_restarts_when_remote_file_changed(server, tmp_path) -> None:
+    _leave_partial(tmp_path, 30000, etag='"v0"')
+
+    path = download_request(server, "data.zip", str(tmp_path))
+
+    assert path is not None
+    assert (tmp_path / "data.zip").read_bytes() == PAYLOAD
+
+
+def test_download_verifies_checksum(server, tmp_path) -> None:
+    good = "sha256:" + hashlib.sha256(PAYLOAD).hexdigest()
+    assert download_request(server, "data.zip", str(tmp_path), checksum=good) is not None
+
+    bad = "md5:" + "0" * 32
+    assert download_request(server, "other.zip", str(tmp_path), checksum=bad) is None
+    assert not (tmp_path / "other.zip").exists()
+    assert not (tmp_path / "other.zip.part").exists()
@@ -0,0 +1,36 @@
+import dask.dataframe as dd
+import pandas as pd
+from socio4health.utils.row_counts import has_rows, parquet_row_count, compute_with_row_counts
+
+
+def test_has_rows_stops_at_first_partition() -> None:
+    read = []
+
+    def read_block(dpto):
+        read.append(dpto)
+        return pd.DataFrame({'DPTO': [dpto]})
+
+    ddf = dd.from_map(read_block, ["05", "11", "76", "91"], meta=pd.DataFrame({'DPTO': pd.Series(dtype=object)}))
+
+    assert has_rows(ddf)
+    assert read == ["05"]
+    assert not has_rows(ddf[ddf['DPTO'] == "00"])
+    assert has_rows(pd.DataFrame({'A': [1]}))
+
+
+def test_parquet_count_and_deferred_counts(tmp_path) -> None:
+    pd.DataFrame({'DPTO': ["05", "11", "76"]}).to_parquet(tmp_path / "hogares.parquet", row_group_size=1)
+    ddf = dd.read_parquet(tmp_path / "hogares.parquet")
+    selected = ddf[ddf['DPTO'] != "05"]
+
+    assert parquet_row_count(str(tmp_path / "hogares.parquet")) == 3
+    frames, counts = compute_with_row_counts([ddf, selected], [3, selected.shape[0]])
+    assert counts == [3, 2]
+    assert frames[1]['DPTO'].tolist() == ["11", "76"]
+
+
+def test_has_rows_probes_later_partitions_in_batches() -> None:
+    ddf = dd.from_pandas(pd.DataFrame({'ORDEN': range(200)}), npartitions=50)
+
+    assert has_rows(ddf[ddf['ORDEN'] >= 190])
+    assert not has_rows(ddf[ddf['ORDEN'] < 0])
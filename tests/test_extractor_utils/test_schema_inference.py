@@ -0,0 +1,44 @@
+import pandas as pd
+from socio4health.utils.schema_inference import infer_dtypes, apply_dtypes
+
+
+def test_infer_compact_dtypes() -> None:
+    sample = pd.DataFrame({
+        'P6040': ["30", "41", None, "18"],
+        'DPTO': ["05", "11", "76", "05"],
+        'FEX_C18': ["2.5", "120.25", "3", ""],
+        'DIRECTORIO': ["7000001", "7000002", "7000003", "7000004"],
+        'CLASE': ["1", "1", "2", "1"],
+        'NOMBRE': ["Ana", "Luis", "Ana", "Eva"],
+        'ORDEN': [1, 2, 3, 4],
+        'PESO': [1.5, 2.0, 0.1, 4.0],
+    })
+
+    dtypes = infer_dtypes(sample, category_ratio=0.5)
+
+    # Not narrowed to the sampled range
+    assert dtypes['P6040'] == 'Int64'
+    assert dtypes['FEX_C18'] == 'float64'
+    assert dtypes['DIRECTORIO'] == 'Int64'
+    assert dtypes['CLASE'] == 'Int64'
+    # Numeric columns keep their type
+    assert 'ORDEN' not in dtypes and 'PESO' not in dtypes
+    # Leading zeros are kept as text
+    assert dtypes['DPTO'] == 'string[pyarrow]'
+    assert infer_dtypes(sample[['NOMBRE']], category_ratio=0.75) == {'NOMBRE': 'category'}
+
+
+def test_apply_dtypes_checks_values(caplog) -> None:
+    df = pd.DataFrame({'P6040': ["30", " ", None, "300"], 'DPTO': ["05", "11", "76", "05"],
+                       'DIRECTORIO': ["9007199254740993", "X", "2.5", "7"]})
+
+    converted = apply_dtypes(df, {'P6040': 'Int64', 'DPTO': 'category', 'DIRECTORIO': 'Int64', 'OTHER': 'Int64'})
+
+    assert converted['P6040'].dtype == 'Int64'
+    assert converted['P6040'].tolist()[::3] == [30, 300]
+    assert converted['P6040'].isna().tolist() == [False, True, True, False]
+    assert converted['DPTO'].tolist() == ["05", "11", "76", "05"]
+    # Values that are not integers become missing instead of failing the whole file
+    assert converted['DIRECTORIO'].tolist()[0] == 9007199254740993
+    assert converted['DIRECTORIO'].isna().tolist() == [False, True, True, False]
+    assert "2 values do not fit" in caplog.text
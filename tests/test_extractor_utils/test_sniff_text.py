@@ -0,0 +1,28 @@
+from socio4health.utils.extractor_utils import sniff_text
+
+
+def test_sniff_bom_and_delimiter() -> None:
+    dialect = sniff_text(b'\xef\xbb\xbfDPTO;P6040\n05;30\n11;41\n')
+
+    assert dialect.sep == ';'
+    assert dialect.encoding == 'utf-8-sig'
+    assert dialect.skiprows == 0
+
+
+def test_sniff_title_lines_and_quotes() -> None:
+    head = 'Encuesta 2024\n\nDPTO,NOMBRE,X\n05,"Medellín, Ant",1\n11,Bogotá,2\n'
+
+    assert sniff_text(head.encode('latin1'), sep=';') == (',', '"', 2, 'latin1')
+    assert sniff_text(head.encode('utf-8')).encoding == 'utf-8'
+
+
+def test_sniff_falls_back_to_default_sep() -> None:
+    assert sniff_text(b'CODIGO\n1\n2\n', default_sep='\t').sep == '\t'
+    assert sniff_text(b'A|B\n1|2\n', sep='|').sep == '|'
+
+
+def test_sniff_keeps_header_before_trailing_delimiters() -> None:
+    assert sniff_text(b'EDAD;SEXO;DPTO\n31;1;05;\n40;2;11;\n').skiprows == 0
+    assert sniff_text(b'EDAD;SEXO;DPTO;\n31;1;05\n40;2;11\n').skiprows == 0
+    # Rows with missing trailing values do not make the header a title
+    assert sniff_text(b'EDAD;SEXO;DPTO\n31;1;\n40;2;\n').skiprows == 0
@@ -4,6 +4,12 @@ import numpy as np
 import sys
 import os
 
+import dask.dataframe as dd
+import pytest
+from dask.callbacks import Callback
+from socio4health import Extractor, Harmonizer
+from socio4health.utils.row_counts import compute_with_row_counts
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
@@ -254,5 +260,143 @@ class TestDataFrameOperations(unittest.TestCase):
         self.assertIn('NO_NAN', result.columns)
 
 
+def test_selector_keeps_deferred_row_counts(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "Caracteristicas.csv").write_text("DPTO;P6040\n05;30\n11;41\n")
+    pd.DataFrame({'DPTO': ["05", "11", "76"]}).to_parquet(source / "hogares.parquet")
+    dfs = Extractor(input_path=str(source), down_ext=['.csv', '.parquet'], output_path=str(tmp_path / "out"),
+                    sep=';', count_rows='probe').s4h_extract()
+
+    dic = pd.DataFrame({'variable_name': ['P6040'], 'category': ['Demographic']})
+    harmonizer = Harmonizer(dict_df=dic, categories=['Demographic'], key_col='DPTO', key_val=['76'],
+                            deferred_stats=True)
+    selected = harmonizer.s4h_data_selector(dfs)
+    assert compute_with_row_counts(selected, harmonizer.row_counts)[1] == [0, 1]
+
+
+def test_nan_columns_are_profiled_in_one_pass(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "personas.csv").write_text("DPTO;P6040;P6090\n05;30;\n11;;\n76;25;\n")
+    (source / "hogares.csv").write_text("DPTO;P5090\n;1\n;2\n")
+    extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"), sep=';',
+                          count_rows='exact')
+    dfs = extractor.s4h_extract()
+
+    harmonizer = Harmonizer(nan_threshold=0.5)
+    exact = harmonizer.s4h_drop_nan_columns(dfs, extractor.row_counts)
+    assert [list(df.columns) for df in exact] == [['P5090', 'FILENAME'], ['DPTO', 'P6040', 'FILENAME']]
+    assert list(harmonizer.s4h_drop_nan_columns(dfs[1]).columns) == ['DPTO', 'P6040', 'FILENAME']
+    harmonizer.sample_frac = 1.0
+    assert [list(df.columns) for df in harmonizer.s4h_drop_nan_columns(dfs)] == [['P5090', 'FILENAME'], ['DPTO', 'P6040', 'FILENAME']]
+    with pytest.raises(ValueError):
+        harmonizer.s4h_drop_nan_columns(dfs, [3])
+
+
+def test_profiles_are_reused_by_the_harmonizer(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "personas.csv").write_text("DPTO;SEXO;EDAD\n05;1;\n11;2;\n76;1;30\n")
+
+    def extract():
+        extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"),
+                              sep=';', profile_columns=True, incremental=True)
+        return extractor, extractor.s4h_extract()
+
+    extractor, dfs = extract()
+    assert extractor.row_counts == [3]
+    assert extractor.profiles[dfs[0]._name]['columns']['EDAD']['nulls'] == 2
+
+    harmonizer = Harmonizer(nan_threshold=0.5, strict_mapping=True, profiles=extractor.profiles,
+                            column_mapping={'CO': {'DPTO': 'dpto', 'SEXO': 'sex', 'EDAD': 'age',
+                                                   'FILENAME': 'filename'}},
+                            value_mappings={'CO': {'sex': {'1': 'M'}}})
+    # Profiled frames are not computed again
+    tasks = []
+    with Callback(pretask=lambda key, dsk, state: tasks.append(key)):
+        assert list(harmonizer.drop_nan_columns(dfs)[0].columns) == ['DPTO', 'SEXO', 'FILENAME']
+        with pytest.raises(ValueError, match="Unmapped values"):
+            harmonizer.s4h_harmonize_dataframes({'CO': dfs})
+    assert tasks == []
+
+    extractor, dfs = extract()
+    assert extractor.manifest.get(str(source / "personas.csv"), 'profile') is not None
+    assert extractor.profiles[dfs[0]._name]['rows'] == 3
+
+
+def test_vertical_merge_groups_by_signature() -> None:
+    def frame(**dtypes):
+        return dd.from_pandas(pd.DataFrame({col: pd.Series([1], dtype=dtype) for col, dtype in dtypes.items()}),
+                              npartitions=1)
+
+    ddfs = [frame(dpto='int64', p6040='int64'), frame(DPTO='int64', P6040='int64'),
+            frame(DPTO='int64', P6040='int64', P6090='float64'), frame(DPTO='int64', P6090='int64'),
+            frame(MES='int64')]
+    merged = Harmonizer().s4h_vertical_merge(ddfs, overlap_threshold=0.5)
+    # P6090 joined the first group as float64, so the frame with an integer P6090 starts its own
+    assert [len(df) for df in merged] == [3, 1, 1]
+
+
+def test_union_merge_adds_typed_missing_columns() -> None:
+    personas = dd.from_pandas(pd.DataFrame({'DPTO': ["05", "11"], 'P6040': [30, 41], 'P6090': [True, False]}),
+                              npartitions=2)
+    hogares = dd.from_pandas(pd.DataFrame({'DPTO': ["76"], 'P5090': ["1"]}), npartitions=1)
+    merged = Harmonizer().s4h_vertical_merge([personas, hogares], overlap_threshold=0.5)[0]
+
+    assert list(merged.columns) == ['DPTO', 'P6040', 'P6090', 'P5090']
+    result = merged.compute()
+    assert str(result['P6040'].dtype) == 'Int64' and str(result['P6090'].dtype) == 'boolean'
+    assert pd.api.types.is_string_dtype(result['P5090'])
+    assert result['P6040'].isna().tolist() == [False, False, True]
+    # The input frames are left untouched
+    assert list(personas.columns) == ['DPTO', 'P6040', 'P6090']
+
+
+def test_row_counts_of_merged_frames_add_up(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "personas_2023.csv").write_text("DPTO;EDAD\n05;\n11;\n")
+    (source / "personas_2024.csv").write_text("DPTO;EDAD\n76;30\n")
+    (source / "hogares.csv").write_text("VIVIENDA\n1\n")
+    extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"), sep=';',
+                          count_rows='exact')
+    dfs = extractor.s4h_extract()
+    counts = dict(zip((df._name for df in dfs), extractor.row_counts))
+
+    harmonizer = Harmonizer(nan_threshold=0.7)
+    merged = harmonizer.s4h_vertical_merge(dfs, overlap_threshold=1)
+    assert len(merged) == 2
+    with pytest.raises(ValueError):
+        harmonizer.drop_nan_columns(merged, extractor.row_counts)
+    assert sorted(harmonizer._merged_rows(df._name, counts) for df in merged) == [1, 3]
+    # EDAD is missing in 2 of the 3 merged rows, below the threshold
+    result = harmonizer.drop_nan_columns(merged, counts)
+    assert sorted(list(df.columns) for df in result) == [['DPTO', 'EDAD', 'FILENAME'], ['VIVIENDA', 'FILENAME']]
+
+
+def test_profiles_follow_merged_frames(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "personas_2023.csv").write_text("DPTO;SEXO;EDAD\n05;1;\n11;2;\n")
+    (source / "personas_2024.csv").write_text("DPTO;SEXO\n76;1\n")
+    extractor = Extractor(input_path=str(source), down_ext=['.csv'], output_path=str(tmp_path / "out"), sep=';',
+                          profile_columns=True)
+    dfs = extractor.s4h_extract()
+
+    harmonizer = Harmonizer(nan_threshold=0.5, profiles=extractor.profiles)
+    merged = harmonizer.s4h_vertical_merge(dfs, overlap_threshold=0.5)
+    assert len(merged) == 1
+    profile = harmonizer.profiles[merged[0]._name]
+    assert profile['rows'] == 3 and profile['columns']['EDAD']['nulls'] == 3
+    assert sorted(profile['columns']['DPTO']['top']) == [["05", 1], ["11", 1], ["76", 1]]
+    # Merging does not read the files, and neither does dropping the NaN columns of the merged frame
+    tasks = []
+    with Callback(pretask=lambda key, dsk, state: tasks.append(key)):
+        assert list(harmonizer.drop_nan_columns(merged)[0].columns) == ['DPTO', 'SEXO', 'FILENAME']
+    assert tasks == []
+    assert merged[0]._name not in extractor.profiles
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file